@@ -3,6 +3,7 @@ from dotenv import load_dotenv
 import requests
 from src.Json2VideoSDK.src.Movie import Movie
 from src.PexelsStockMedia import PexelsStockMedia
+from src.MediaDownloader import MediaDownloader
 from src.Json2VideoSDK.Client import Client as Json2VideoClient
 from src.Json2VideoSDK.src.Audio import Audio
 from src.Json2VideoSDK.src.Audiogram import Audiogram
@@ -10,6 +11,7 @@ from src.Json2VideoSDK.src.Component import Component
 from src.Json2VideoSDK.src.HTML import HTML
 from src.Json2VideoSDK.src.Image import Image
 from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Schema import schema_prompt
 from src.Json2VideoSDK.src.Subtitles import Subtitles
 from src.Json2VideoSDK.src.Text import Text
 from src.Json2VideoSDK.src.Video import Video
@@ -56,6 +58,7 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 json2VideoClient = Json2VideoClient(JSON2VIDEO_API_KEY)
 stockMedia = PexelsStockMedia(PEXELS_API_KEY)
 gemini = GeminiApi(GEMINI_API_KEY)
+downloader = MediaDownloader()
 # taskName = "Jesteś kreatywnym asystentem AI, który pomaga w tworzeniu filmów."
 # task1 = {
 #     "task": taskName,
@@ -110,17 +113,32 @@ print(movieScenario)
 
 
 # videos = stockMedia.search_videos(data1["movies_key_words"], per_page=10)
+# video_links = {
+#     _video.id: stockMedia.select_video_file(_video, width=640, height=360).link
+#     for _video in videos.videos
+# }
+# video_paths = downloader.download_many(video_links.values())
 # for _video in videos.videos:
-#     video_path = _video.video_files[0].link.split("/")[-1]
-#     with open(video_path, "wb") as f:
-#         f.write(requests.get(_video.video_files[0].link).content)
+#     video_path = video_paths[video_links[_video.id]]
 #     video_file = gemini.send_file(GEMINI_API_KEY, video_path)
 
 #     movieScenario["videos"].append(
-#         {"name": video_file.name, "url": _video.video_files[0].link}
+#         {"name": video_file.name, "url": video_links[_video.id]}
 #     )
 
 
+# scenario_element_types = {
+#     "images": "image",
+#     "videos": "video",
+#     "audios": "audio",
+#     "voiceText": "voice",
+#     "displayText": "text",
+# }
+# schema_json, schema_tokens = schema_prompt(
+#     [t for key, t in scenario_element_types.items() if movieScenario[key]],
+#     count_tokens=lambda text: gemini.model.count_tokens(text).total_tokens,
+# )
+# print(f"Schema tokens: {schema_tokens['before']} -> {schema_tokens['after']}")
 # task3 = {
 #     "task": taskName,
 #     "step": {
@@ -129,7 +147,7 @@ print(movieScenario)
 #     },
 #     "movieScenario": movieScenario,
 #
-#     "schema_to_generate_JSON": yaml_do_json("src\Json2VideoSDK\schema.yaml"),
+#     "schema_to_generate_JSON": schema_json,
 #     "response_in_JSON_schema": {
 #         "schemaVideo": "[generated json]",
 #         "comments": "comment from AI",
@@ -0,0 +1,155 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "video-app")
+
+_MISSING = object()
+
+
+class DiskCache:
+    """
+    A persistent key-value cache in a SQLite file, with TTL and LRU eviction.
+
+    Values are pickled. The cache is bounded by entry count and/or total size in
+    bytes; when a bound is exceeded the least recently used entries are evicted.
+    Expired entries are dropped when they are read or evicted. Safe to share
+    between threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = None,
+        max_entries: int = None,
+        max_bytes: int = None,
+    ):
+        """
+        Initializes a DiskCache object.
+
+        Args:
+            path (str): Path of the SQLite file. Parent directories are created.
+            ttl (float): Default time to live of an entry in seconds. None keeps entries forever. Defaults to None.
+            max_entries (int): Maximum number of entries. Defaults to None (unbounded).
+            max_bytes (int): Maximum total size of the pickled values. Defaults to None (unbounded).
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB, size INTEGER, "
+            "expires REAL, accessed REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache(accessed)")
+        self._db.commit()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the value stored under key, or default if it is missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._db.commit()
+                self.misses += 1
+                return default
+            self._db.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float = _MISSING):
+        """
+        Stores value under key.
+
+        Args:
+            key (str): The cache key.
+            value (Any): A picklable value.
+            ttl (float): Time to live in seconds, overriding the cache default. None keeps it forever.
+        """
+        ttl = self.ttl if ttl is _MISSING else ttl
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        with self._lock:
+            self._db.execute(
+                "REPLACE INTO cache (key, value, size, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), expires, now),
+            )
+            self._evict(now)
+            self._db.commit()
+
+    def get_or_set(
+        self, key: str, factory: Callable[[], Any], ttl: float = _MISSING
+    ) -> Any:
+        """Returns the cached value of key, calling factory and storing its result on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def delete(self, key: str):
+        """Removes key from the cache."""
+        with self._lock:
+            self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self):
+        """Removes every entry and resets the hit/miss counters."""
+        with self._lock:
+            self._db.execute("DELETE FROM cache")
+            self._db.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self, now: float):
+        self._db.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+        if self.max_entries is not None:
+            self._db.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            total = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()[0]
+            rows = self._db.execute(
+                "SELECT key, size FROM cache ORDER BY accessed"
+            ).fetchall()
+            evicted = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((key,))
+                total -= size
+            self._db.executemany("DELETE FROM cache WHERE key = ?", evicted)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    @property
+    def stats(self) -> dict:
+        """Hit and miss counters of this process."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        """Closes the SQLite connection."""
+        with self._lock:
+            self._db.close()
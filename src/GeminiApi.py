@@ -1,26 +1,295 @@
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+import hashlib
 import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 import time
 
+from .DiskCache import DEFAULT_CACHE_DIR, DiskCache
+from .StructuredOutput import (
+    StructuredOutputError,
+    check_schema,
+    common_path,
+    extract_json,
+    get_path,
+    set_path,
+    subschema,
+)
+
+# Uploaded files are deleted by Gemini after 48 hours.
+FILE_LIFETIME = 48 * 60 * 60
+# Uploads closer than this to their expiry are uploaded again.
+EXPIRY_MARGIN = 60 * 60
+
 
 class GeminiApi:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        upload_cache: bool = True,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        prompt_cache: bool = False,
+        prompt_cache_max_bytes: int = 256 * 1024 * 1024,
+    ):
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-1.5-pro")
+        self.model_name = "gemini-1.5-pro"
+        self.model = genai.GenerativeModel(self.model_name)
+        # Maps the SHA-256 of uploaded files to their Gemini file name.
+        self.uploads = (
+            DiskCache(os.path.join(cache_dir, "gemini-uploads.sqlite3"))
+            if upload_cache
+            else None
+        )
+        # Opt-in: parsed and validated responses of earlier prompts, as JSON text,
+        # keyed by prompt_key().
+        # Hit/miss counters are available through self.prompts.stats.
+        self.prompts = (
+            DiskCache(
+                os.path.join(cache_dir, "gemini-prompts.sqlite3"),
+                max_bytes=prompt_cache_max_bytes,
+            )
+            if prompt_cache
+            else None
+        )
 
-    def send_prompt(self, prompt) -> str:
-        response = self.model.generate_content(prompt).text
+    def send_prompt(
+        self,
+        prompt,
+        use_cache: bool = True,
+        response_schema: Dict = None,
+        repair: bool = True,
+    ) -> str:
+        config = {"response_mime_type": "application/json"}
+        if response_schema is not None:
+            config["response_schema"] = response_schema
+        key = None
+        if self.prompts is not None and use_cache:
+            key = prompt_key(self.model_name, [prompt, response_schema])
+            cached = self.prompts.get(key)
+            if cached is not None:
+                try:
+                    return self._parse(cached, response_schema, repair=False)
+                except StructuredOutputError:
+                    # Written by an older version; ask the model again.
+                    self.prompts.delete(key)
+        response = self.model.generate_content(prompt, generation_config=config).text
         # print(response)
-        return json.loads(response.replace("`", "").replace("json", ""))
+        data = self._parse(response, response_schema, repair)
+        # Only responses that parsed and matched the schema are cached.
+        if key is not None:
+            self.prompts.set(key, json.dumps(data, ensure_ascii=False))
+        return data
+
+    def _parse(self, response: str, response_schema: Dict, repair: bool):
+        try:
+            data = extract_json(response)
+        except StructuredOutputError as e:
+            if not repair:
+                raise
+            return self._repair(response, response_schema, [str(e)])
+        errors = check_schema(data, response_schema) if response_schema else []
+        if not errors:
+            return data
+        if not repair:
+            raise StructuredOutputError(
+                "Response does not match the schema", response, errors
+            )
+        # Only the smallest part of the response containing every error is repaired.
+        path = common_path([error[0] for error in errors])
+        fragment = self._repair(
+            json.dumps(get_path(data, path), ensure_ascii=False),
+            subschema(response_schema, path),
+            [f"{'/'.join(map(str, p))}: {message}" for p, message in errors],
+        )
+        return set_path(data, path, fragment)
+
+    def _repair(self, fragment: str, schema: Dict, errors: List[str]):
+        # The original prompt is not resent, only the fragment that failed.
+        config = {"response_mime_type": "application/json"}
+        if schema:
+            config["response_schema"] = schema
+        prompt = json.dumps(
+            {
+                "task": "Fix the JSON fragment so that it is valid JSON and matches "
+                "the schema. Return only the corrected fragment.",
+                "errors": errors,
+                "schema": schema,
+                "fragment": fragment,
+            },
+            ensure_ascii=False,
+        )
+        response = self.model.generate_content(prompt, generation_config=config).text
+        data = extract_json(response)
+        errors = check_schema(data, schema) if schema else []
+        if errors:
+            raise StructuredOutputError(
+                "Repaired response does not match the schema", response, errors
+            )
+        return data
 
     def send_file(self, api_key, file_path: str) -> str:
-        video_file = genai.upload_file(path=file_path)
+        video_file, key = self._upload(file_path)
+        video_file = self._wait_active(video_file)
+        self._remember(key, video_file)
+        # print(video_file)
+        return video_file
+
+    def send_files(
+        self,
+        file_paths: Iterable[str],
+        max_workers: int = 4,
+        min_interval: float = 1,
+        max_interval: float = 10,
+        factor: float = 1.5,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Uploads several files concurrently and yields each one as soon as it is ACTIVE.
+
+        A single loop polls all files still being processed. Each file is first polled
+        after min_interval seconds, and the delay grows by factor up to max_interval.
+        Files that fail to upload or to process are printed and skipped.
+
+        Args:
+            file_paths (Iterable[str]): Paths of the files to upload.
+            max_workers (int): Maximum number of concurrent uploads. Defaults to 4.
+            min_interval (float): First delay before a file is polled, in seconds. Defaults to 1.
+            max_interval (float): Longest delay between polls of a file, in seconds. Defaults to 10.
+            factor (float): Growth factor of the delay after each poll. Defaults to 1.5.
+
+        Yields:
+            Tuple[str, File]: The path and the active Gemini file, in completion order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            uploads = {
+                executor.submit(self._upload, path): path
+                for path in dict.fromkeys(file_paths)
+            }
+            # path -> [file, cache key, poll interval, next poll]
+            pending: Dict[str, list] = {}
+            while uploads or pending:
+                now = time.monotonic()
+                for path, entry in list(pending.items()):
+                    if entry[3] > now:
+                        continue
+                    try:
+                        video_file = genai.get_file(entry[0].name)
+                    except google_exceptions.GoogleAPIError as e:
+                        print(f"Error polling {path}: {e}")
+                        del pending[path]
+                        continue
+                    if video_file.state.name == "PROCESSING":
+                        entry[0] = video_file
+                        entry[2] = min(entry[2] * factor, max_interval)
+                        entry[3] = now + entry[2]
+                        continue
+                    del pending[path]
+                    if video_file.state.name == "FAILED":
+                        print(f"Processing of {path} failed")
+                        continue
+                    self._remember(entry[1], video_file)
+                    yield path, video_file
+
+                wake = min((entry[3] for entry in pending.values()), default=None)
+                timeout = None if wake is None else max(0, wake - time.monotonic())
+                if not uploads:
+                    time.sleep(timeout or 0)
+                    continue
+                done, _ = wait(uploads, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = uploads.pop(future)
+                    try:
+                        video_file, key = future.result()
+                    except (google_exceptions.GoogleAPIError, OSError) as e:
+                        print(f"Error uploading {path}: {e}")
+                        continue
+                    if video_file.state.name == "ACTIVE":
+                        self._remember(key, video_file)
+                        yield path, video_file
+                    else:
+                        pending[path] = [
+                            video_file,
+                            key,
+                            min_interval,
+                            time.monotonic() + min_interval,
+                        ]
+
+    def _upload(self, file_path: str):
+        key = f"sha256:{file_hash(file_path)}" if self.uploads is not None else None
+        if key is not None:
+            video_file = self._get_uploaded(key)
+            if video_file is not None:
+                return video_file, None
+        return genai.upload_file(path=file_path), key
+
+    def _remember(self, key: str, video_file):
+        if key is None:
+            return
+        expires = _expiration(video_file)
+        self.uploads.set(
+            key,
+            {"name": video_file.name, "expires": expires},
+            ttl=expires - EXPIRY_MARGIN - time.time(),
+        )
+
+    def _get_uploaded(self, key: str):
+        entry = self.uploads.get(key)
+        if entry is None or entry["expires"] - EXPIRY_MARGIN <= time.time():
+            return None
+        try:
+            video_file = genai.get_file(entry["name"])
+        except google_exceptions.GoogleAPIError as e:
+            print(f"Cached upload {entry['name']} is gone, uploading again: {e}")
+            self.uploads.delete(key)
+            return None
+        if video_file.state.name == "FAILED":
+            self.uploads.delete(key)
+            return None
+        return video_file
+
+    @staticmethod
+    def _wait_active(video_file):
         while video_file.state.name == "PROCESSING":
             print(".", end="")
             time.sleep(10)
             video_file = genai.get_file(video_file.name)
         if video_file.state.name == "FAILED":
             raise ValueError(video_file.state.name)
-        # print(video_file)
         return video_file
+
+
+def prompt_key(model_name: str, prompt) -> str:
+    """
+    Returns the cache key of a prompt sent to a model.
+
+    Uploaded files in the prompt are identified by their Gemini file name.
+    """
+
+    def encode(part):
+        if hasattr(part, "name") and hasattr(part, "uri"):
+            return {"file": part.name}
+        if isinstance(part, bytes):
+            return {"sha256": hashlib.sha256(part).hexdigest()}
+        return str(part)
+
+    text = json.dumps(prompt, default=encode, sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    return f"{model_name}:{digest}"
+
+
+def file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Returns the hex SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _expiration(video_file) -> float:
+    expiration_time = getattr(video_file, "expiration_time", None)
+    if expiration_time is None:
+        return time.time() + FILE_LIFETIME
+    return expiration_time.timestamp()
@@ -0,0 +1,200 @@
+import asyncio
+import weakref
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from .RateLimiter import get_limiter
+from .src.JsonStream import iter_movie_chunks
+from .src.Movie import Movie
+from .src.Validator import ValidationError, validate_movie
+
+
+class AsyncClient:
+    """
+    An asyncio client for interacting with the JSON2Video API.
+
+    All requests share one connection pool, and at most ``concurrency`` requests are
+    in flight at a time, so a single process can submit and track many movies.
+    The pool and the limit belong to the running event loop, so the same client can
+    be used from successive ``asyncio.run()`` calls. Requests also queue on the rate
+    limiter of the API key, which is shared with ``Client``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.json2video.com/v2",
+        concurrency: int = 50,
+        timeout: float = 60,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        rate: float = 1,
+        burst: int = 5,
+    ):
+        """
+        Initializes an AsyncClient object.
+
+        Args:
+            api_key (str): JSON2Video API key.
+            base_url (str): Base URL of the API. Defaults to "https://api.json2video.com/v2".
+            concurrency (int): Maximum number of requests in flight, which is also the
+                size of the connection pool. Defaults to 50.
+            timeout (float): Total timeout of a request in seconds. Defaults to 60.
+            max_retries (int): Times a request answered with 429 is queued again on the
+                rate limiter. Defaults to 3.
+            backoff_factor (float): Exponential backoff factor after a 429 without
+                Retry-After, in seconds. Defaults to 0.5.
+            rate (float): Requests per second allowed for this API key until the API reports
+                its own limits. Shared with every Client and AsyncClient using the key. Defaults to 1.
+            burst (int): Requests that may be sent at once for this API key. Defaults to 5.
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # The same token bucket as Client, so both respect one budget per key.
+        self.limiter = get_limiter(api_key, rate, burst)
+        self.headers = {
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json",
+        }
+        self.concurrency = concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # Event loop -> (session, semaphore); both are bound to the loop they were
+        # created in, and are dropped with it.
+        self._loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_session(self) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None or state[0].closed:
+            state = self._loops[loop] = (
+                aiohttp.ClientSession(
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    connector=aiohttp.TCPConnector(limit=self.concurrency),
+                ),
+                asyncio.Semaphore(self.concurrency),
+            )
+        return state
+
+    async def close(self):
+        """Closes the pooled connections of the session of the running event loop."""
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state[0].close()
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Callable[[], Dict]] = None,
+        params: Dict = None,
+    ) -> Any:
+        """
+        Sends a request through the rate limiter, queueing it again after a 429.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            body (Optional[Callable[[], Dict]]): Builds the body keyword arguments for each
+                attempt, so a streamed body is never replayed. Defaults to None (no body).
+            params (Dict): Query parameters. Defaults to None.
+
+        Returns:
+            Any: The JSON response. Raises aiohttp.ClientResponseError for error statuses.
+        """
+        session, semaphore = self._get_session()
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                # The limiter blocks its callers, so the token is awaited in a thread.
+                await asyncio.to_thread(self.limiter.acquire)
+                kwargs = body() if body is not None else {}
+                async with session.request(
+                    method, url, params=params, **kwargs
+                ) as response:
+                    self.limiter.update_from_headers(response.headers)
+                    if response.status == 429 and attempt < self.max_retries:
+                        if "Retry-After" not in response.headers:
+                            self.limiter.pause(self.backoff_factor * 2**attempt)
+                        continue
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+
+    async def get_movies(self, project_id: str) -> List[Dict]:
+        """
+        Gets the status of your movies for a given project ID.
+
+        Args:
+            project_id (str): The ID of the project.
+
+        Returns:
+            List[Dict]: A list of movie dictionaries from the API. Returns an empty list on errors.
+        """
+        url = f"{self.base_url}/movies"
+
+        try:
+            return await self._request("GET", url, params={"project": project_id})
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching movies: {e}")
+            return []
+
+    async def create_movie(
+        self,
+        movie: Movie | Dict,
+        compact: bool = True,
+        stream: bool = False,
+        validate: bool = True,
+    ) -> Dict:
+        """
+        Creates a new movie rendering job.
+
+        Args:
+            movie (Movie | Dict): A Movie object (or an already serialized movie) representing the movie to create.
+            compact (bool): Serialize a Movie without None values and schema defaults. Defaults to True.
+            stream (bool): Send a Movie as a chunked request body encoded on the fly. Defaults to False.
+            validate (bool): Check the movie against the local schema before submitting it. Defaults to True.
+
+        Returns:
+            Dict: The JSON response from the API. Raises an exception for errors.
+
+        Raises:
+            ValidationError: If validate is set and the movie does not match the schema.
+        """
+        url = f"{self.base_url}/movies"
+        if isinstance(movie, Movie) and stream:
+
+            def body() -> Dict:
+                return {"data": _aiter(iter_movie_chunks(movie, compact=compact))}
+
+        else:
+            payload = movie._serialize(compact) if isinstance(movie, Movie) else movie
+
+            def body() -> Dict:
+                return {"json": payload}
+
+        # Validated after a buffered payload is built, so its cached fragments are
+        # checked instead of being serialized a second time.
+        if validate:
+            errors = validate_movie(movie, compact)
+            if errors:
+                raise ValidationError(errors)
+
+        try:
+            return await self._request("POST", url, body)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error creating movie: {e}")
+            raise
+
+
+async def _aiter(chunks) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
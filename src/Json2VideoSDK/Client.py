@@ -1,7 +1,12 @@
 import requests
-from typing import Dict, List
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, Optional
+from urllib3.util.retry import Retry
 
+from .RateLimiter import get_limiter
+from .src.JsonStream import iter_movie_chunks
 from .src.Movie import Movie
+from .src.Validator import ValidationError, validate_movie
 
 
 class Client:
@@ -9,13 +14,96 @@ class Client:
     A client for interacting with the JSON2Video API.
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://api.json2video.com/v2"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.json2video.com/v2",
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        rate: float = 1,
+        burst: int = 5,
+    ):
+        """
+        Initializes a Client object.
+
+        Requests go through one keep-alive session, so connections to the API are
+        reused instead of paying a TCP+TLS handshake per call.
+
+        Args:
+            api_key (str): JSON2Video API key.
+            base_url (str): Base URL of the API. Defaults to "https://api.json2video.com/v2".
+            pool_size (int): Maximum number of pooled connections kept alive. Defaults to 10.
+            max_retries (int): Transport-level retries for connection errors and for
+                5xx responses to GET requests. 429 responses are retried through the rate
+                limiter instead, with the same count. Defaults to 3.
+            backoff_factor (float): Exponential backoff factor between retries, in seconds. Defaults to 0.5.
+            rate (float): Requests per second allowed for this API key until the API reports
+                its own limits. Shared by all clients using the key. Defaults to 1.
+            burst (int): Requests that may be sent at once for this API key. Defaults to 5.
+        """
         self.api_key = api_key
         self.base_url = base_url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        # Callers queue on the key's token bucket instead of failing with 429.
+        self.limiter = get_limiter(api_key, rate, burst)
         self.headers = {
             "x-api-key": self.api_key,
             "Content-Type": "application/json",
         }
+        # POST is not retried on responses, so a movie is never submitted twice.
+        # 429 is left to _send, so the limiter sees its headers and callers queue.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self):
+        """Closes the pooled connections of the session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _send(
+        self, method: str, url: str, body: Optional[Callable[[], Dict]] = None
+    ) -> requests.Response:
+        """
+        Sends a request through the rate limiter, queueing it again after a 429.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            body (Optional[Callable[[], Dict]]): Builds the body keyword arguments for each
+                attempt, so a streamed body is never replayed. Defaults to None (no body).
+
+        Returns:
+            requests.Response: The last response received.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            kwargs = body() if body is not None else {}
+            response = self.session.request(method, url, **kwargs)
+            self.limiter.update_from_headers(response.headers)
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            if "Retry-After" not in response.headers:
+                self.limiter.pause(self.backoff_factor * 2**attempt)
+        return response
 
     def get_movies(self, project_id: str) -> List[Dict]:
         """
@@ -31,7 +119,7 @@ class Client:
         url = f"{self.base_url}/movies?project={project_id}"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._send("GET", url)
             response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -41,20 +129,51 @@ class Client:
             # You could return an empty list or re-raise the exception depending on your needs
             return []
 
-    def create_movie(self, movie: Movie) -> Dict:  # More descriptive method name
+    def create_movie(
+        self,
+        movie: Movie | Dict,
+        compact: bool = True,
+        stream: bool = False,
+        validate: bool = True,
+    ) -> Dict:  # More descriptive method name
         """
         Creates a new movie rendering job.
 
         Args:
-            movie (Movie): A Movie object representing the movie to create.
+            movie (Movie | Dict): A Movie object (or an already serialized movie) representing the movie to create.
+            compact (bool): Serialize a Movie without None values and schema defaults. Defaults to True.
+            stream (bool): Send a Movie as a chunked request body encoded on the fly instead of
+                building the whole payload in memory. Recommended for very large movies. Defaults to False.
+            validate (bool): Check the movie against the local schema before submitting it, so invalid
+                movies fail without spending a render. Defaults to True.
 
         Returns:
             Dict: The JSON response from the API. Raises an exception for errors.
+
+        Raises:
+            ValidationError: If validate is set and the movie does not match the schema.
         """
         url = f"{self.base_url}/movies"
+        if isinstance(movie, Movie) and stream:
+
+            def body() -> Dict:
+                return {"data": iter_movie_chunks(movie, compact=compact)}
+
+        else:
+            payload = movie._serialize(compact) if isinstance(movie, Movie) else movie
+
+            def body() -> Dict:
+                return {"json": payload}
+
+        # Validated after a buffered payload is built, so its cached fragments are
+        # checked instead of being serialized a second time.
+        if validate:
+            errors = validate_movie(movie, compact)
+            if errors:
+                raise ValidationError(errors)
 
         try:
-            response = requests.post(url, headers=self.headers, json=movie)
+            response = self._send("POST", url, body)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
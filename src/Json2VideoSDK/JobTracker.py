@@ -0,0 +1,273 @@
+import math
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+
+from .Client import Client
+from .src.Movie import Movie
+
+# Final statuses reported by the API for a movie render.
+DONE_STATUSES = frozenset({"done"})
+ERROR_STATUSES = frozenset({"error"})
+
+# Upper bound on notifications kept for projects that are not tracked (yet).
+MAX_UNCLAIMED = 1000
+
+
+class RenderError(RuntimeError):
+    """Raised through a job's future when the API reports a failed render."""
+
+    def __init__(self, movie: Dict):
+        super().__init__(movie.get("message") or f"Render failed: {movie}")
+        self.movie = movie
+
+
+class _Job:
+    __slots__ = ("movie_id", "future")
+
+    def __init__(self, movie_id: str, future: Future):
+        self.movie_id = movie_id
+        self.future = future
+
+
+class _Project:
+    __slots__ = ("jobs", "interval", "next_poll")
+
+    def __init__(self, interval: float, poll: bool):
+        self.jobs: List[_Job] = []
+        self.interval = interval
+        # Projects that only wait for a webhook are never polled.
+        self.next_poll = time.monotonic() + interval if poll else math.inf
+
+
+def movie_records(response) -> List[Dict]:
+    """
+    Extracts the movie status records from a get_movies response.
+
+    The API answers with either a single "movie" object, a "movies" list or a bare list.
+    """
+    if isinstance(response, list):
+        return [movie for movie in response if isinstance(movie, dict)]
+    if isinstance(response, dict):
+        if isinstance(response.get("movies"), list):
+            return response["movies"]
+        if isinstance(response.get("movie"), dict):
+            return [response["movie"]]
+    return []
+
+
+class JobTracker:
+    """
+    Tracks submitted renders until they finish.
+
+    A background thread polls each project with outstanding jobs once per round, no
+    matter how many jobs it has, and waits between rounds with exponential backoff and
+    jitter. Results are delivered through futures, and optionally through callbacks.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        min_interval: float = 2,
+        max_interval: float = 60,
+        factor: float = 1.5,
+        jitter: float = 0.2,
+    ):
+        """
+        Initializes a JobTracker object.
+
+        Args:
+            client (Client): Client used to query the movie status.
+            min_interval (float): First delay between polls of a project, in seconds. Defaults to 2.
+            max_interval (float): Longest delay between polls of a project, in seconds. Defaults to 60.
+            factor (float): Growth factor of the delay after each poll. Defaults to 1.5.
+            jitter (float): Relative random spread applied to every delay. Defaults to 0.2.
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+        self._projects: Dict[str, _Project] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread = None
+        self._closed = False
+        # Notifications that arrived before their project was tracked.
+        self._unclaimed: Dict[str, Dict] = {}
+
+    def submit(
+        self, movie: Movie | Dict, callback: Callable[[Future], None] = None, **kwargs
+    ) -> Future:
+        """
+        Creates a movie with the client and tracks it.
+
+        Args:
+            movie (Movie | Dict): The movie to create.
+            callback (Callable[[Future], None]): Called with the future once the render finishes. Defaults to None.
+            **kwargs: Passed to Client.create_movie.
+
+        Returns:
+            Future: Resolves to the movie status record, or fails with RenderError.
+        """
+        response = self.client.create_movie(movie, **kwargs)
+        # Every created movie gets its own project, so the project ID identifies it.
+        return self.track(response["project"], callback=callback)
+
+    def track(
+        self,
+        project_id: str,
+        movie_id: str = None,
+        callback: Callable[[Future], None] = None,
+        poll: bool = True,
+    ) -> Future:
+        """
+        Starts tracking a render.
+
+        Args:
+            project_id (str): The ID of the project the movie was created in.
+            movie_id (str): The movie ID, to tell several movies of one project apart. Defaults to None.
+            callback (Callable[[Future], None]): Called with the future once the render finishes. Defaults to None.
+            poll (bool): Poll the API for the status. Set to False when the result is delivered
+                through notify(), e.g. by a WebhookReceiver. Defaults to True.
+
+        Returns:
+            Future: Resolves to the movie status record, or fails with RenderError.
+        """
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("JobTracker is closed")
+            project = self._projects.get(project_id)
+            if project is None:
+                project = _Project(self.min_interval, poll)
+                self._projects[project_id] = project
+            elif poll:
+                # New work on a project restarts its backoff.
+                project.interval = self.min_interval
+                project.next_poll = min(
+                    project.next_poll, time.monotonic() + self.min_interval
+                )
+            project.jobs.append(_Job(movie_id, future))
+            early = self._unclaimed.pop(project_id, None)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="json2video-tracker", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        if early is not None:
+            self._resolve(project_id, [early], reschedule=False)
+        return future
+
+    def notify(self, project_id: str, record: Dict):
+        """
+        Resolves the tracked renders of a project from a status record received out of band.
+
+        Args:
+            project_id (str): The ID of the project.
+            record (Dict): The movie status record, e.g. the body of a completion webhook.
+        """
+        with self._condition:
+            if project_id not in self._projects:
+                # A webhook may beat the track() call that follows create_movie.
+                self._unclaimed[project_id] = record
+                while len(self._unclaimed) > MAX_UNCLAIMED:
+                    del self._unclaimed[next(iter(self._unclaimed))]
+                return
+        self._resolve(project_id, [record], reschedule=False)
+
+    def pending(self) -> int:
+        """Returns the number of renders still being tracked."""
+        with self._condition:
+            return sum(len(project.jobs) for project in self._projects.values())
+
+    def close(self):
+        """Stops the polling thread and cancels the renders still being tracked."""
+        with self._condition:
+            self._closed = True
+            projects, self._projects = self._projects, {}
+            self._condition.notify()
+        for project in projects.values():
+            for job in project.jobs:
+                job.future.cancel()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    due = [
+                        project_id
+                        for project_id, project in self._projects.items()
+                        if project.next_poll <= now
+                    ]
+                    if due:
+                        break
+                    wake = min(
+                        (p.next_poll for p in self._projects.values()), default=math.inf
+                    )
+                    self._condition.wait(None if wake == math.inf else wake - now)
+                if self._closed:
+                    return
+
+            for project_id in due:
+                try:
+                    records = movie_records(self.client.get_movies(project_id))
+                except Exception as e:
+                    print(f"Error polling project {project_id}: {e}")
+                    records = []
+                self._resolve(project_id, records)
+
+    def _resolve(self, project_id: str, records: List[Dict], reschedule: bool = True):
+        finished = []
+        with self._condition:
+            project = self._projects.get(project_id)
+            if project is None:
+                return
+            remaining = []
+            for job in project.jobs:
+                record = self._match(job, records)
+                status = record.get("status") if record else None
+                if status in DONE_STATUSES or status in ERROR_STATUSES:
+                    finished.append((job, record))
+                else:
+                    remaining.append(job)
+            project.jobs = remaining
+            if not remaining:
+                del self._projects[project_id]
+            elif reschedule:
+                delay = project.interval * random.uniform(
+                    1 - self.jitter, 1 + self.jitter
+                )
+                project.next_poll = time.monotonic() + delay
+                project.interval = min(
+                    project.interval * self.factor, self.max_interval
+                )
+
+        # Futures are resolved outside the lock, so callbacks may track new jobs.
+        for job, record in finished:
+            if job.future.done():
+                continue
+            if record.get("status") in ERROR_STATUSES:
+                job.future.set_exception(RenderError(record))
+            else:
+                job.future.set_result(record)
+
+    @staticmethod
+    def _match(job: _Job, records: List[Dict]) -> Dict:
+        for record in records:
+            if job.movie_id is None or record.get("id") == job.movie_id:
+                return record
+        return None
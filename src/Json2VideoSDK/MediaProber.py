@@ -0,0 +1,538 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import struct
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List
+
+import requests
+
+from .src.Config import DEFAULT_CACHE_DIR
+
+# Element types whose src is a media asset worth probing.
+PROBED_TYPES = frozenset({"video", "audio", "image"})
+
+# Bytes read from the start of an image to find its dimensions.
+IMAGE_HEADER_SIZE = 64 * 1024
+
+# Bytes read at the first MP3 frame to find its header and VBR header.
+MP3_FRAME_READ_SIZE = 4096
+
+# MP3 bitrates in kbit/s by (MPEG-1, layer) and bitrate index; MPEG-2 and 2.5 share a table.
+_MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# MP3 sample rates by MPEG version bits (0: 2.5, 2: 2, 3: 1).
+_MP3_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+# WAV codecs by format tag.
+_WAV_CODECS = {1: "pcm", 3: "pcm_float", 6: "alaw", 7: "mulaw"}
+
+# MP4/MOV boxes that contain the boxes the prober looks for.
+_CONTAINER_BOXES = frozenset({b"moov", b"trak", b"mdia", b"minf", b"stbl"})
+
+
+class MediaProber:
+    """
+    Reads the duration, dimensions and codec of media assets.
+
+    Assets are probed with ffprobe when it is installed, and otherwise by parsing
+    the MP4/MOV, MP3, WAV, PNG, JPEG or GIF headers; other formats (e.g. WebM, OGG
+    or AAC) need ffprobe and come back with a None format. Probes run on a process pool, and the
+    results are stored in a SQLite file keyed by the URL and its ETag (or the
+    content hash of a local file), so every asset version is probed once.
+    """
+
+    def __init__(
+        self,
+        cache_path: str = os.path.join(DEFAULT_CACHE_DIR, "probe.sqlite3"),
+        max_workers: int = None,
+        ffprobe: str = None,
+        timeout: float = 30,
+    ):
+        """
+        Initializes a MediaProber object.
+
+        Args:
+            cache_path (str): Path of the SQLite cache. Defaults to ~/.cache/json2video/probe.sqlite3.
+            max_workers (int): Size of the process pool. Defaults to the number of CPUs.
+            ffprobe (str): Path of the ffprobe binary. Defaults to the one on PATH, if any.
+            timeout (float): Timeout of a single probe in seconds. Defaults to 30.
+        """
+        self.ffprobe = ffprobe or shutil.which("ffprobe")
+        self.timeout = timeout
+        self.max_workers = max_workers
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        self._db = sqlite3.connect(cache_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS probes (key TEXT PRIMARY KEY, data TEXT)"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+        # Results of this process, by src, so fingerprints are not fetched again.
+        self._results: Dict[str, Dict] = {}
+        self._pool: ProcessPoolExecutor = None
+
+    def probe(self, src: str) -> Dict:
+        """
+        Returns the metadata of an asset.
+
+        Args:
+            src (str): URL or local path of the asset.
+
+        Returns:
+            Dict: "duration" (seconds), "width", "height", "codec" and "format". Unknown
+            values are None.
+        """
+        return self.probe_many([src])[src]
+
+    def probe_many(self, srcs: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Probes several assets in parallel.
+
+        Args:
+            srcs (Iterable[str]): URLs or local paths of the assets.
+
+        Returns:
+            Dict[str, Dict]: The metadata of every asset, as returned by probe().
+        """
+        srcs = [src for src in dict.fromkeys(srcs) if src]
+        with self._lock:
+            todo = [src for src in srcs if src not in self._results]
+        if todo:
+            pool = self._get_pool()
+            keys = dict(zip(todo, pool.map(_fingerprint, todo)))
+            cached = self._load(keys.values())
+            missing = [src for src in todo if keys[src] not in cached]
+            probed = dict(
+                zip(
+                    missing,
+                    pool.map(
+                        _probe,
+                        missing,
+                        [self.ffprobe] * len(missing),
+                        [self.timeout] * len(missing),
+                    ),
+                )
+            )
+            self._store({keys[src]: probed[src] for src in missing})
+            with self._lock:
+                for src in todo:
+                    self._results[src] = cached.get(keys[src]) or probed[src]
+        with self._lock:
+            return {src: self._results[src] for src in srcs}
+
+    def probe_movie(self, movie) -> Dict[str, Dict]:
+        """
+        Probes the video, audio and image assets of a movie.
+
+        Args:
+            movie (Movie | Dict): The movie, as SDK objects or serialized.
+
+        Returns:
+            Dict[str, Dict]: The metadata of every asset, keyed by src.
+        """
+        return self.probe_many(movie_sources(movie))
+
+    def duration(self, src: str) -> float:
+        """Returns the duration of an asset in seconds, None when unknown.
+
+        Can be passed as the probe of resolve_timeline.
+        """
+        return self.probe(src)["duration"]
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _load(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        keys = [key for key in keys if key is not None]
+        found = {}
+        with self._lock:
+            # Stay below SQLite's limit on query parameters.
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                rows = self._db.execute(
+                    "SELECT key, data FROM probes WHERE key IN "
+                    f"({','.join('?' * len(batch))})",
+                    batch,
+                )
+                found.update((key, json.loads(data)) for key, data in rows)
+        return found
+
+    def _store(self, results: Dict[str, Dict]):
+        # Failed probes and assets without a stable fingerprint are not persisted.
+        rows = [
+            (key, json.dumps(data))
+            for key, data in results.items()
+            if key is not None and data.get("format") is not None
+        ]
+        with self._lock:
+            self._db.executemany("REPLACE INTO probes VALUES (?, ?)", rows)
+            self._db.commit()
+
+    def close(self):
+        """Stops the process pool and closes the cache."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def movie_sources(movie) -> List[str]:
+    """Returns the src of every video, audio and image element of a movie."""
+
+    def get(obj, name):
+        return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+    containers = [movie] + list(get(movie, "scenes") or [])
+    return [
+        get(element, "src")
+        for container in containers
+        for element in get(container, "elements") or []
+        if get(element, "type") in PROBED_TYPES and get(element, "src")
+    ]
+
+
+def _is_url(src: str) -> bool:
+    return src.startswith(("http://", "https://"))
+
+
+def _fingerprint(src: str) -> str:
+    # Identifies the current version of an asset: URL plus validator headers, or the
+    # SHA-256 of a local file. None when the asset cannot be reached.
+    try:
+        if _is_url(src):
+            response = requests.head(src, allow_redirects=True, timeout=10)
+            response.raise_for_status()
+            headers = response.headers
+            version = headers.get("ETag") or (
+                f"{headers.get('Last-Modified')}/{headers.get('Content-Length')}"
+            )
+            return f"{src}#{version}"
+        digest = hashlib.sha256()
+        with open(src, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return f"sha256:{digest.hexdigest()}"
+    except (requests.exceptions.RequestException, OSError) as e:
+        print(f"Error fingerprinting {src}: {e}")
+        return None
+
+
+def _empty() -> Dict:
+    return {
+        "duration": None,
+        "width": None,
+        "height": None,
+        "codec": None,
+        "format": None,
+    }
+
+
+def _probe(src: str, ffprobe: str, timeout: float) -> Dict:
+    try:
+        if ffprobe:
+            return _probe_ffprobe(src, ffprobe, timeout)
+        return _probe_headers(src, timeout)
+    except (
+        requests.exceptions.RequestException,
+        subprocess.SubprocessError,
+        OSError,
+        ValueError,
+        struct.error,
+    ) as e:
+        print(f"Error probing {src}: {e}")
+        return _empty()
+
+
+def _probe_ffprobe(src: str, ffprobe: str, timeout: float) -> Dict:
+    output = subprocess.run(
+        [
+            ffprobe,
+            "-v",
+            "error",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            src,
+        ],
+        capture_output=True,
+        check=True,
+        timeout=timeout,
+    ).stdout
+    info = json.loads(output)
+    result = _empty()
+    fmt = info.get("format", {})
+    result["format"] = fmt.get("format_name")
+    streams = info.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    stream = video or next(iter(streams), {})
+    result["codec"] = stream.get("codec_name")
+    if video is not None:
+        result["width"] = video.get("width")
+        result["height"] = video.get("height")
+    duration = fmt.get("duration") or stream.get("duration")
+    # Still images report no duration, or the length of a single frame.
+    if duration is not None and fmt.get("format_name") not in ("image2", "png_pipe"):
+        result["duration"] = float(duration)
+    return result
+
+
+class _Reader:
+    """Random access to a local file or, through Range requests, a remote one."""
+
+    def __init__(self, src: str, timeout: float):
+        self.src = src
+        self.timeout = timeout
+        self.size = None
+        if not _is_url(src):
+            self.size = os.path.getsize(src)
+
+    def read(self, offset: int, length: int) -> bytes:
+        if not _is_url(self.src):
+            with open(self.src, "rb") as f:
+                f.seek(offset)
+                return f.read(length)
+        response = requests.get(
+            self.src,
+            headers={"Range": f"bytes={offset}-{offset + length - 1}"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        if response.status_code == 206:
+            total = response.headers.get("Content-Range", "").rsplit("/", 1)[-1]
+            if total.isdigit():
+                self.size = int(total)
+            return response.content
+        # The server ignored the range and sent the whole file.
+        self.size = len(response.content)
+        return response.content[offset : offset + length]
+
+
+def _probe_headers(src: str, timeout: float) -> Dict:
+    reader = _Reader(src, timeout)
+    head = reader.read(0, IMAGE_HEADER_SIZE)
+    result = _empty()
+    if head[4:8] in (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip"):
+        result["format"] = "mp4"
+        _parse_mp4(reader, head, result)
+    elif head.startswith(b"\x89PNG\r\n\x1a\n"):
+        result["format"] = result["codec"] = "png"
+        result["width"], result["height"] = struct.unpack(">II", head[16:24])
+    elif head[:6] in (b"GIF87a", b"GIF89a"):
+        result["format"] = result["codec"] = "gif"
+        result["width"], result["height"] = struct.unpack("<HH", head[6:10])
+    elif head.startswith(b"\xff\xd8"):
+        result["format"] = result["codec"] = "jpeg"
+        size = _jpeg_size(head)
+        if size is not None:
+            result["width"], result["height"] = size
+    elif head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        _parse_wav(reader, head, result)
+    elif head[:3] == b"ID3" or _mp3_header(head[:4]) is not None:
+        _parse_mp3(reader, head, result)
+    return result
+
+
+def _parse_wav(reader: _Reader, head: bytes, result: Dict):
+    # Walk the RIFF chunks for "fmt " (byte rate) and the size of "data".
+    offset = 12
+    byte_rate = None
+    while True:
+        header = head[offset : offset + 24]
+        if len(header) < 8:
+            header = reader.read(offset, 24)
+        if len(header) < 8:
+            return
+        kind, size = struct.unpack("<4sI", header[:8])
+        if kind == b"fmt " and len(header) >= 20:
+            tag, _, _, byte_rate = struct.unpack("<HHII", header[8:20])
+            result["format"] = "wav"
+            result["codec"] = _WAV_CODECS.get(tag)
+        elif kind == b"data":
+            if byte_rate:
+                result["duration"] = size / byte_rate
+            return
+        # Chunks are padded to an even size.
+        offset += 8 + size + (size & 1)
+
+
+def _mp3_header(data: bytes):
+    # Returns (mpeg1, layer, bitrate, sample rate, mono) of an MP3 frame
+    # header, or None if data does not start with one.
+    if len(data) < 4 or data[0] != 0xFF or data[1] & 0xE0 != 0xE0:
+        return None
+    version = (data[1] >> 3) & 3
+    layer = 4 - ((data[1] >> 1) & 3)
+    bitrate_index = data[2] >> 4
+    rate_index = (data[2] >> 2) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    return mpeg1, layer, bitrate, sample_rate, data[3] >> 6 == 3
+
+
+def _parse_mp3(reader: _Reader, head: bytes, result: Dict):
+    # Skip the ID3v2 tag, whose size is stored as a 28-bit "syncsafe" integer.
+    start = 0
+    if head[:3] == b"ID3":
+        size = 0
+        for byte in head[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        start = 10 + size + (10 if head[5] & 0x10 else 0)
+    frame = head[start : start + MP3_FRAME_READ_SIZE]
+    if len(frame) < MP3_FRAME_READ_SIZE:
+        frame = reader.read(start, MP3_FRAME_READ_SIZE)
+    # Some files pad the tag, so look for the first frame header.
+    for skip in range(len(frame) - 4):
+        header = _mp3_header(frame[skip : skip + 4])
+        if header is not None:
+            break
+    else:
+        return
+    start += skip
+    frame = frame[skip:]
+    mpeg1, layer, bitrate, sample_rate, mono = header
+    result["format"] = "mp3"
+    result["codec"] = f"mp{layer}"
+    samples = 384 if layer == 1 else 1152 if mpeg1 or layer == 2 else 576
+    # A Xing/Info header (after the side information) or a VBRI header (at a fixed
+    # offset) gives the number of frames of a VBR file.
+    side = (32 if not mono else 17) if mpeg1 else (17 if not mono else 9)
+    xing = 4 + side
+    frames = None
+    if frame[xing : xing + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack(">I", frame[xing + 4 : xing + 8])
+        if flags & 1:
+            (frames,) = struct.unpack(">I", frame[xing + 8 : xing + 12])
+    elif frame[36:40] == b"VBRI":
+        (frames,) = struct.unpack(">I", frame[50:54])
+    if frames:
+        result["duration"] = frames * samples / sample_rate
+    elif reader.size is not None:
+        # Constant bitrate: the length follows from the size of the audio data.
+        result["duration"] = (reader.size - start) * 8 / bitrate
+
+
+def _jpeg_size(data: bytes):
+    offset = 2
+    while offset + 9 < len(data):
+        if data[offset] != 0xFF:
+            offset += 1
+            continue
+        marker = data[offset + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+            offset += 1 if marker == 0xFF else 2
+            continue
+        (length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        # Start-of-frame markers, except DHT (C4), JPG (C8) and DAC (CC).
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", data[offset + 5 : offset + 9])
+            return width, height
+        offset += 2 + length
+    return None
+
+
+def _boxes(data: bytes, start: int = 0, end: int = None):
+    end = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        size, kind = struct.unpack(">I4s", data[offset : offset + 8])
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", data[offset + 8 : offset + 16])
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            return
+        yield kind, offset + header, min(offset + size, end)
+        offset += size
+
+
+def _parse_mp4(reader: _Reader, head: bytes, result: Dict):
+    # Walk the top-level boxes to find "moov", which may follow a large "mdat".
+    offset = 0
+    moov = None
+    while moov is None:
+        header = head[offset : offset + 16]
+        if len(header) < 16:
+            header = reader.read(offset, 16)
+        if len(header) < 8:
+            return
+        size, kind = struct.unpack(">I4s", header[:8])
+        if size == 1:
+            (size,) = struct.unpack(">Q", header[8:16])
+        elif size == 0:
+            size = (reader.size or offset) - offset
+        if size < 8:
+            return
+        if kind == b"moov":
+            moov = (
+                head[offset : offset + size]
+                if offset + size <= len(head)
+                else reader.read(offset, size)
+            )
+        offset += size
+        if reader.size is not None and offset >= reader.size:
+            break
+    if moov is None:
+        return
+    _parse_boxes(moov, 0, len(moov), result, {})
+
+
+def _parse_boxes(data: bytes, start: int, end: int, result: Dict, track: Dict):
+    for kind, body, box_end in _boxes(data, start, end):
+        if kind == b"trak":
+            child: Dict = {}
+            _parse_boxes(data, body, box_end, result, child)
+            if child.get("handler") == b"vide":
+                if child.get("width") and not result["width"]:
+                    result["width"], result["height"] = child["width"], child["height"]
+                result["codec"] = child.get("codec") or result["codec"]
+            elif result["codec"] is None:
+                result["codec"] = child.get("codec")
+        elif kind in _CONTAINER_BOXES:
+            _parse_boxes(data, body, box_end, result, track)
+        elif kind == b"mvhd":
+            version = data[body]
+            if version == 1:
+                timescale, duration = struct.unpack(">IQ", data[body + 20 : body + 32])
+            else:
+                timescale, duration = struct.unpack(">II", data[body + 12 : body + 20])
+            if timescale:
+                result["duration"] = duration / timescale
+        elif kind == b"tkhd":
+            # Width and height are 16.16 fixed point numbers at the end of the box.
+            width, height = struct.unpack(">II", data[box_end - 8 : box_end])
+            track["width"], track["height"] = width >> 16, height >> 16
+        elif kind == b"hdlr":
+            track["handler"] = data[body + 8 : body + 12]
+        elif kind == b"stsd":
+            track["codec"] = data[body + 12 : body + 16].decode("ascii", "replace")
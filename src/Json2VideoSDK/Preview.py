@@ -0,0 +1,345 @@
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Callable, List
+
+from .src.Timeline import TimedElement, TimelineError, resolve_timeline
+
+# Element types drawn from an input file.
+VISUAL_TYPES = frozenset({"video", "image"})
+
+# Overlay coordinates of the preset positions, in overlay filter expressions.
+_POSITIONS = {
+    "top-left": ("0", "0"),
+    "top-right": ("W-w", "0"),
+    "bottom-right": ("W-w", "H-h"),
+    "bottom-left": ("0", "H-h"),
+    "center-center": ("(W-w)/2", "(H-h)/2"),
+}
+
+# The same positions for drawtext, which names the sizes differently.
+_TEXT_POSITIONS = {
+    "top-left": ("0", "0"),
+    "top-right": ("w-text_w", "0"),
+    "bottom-right": ("w-text_w", "h-text_h"),
+    "bottom-left": ("0", "h-text_h"),
+    "center-center": ("(w-text_w)/2", "(h-text_h)/2"),
+}
+
+
+def _get(obj, name, default=None):
+    if isinstance(obj, dict):
+        value = obj.get(name.replace("_", "-"), obj.get(name))
+    else:
+        value = getattr(obj, name, None)
+    return default if value is None else value
+
+
+def _number(value, default: float) -> float:
+    # Text settings such as font-size may be given as "40px".
+    try:
+        return float(str(value).rstrip("px"))
+    except ValueError:
+        return default
+
+
+class PreviewRenderer:
+    """
+    Renders a low-resolution draft of a movie locally with ffmpeg.
+
+    The movie is resolved with resolve_timeline and turned into a single ffmpeg filter
+    graph: every scene is a colored canvas with its video, image and text elements
+    overlaid by z-index, at their position, size and time, with fades. Scenes are
+    joined with their xfade transitions, movie-level elements are laid over the
+    result, and audio elements are mixed in. Voice, subtitles, HTML and components
+    need the API and are left out of the draft.
+    """
+
+    def __init__(
+        self,
+        ffmpeg: str = None,
+        width: int = 320,
+        fps: int = 10,
+        resolve_src: Callable[[str], str] = None,
+        probe: Callable[[str], float] = None,
+    ):
+        """
+        Initializes a PreviewRenderer object.
+
+        Args:
+            ffmpeg (str): Path of the ffmpeg binary. Defaults to the one on PATH.
+            width (int): Width of the preview in pixels; the height keeps the movie's
+                aspect ratio. Defaults to 320.
+            fps (int): Frame rate of the preview. Defaults to 10.
+            resolve_src (Callable[[str], str]): Maps an asset URL to a local file, e.g. a
+                download cache, so previews work offline. Defaults to using the URL as is.
+            probe (Callable[[str], float]): Asset lengths for resolve_timeline, e.g.
+                MediaProber.duration. Defaults to None.
+        """
+        self.ffmpeg = ffmpeg or shutil.which("ffmpeg")
+        self.width = width
+        self.fps = fps
+        self.resolve_src = resolve_src or (lambda src: src)
+        self.probe = probe
+
+    def render(self, movie, output: str) -> str:
+        """
+        Renders the preview.
+
+        Args:
+            movie (Movie | Dict): The movie, as SDK objects or serialized.
+            output (str): Path of the MP4 file to write.
+
+        Returns:
+            str: The output path.
+
+        Raises:
+            RuntimeError: If ffmpeg is missing or fails.
+            TimelineError: If no scene has a positive duration.
+        """
+        if not self.ffmpeg:
+            raise RuntimeError("ffmpeg was not found")
+        with tempfile.TemporaryDirectory(prefix="json2video-preview-") as workdir:
+            command = self.build_command(movie, output, workdir)
+            result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr[-2000:]}")
+        return output
+
+    def build_command(self, movie, output: str, workdir: str) -> List[str]:
+        """
+        Builds the ffmpeg command line of a preview.
+
+        Args:
+            movie (Movie | Dict): The movie, as SDK objects or serialized.
+            output (str): Path of the MP4 file to write.
+            workdir (str): Directory for the text files drawn by drawtext.
+
+        Returns:
+            List[str]: The command, ready for subprocess.run.
+
+        Raises:
+            TimelineError: If no scene has a positive duration.
+        """
+        timeline = resolve_timeline(movie, self.probe)
+        movie_width = _get(movie, "width", 640)
+        factor = self.width / movie_width
+        width = self.width // 2 * 2
+        height = max(int(_get(movie, "height", 360) * factor) // 2 * 2, 2)
+        graph = _Graph(self, factor, width, height, workdir)
+
+        current = None
+        for scene in timeline.scenes:
+            if scene.duration <= 0:
+                continue
+            color = _get(scene.scene, "background_color", "#000000")
+            label = graph.canvas(color, scene.duration)
+            label = graph.layers(label, scene.elements, scene.start)
+            label = graph.add(f"[{label}]fps={self.fps},format=yuv420p,settb=AVTB")
+            if current is None:
+                current = label
+                graph.length = scene.end
+                continue
+            transition = _get(scene.scene, "transition")
+            if transition and scene.start < graph.length:
+                style = _get(transition, "style", "fade")
+                duration = graph.length - scene.start
+                current = graph.add(
+                    f"[{current}][{label}]xfade=transition={style}:"
+                    f"duration={duration:.3f}:offset={scene.start:.3f}"
+                )
+            else:
+                current = graph.add(f"[{current}][{label}]concat=n=2:v=1:a=0")
+            graph.length = scene.end
+        if current is None:
+            raise TimelineError("Movie has no scene with a positive duration")
+        current = graph.layers(current, timeline.elements, 0.0)
+        audio = graph.audio(timeline)
+
+        command = [self.ffmpeg, "-y", "-hide_banner", "-loglevel", "error"]
+        command += graph.inputs
+        command += ["-filter_complex", ";".join(graph.filters), "-map", f"[{current}]"]
+        if audio is not None:
+            command += ["-map", f"[{audio}]", "-c:a", "aac", "-b:a", "64k"]
+        command += [
+            "-t",
+            f"{timeline.duration:.3f}",
+            "-r",
+            str(self.fps),
+            "-c:v",
+            "libx264",
+            "-preset",
+            "ultrafast",
+            "-crf",
+            "35",
+            "-pix_fmt",
+            "yuv420p",
+            output,
+        ]
+        return command
+
+
+class _Graph:
+    """Accumulates the inputs and filter chains of a preview."""
+
+    def __init__(self, renderer, factor, width, height, workdir):
+        self.renderer = renderer
+        self.factor = factor
+        self.width = width
+        self.height = height
+        self.workdir = workdir
+        self.inputs: List[str] = []
+        self.filters: List[str] = []
+        self.length = 0.0
+        self._labels = 0
+        self._input_count = 0
+
+    def add(self, chain: str) -> str:
+        self._labels += 1
+        label = f"l{self._labels}"
+        self.filters.append(f"{chain}[{label}]")
+        return label
+
+    def input(self, options: List[str], src: str) -> int:
+        self.inputs += options + ["-i", self.renderer.resolve_src(src)]
+        self._input_count += 1
+        return self._input_count - 1
+
+    def canvas(self, color: str, duration: float) -> str:
+        if color == "transparent":
+            color = "#000000"
+        return self.add(
+            f"color=c={color.replace('#', '0x')}:s={self.width}x{self.height}:"
+            f"r={self.renderer.fps}:d={duration:.3f}"
+        )
+
+    def layers(self, label: str, elements: List[TimedElement], offset: float) -> str:
+        # Draws the elements on a stream whose time 0 is offset in the movie.
+        ordered = sorted(elements, key=lambda e: _get(e.element, "z_index", 0))
+        for timed in ordered:
+            kind = _get(timed.element, "type")
+            start, end = timed.start - offset, timed.end - offset
+            if end <= start:
+                continue
+            if kind in VISUAL_TYPES and _get(timed.element, "src"):
+                label = self.overlay(label, timed.element, kind, start, end)
+            elif kind == "text":
+                label = self.text(label, timed.element, start, end)
+        return label
+
+    def _fades(self, element, length: float, alpha: bool) -> str:
+        chain = ""
+        suffix = ":alpha=1" if alpha else ""
+        fade_in = _get(element, "fade_in", 0)
+        fade_out = _get(element, "fade_out", 0)
+        if fade_in > 0:
+            chain += f",fade=t=in:st=0:d={fade_in:.3f}{suffix}"
+        if fade_out > 0:
+            chain += f",fade=t=out:st={max(length - fade_out, 0):.3f}:d={fade_out:.3f}{suffix}"
+        return chain
+
+    def overlay(self, label: str, element, kind: str, start: float, end: float) -> str:
+        length = end - start
+        options = ["-t", f"{length:.3f}"]
+        if kind == "image":
+            options = ["-loop", "1"] + options
+        else:
+            seek = _get(element, "seek", 0)
+            if seek:
+                options = ["-ss" if seek > 0 else "-sseof", f"{seek:.3f}"] + options
+            loop = _get(element, "loop", 1)
+            if loop == -1 or loop > 1:
+                options = ["-stream_loop", str(loop - 1 if loop > 1 else -1)] + options
+        index = self.input(options, _get(element, "src"))
+
+        w, h = _get(element, "width", -1), _get(element, "height", -1)
+        if w > 0 and h > 0:
+            size = f"{max(int(w * self.factor), 1)}:{max(int(h * self.factor), 1)}"
+        elif w > 0:
+            size = f"{max(int(w * self.factor), 1)}:-2"
+        elif h > 0:
+            size = f"-2:{max(int(h * self.factor), 1)}"
+        else:
+            size = f"iw*{self.factor:.6f}:-2"
+        layer = self.add(
+            f"[{index}:v]fps={self.renderer.fps},scale={size},setsar=1,format=yuva420p"
+            f"{self._fades(element, length, True)},setpts=PTS-STARTPTS+{start:.3f}/TB"
+        )
+        x, y = _POSITIONS.get(
+            _get(element, "position", "custom"),
+            (
+                f"{_get(element, 'x', 0) * self.factor:.1f}",
+                f"{_get(element, 'y', 0) * self.factor:.1f}",
+            ),
+        )
+        return self.add(
+            f"[{label}][{layer}]overlay=x={x}:y={y}:eof_action=pass:"
+            f"enable='between(t,{start:.3f},{end:.3f})'"
+        )
+
+    def text(self, label: str, element, start: float, end: float) -> str:
+        settings = _get(element, "settings", {})
+        # The text is read from a file so that it needs no filter escaping.
+        path = os.path.join(self.workdir, f"text{len(self.filters)}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(str(_get(element, "text", "")))
+        size = _number(settings.get("font-size"), 32) * self.factor
+        color = str(settings.get("font-color", settings.get("color", "white")))
+        x, y = _TEXT_POSITIONS.get(
+            _get(element, "position", "custom"),
+            (
+                f"{_get(element, 'x', 0) * self.factor:.1f}",
+                f"{_get(element, 'y', 0) * self.factor:.1f}",
+            ),
+        )
+        fade_in = _get(element, "fade_in", 0)
+        fade_out = _get(element, "fade_out", 0)
+        alpha = "1"
+        if fade_in > 0:
+            alpha = f"min({alpha},(t-{start:.3f})/{fade_in:.3f})"
+        if fade_out > 0:
+            alpha = f"min({alpha},({end:.3f}-t)/{fade_out:.3f})"
+        return self.add(
+            f"[{label}]drawtext=textfile='{path}':fontsize={max(size, 1):.1f}:"
+            f"fontcolor={color.replace('#', '0x')}:x={x}:y={y}:alpha='{alpha}':"
+            f"enable='between(t,{start:.3f},{end:.3f})'"
+        )
+
+    def audio(self, timeline) -> str:
+        timed = list(timeline.elements)
+        for scene in timeline.scenes:
+            timed.extend(scene.elements)
+        tracks = []
+        for element in timed:
+            item = element.element
+            if _get(item, "type") != "audio" or _get(item, "muted", False):
+                continue
+            length = element.end - element.start
+            if length <= 0 or not _get(item, "src"):
+                continue
+            options = ["-t", f"{length:.3f}"]
+            seek = _get(item, "seek", 0)
+            if seek:
+                options = ["-ss" if seek > 0 else "-sseof", f"{seek:.3f}"] + options
+            loop = _get(item, "loop", 1)
+            if loop == -1 or loop > 1:
+                options = ["-stream_loop", str(loop - 1 if loop > 1 else -1)] + options
+            index = self.input(options, _get(item, "src"))
+            delay = int(element.start * 1000)
+            chain = f"[{index}:a]asetpts=PTS-STARTPTS,volume={_get(item, 'volume', 1)}"
+            fade_in = _get(item, "fade_in", 0)
+            fade_out = _get(item, "fade_out", 0)
+            if fade_in > 0:
+                chain += f",afade=t=in:st=0:d={fade_in:.3f}"
+            if fade_out > 0:
+                chain += (
+                    f",afade=t=out:st={max(length - fade_out, 0):.3f}:d={fade_out:.3f}"
+                )
+            tracks.append(self.add(f"{chain},adelay={delay}:all=1"))
+        if not tracks:
+            return None
+        if len(tracks) == 1:
+            return tracks[0]
+        inputs = "".join(f"[{track}]" for track in tracks)
+        return self.add(f"{inputs}amix=inputs={len(tracks)}:normalize=0")
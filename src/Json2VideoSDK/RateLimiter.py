@@ -0,0 +1,157 @@
+import threading
+import time
+from typing import Dict, Mapping
+
+# Reset headers above this value are epoch timestamps rather than delays in seconds.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket that queues callers instead of failing them.
+
+    Callers are served in arrival order. The bucket refills at ``rate`` tokens per
+    second up to ``capacity``. Rate-limit headers returned by the API narrow the bucket
+    to the real remaining budget, and a 429 pauses every caller until it may retry.
+    """
+
+    def __init__(self, rate: float = 1, capacity: float = 5):
+        """
+        Initializes a RateLimiter object.
+
+        Args:
+            rate (float): Tokens added per second. Defaults to 1.
+            capacity (float): Maximum number of tokens, i.e. the allowed burst. Defaults to 5.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        # Last quota reported by the API, None until a response carried it.
+        self.limit: float = None
+        self.remaining: float = None
+        self.reset_at: float = None
+
+    def _refill(self, now: float):
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self, tokens: float = 1):
+        """Blocks until the caller's turn has come and the tokens are available."""
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            while True:
+                wait = None
+                if ticket == self._serving:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = max(
+                        self._paused_until - now,
+                        (tokens - self._tokens) / self.rate if self.rate > 0 else 1,
+                    )
+                    if wait <= 0:
+                        self._tokens -= tokens
+                        self._serving += 1
+                        self._condition.notify_all()
+                        return
+                self._condition.wait(wait)
+
+    def pause(self, seconds: float):
+        """Stops handing out tokens for the given number of seconds."""
+        with self._condition:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0)
+            self._condition.notify_all()
+
+    def update_from_headers(self, headers: Mapping[str, str], adapt: bool = True):
+        """
+        Adapts the bucket to the rate-limit headers of an API response.
+
+        X-RateLimit-Remaining caps the available tokens, and together with
+        X-RateLimit-Reset sets the refill rate that spreads the remaining budget until
+        the reset. X-RateLimit-Limit caps the burst. Retry-After pauses the bucket.
+
+        Args:
+            headers (Mapping[str, str]): Response headers (case-insensitive mapping).
+            adapt (bool): Take the rate and burst from the headers. When False, e.g. for a
+                quota over a longer period than the bucket's, the headers are only
+                recorded and pause the bucket once the quota is used up. Defaults to True.
+        """
+        limit = _number(headers.get("X-RateLimit-Limit"))
+        remaining = _number(headers.get("X-RateLimit-Remaining"))
+        reset = _number(headers.get("X-RateLimit-Reset"))
+        retry_after = _number(headers.get("Retry-After"))
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+            if reset is not None and reset > _EPOCH_THRESHOLD:
+                reset -= time.time()
+            if limit is not None:
+                self.limit = limit
+            if remaining is not None:
+                self.remaining = remaining
+            if reset is not None:
+                self.reset_at = time.time() + reset
+            if remaining is not None and remaining <= 0 and reset is not None:
+                self._paused_until = max(self._paused_until, now + reset)
+            if adapt:
+                if limit is not None and limit > 0:
+                    self.capacity = limit
+                if remaining is not None:
+                    self._tokens = min(self._tokens, remaining)
+                    if remaining > 0 and reset is not None and reset > 0:
+                        self.rate = remaining / reset
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            self._condition.notify_all()
+
+    @property
+    def budget(self) -> float:
+        """Tokens currently available."""
+        with self._condition:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a token."""
+        with self._condition:
+            return self._next_ticket - self._serving
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(api_key: str, rate: float = 1, capacity: float = 5) -> RateLimiter:
+    """
+    Returns the RateLimiter shared by all clients using an API key.
+
+    Args:
+        api_key (str): The API key the budget belongs to.
+        rate (float): Tokens added per second, used when the limiter is created. Defaults to 1.
+        capacity (float): Allowed burst, used when the limiter is created. Defaults to 5.
+
+    Returns:
+        RateLimiter: The limiter of the API key.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(api_key)
+        if limiter is None:
+            limiter = _limiters[api_key] = RateLimiter(rate, capacity)
+        return limiter
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+from .src.Movie import Movie
+from .src.Scene import Scene
+from .src.Config import DEFAULT_CACHE_DIR
+
+
+class RenderIndex:
+    """
+    A local index of the rendered scenes, keyed by content hash and movie settings.
+
+    Before a movie is submitted, prepare() gives every scene and element without an
+    explicit id a stable id derived from its content, reusing the id a scene was
+    rendered with before. Unchanged scenes then serialize exactly as in the previous
+    submission, so the API's scene cache (``cache: true``) can reuse their renders,
+    and only the changed scenes are rendered again.
+    """
+
+    def __init__(self, path: str = os.path.join(DEFAULT_CACHE_DIR, "renders.sqlite3")):
+        """
+        Initializes a RenderIndex object.
+
+        Args:
+            path (str): Path of the SQLite index. Defaults to ~/.cache/json2video/renders.sqlite3.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS scenes (hash TEXT PRIMARY KEY, data TEXT)"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(movie: Movie, scene: Scene) -> str:
+        """
+        Returns the index key of a scene rendered as part of a movie.
+
+        The key combines the scene's content hash with the movie settings that change
+        how it renders (resolution, size, quality and variables).
+
+        Args:
+            movie (Movie): The movie containing the scene.
+            scene (Scene): The scene.
+
+        Returns:
+            str: A SHA-256 hex digest.
+        """
+        context = {
+            "resolution": movie.resolution,
+            "width": movie.width,
+            "height": movie.height,
+            "quality": movie.quality,
+            "variables": movie.variables,
+            "scene": scene.content_hash(),
+        }
+        return hashlib.sha256(
+            json.dumps(
+                context, sort_keys=True, separators=(",", ":"), default=str
+            ).encode()
+        ).hexdigest()
+
+    def lookup(self, key: str) -> Dict:
+        """
+        Returns what is known about a rendered scene.
+
+        Args:
+            key (str): The RenderIndex.key() of the scene in its movie.
+
+        Returns:
+            Dict: "id", "project", "url" and "rendered" (epoch seconds), or None if the
+            scene was never rendered.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM scenes WHERE hash = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def prepare(self, movie: Movie) -> List[int]:
+        """
+        Assigns content-derived ids to the scenes and elements that have none.
+
+        Identical scenes or elements get distinct ids by adding a "-2", "-3", ...
+        suffix, and ids never collide with ids that were set explicitly.
+
+        Args:
+            movie (Movie): The movie about to be submitted.
+
+        Returns:
+            List[int]: Indexes of the scenes that were rendered before, in a movie with
+            the same settings, and should be served from the render cache.
+        """
+        reused = []
+        scene_ids = {scene.id for scene in movie.scenes if scene.id is not None}
+        element_ids = {
+            element.id
+            for scene in movie.scenes
+            for element in scene.elements
+            if element.id is not None
+        }
+        for index, scene in enumerate(movie.scenes):
+            known = self.lookup(self.key(movie, scene))
+            if known is not None:
+                reused.append(index)
+            for element in scene.elements:
+                if element.id is None:
+                    element.id = _unique(
+                        f"{element.type}-{element.content_hash()[:16]}", element_ids
+                    )
+            if scene.id is None:
+                scene.id = _unique(
+                    known["id"] if known else f"scene-{scene.content_hash()[:16]}",
+                    scene_ids,
+                )
+        return reused
+
+    def record(self, movie: Movie, project_id: str = None, url: str = None):
+        """
+        Records the scenes of a movie as rendered.
+
+        Args:
+            movie (Movie): The movie that was rendered, after prepare().
+            project_id (str): The project the movie was rendered in. Defaults to None.
+            url (str): URL of the rendered movie. Defaults to None.
+        """
+        now = time.time()
+        rows = {}
+        for scene in movie.scenes:
+            # Identical scenes share a key: keep the first one's id, the others are
+            # suffixed from it again by the next prepare().
+            rows.setdefault(
+                self.key(movie, scene),
+                json.dumps(
+                    {"id": scene.id, "project": project_id, "url": url, "rendered": now}
+                ),
+            )
+        with self._lock:
+            self._db.executemany("REPLACE INTO scenes VALUES (?, ?)", rows.items())
+            self._db.commit()
+
+    def close(self):
+        """Closes the index."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _unique(candidate: str, used: set) -> str:
+    """Returns candidate, suffixed if needed to differ from the used ids, and records it."""
+    unique, n = candidate, 1
+    while unique in used:
+        n += 1
+        unique = f"{candidate}-{n}"
+    used.add(unique)
+    return unique
@@ -0,0 +1,133 @@
+import json
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict
+
+from .JobTracker import JobTracker
+from .src.Movie import Movie
+
+
+class WebhookReceiver:
+    """
+    A small in-process HTTP server that receives JSON2Video completion webhooks.
+
+    Movies registered with the receiver get a webhook export pointing at it, and
+    every callback resolves the matching job of the JobTracker the moment it
+    arrives, without polling the API.
+    """
+
+    def __init__(
+        self,
+        tracker: JobTracker,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/json2video/webhook",
+        public_url: str = None,
+    ):
+        """
+        Initializes a WebhookReceiver object and starts listening.
+
+        Args:
+            tracker (JobTracker): Tracker whose jobs are resolved by the callbacks.
+            host (str): Interface to listen on. Defaults to "127.0.0.1".
+            port (int): Port to listen on. 0 picks a free port. Defaults to 0.
+            path (str): URL path of the webhook endpoint. Defaults to "/json2video/webhook".
+            public_url (str): URL under which the API can reach the endpoint, e.g. behind
+                a tunnel or reverse proxy. Defaults to the local address.
+        """
+        self.tracker = tracker
+        self.path = path
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self.url = public_url or (
+            f"http://{host}:{self._server.server_address[1]}{self.path}"
+        )
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="json2video-webhook", daemon=True
+        )
+        self._thread.start()
+
+    def _make_handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split("?", 1)[0] != receiver.path:
+                    self.send_error(404)
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self.send_error(400, "Invalid JSON")
+                    return
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                receiver.handle(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def handle(self, payload: Dict):
+        """
+        Resolves the tracked job matching a webhook payload.
+
+        Payloads without a status are completion notices and count as "done".
+
+        Args:
+            payload (Dict): The JSON body posted by the API.
+        """
+        if not isinstance(payload, dict) or "project" not in payload:
+            print(f"Ignoring webhook without a project: {payload}")
+            return
+        record = dict(payload)
+        if "status" not in record:
+            record["status"] = "done" if record.get("success", True) else "error"
+        self.tracker.notify(record["project"], record)
+
+    def register(self, movie: Movie):
+        """
+        Adds a webhook export pointing at this receiver to the movie.
+
+        Nothing is added when one of the movie's exports already has this destination,
+        so a movie can be submitted again without being notified twice.
+        """
+        destination = {"type": "webhook", "endpoint": self.url}
+        for export in movie.exports or []:
+            if destination in export.get("destinations", []):
+                return
+        movie.add_export({"destinations": [destination]})
+
+    def submit(
+        self, movie: Movie, callback: Callable[[Future], None] = None, **kwargs
+    ) -> Future:
+        """
+        Registers the webhook on the movie, creates it and tracks it without polling.
+
+        Args:
+            movie (Movie): The movie to create.
+            callback (Callable[[Future], None]): Called with the future once the render finishes. Defaults to None.
+            **kwargs: Passed to Client.create_movie.
+
+        Returns:
+            Future: Resolves to the webhook payload, or fails with RenderError.
+        """
+        self.register(movie)
+        response = self.tracker.client.create_movie(movie, **kwargs)
+        return self.tracker.track(response["project"], callback=callback, poll=False)
+
+    def close(self):
+        """Stops the HTTP server."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
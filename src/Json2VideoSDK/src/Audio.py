@@ -1,11 +1,33 @@
 from typing import Dict
 
+from .Element import Element
 
-class Audio:
+
+class Audio(Element):
     """
     A class representing the audio element schema for the JSON2Video API.
     """
 
+    __slots__ = (
+        "src",
+        "type",
+        "cache",
+        "comment",
+        "condition",
+        "duration",
+        "extra_time",
+        "fade_in",
+        "fade_out",
+        "id",
+        "loop",
+        "muted",
+        "seek",
+        "start",
+        "variables",
+        "volume",
+        "z_index",
+    )
+
     def __init__(
         self,
         src: str,
@@ -48,75 +70,4 @@ class Audio:
             volume (float): Volume gain of the audio. Defaults to 1.
             z_index (int): Element's z-index. Defaults to 0.
         """
-        self.src = src
-        self.type = type
-        self.cache = cache
-        self.comment = comment
-        self.condition = condition
-        self.duration = duration
-        self.extra_time = extra_time
-        self.fade_in = fade_in
-        self.fade_out = fade_out
-        self.id = id
-        self.loop = loop
-        self.muted = muted
-        self.seek = seek
-        self.start = start
-        self.variables = variables if variables is not None else {}
-        self.volume = volume
-        self.z_index = z_index
-
-    # ... (setter methods for each attribute) ...
-    def set_id(self, id: str):
-        """Sets the ID of the audio."""
-        self.id = id
-
-    def set_loop(self, loop: int):
-        """Sets the number of loops."""
-        self.loop = loop
-
-    def set_muted(self, muted: bool):
-        """Sets mute status."""
-        self.muted = muted
-
-    def set_seek(self, seek: float):
-        """Sets seek time."""
-        self.seek = seek
-
-    def set_start(self, start: float):
-        """Sets start time."""
-        self.start = start
-
-    def set_variables(self, variables: Dict):
-        """Sets variables."""
-        self.variables = variables
-
-    def set_volume(self, volume: float):
-        """Sets volume."""
-        self.volume = volume
-
-    def set_z_index(self, z_index: int):
-        """Sets z-index."""
-        self.z_index = z_index
-
-    def to_dict(self) -> Dict:
-        """Returns a dictionary representing the Audio object."""
-        return {
-            "src": self.src,
-            "type": self.type,
-            "cache": self.cache,
-            "comment": self.comment,
-            "condition": self.condition,
-            "duration": self.duration,
-            "extra_time": self.extra_time,
-            "fade_in": self.fade_in,
-            "fade_out": self.fade_out,
-            "id": self.id,
-            "loop": self.loop,
-            "muted": self.muted,
-            "seek": self.seek,
-            "start": self.start,
-            "variables": self.variables,
-            "volume": self.volume,
-            "z_index": self.z_index,
-        }
+        self._init_fields(locals())
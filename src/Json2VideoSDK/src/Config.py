@@ -0,0 +1,4 @@
+import os
+
+# Directory of the SDK's on-disk caches (compiled schema, probes, render index).
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "json2video")
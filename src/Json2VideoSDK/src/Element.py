@@ -0,0 +1,77 @@
+from typing import Callable, Dict, Tuple
+
+from .Schema import compact_dict
+from .Tracked import Tracked
+
+
+def _make_setter(name: str):
+    def setter(self, value):
+        setattr(self, name, value)
+
+    setter.__name__ = f"set_{name}"
+    setter.__doc__ = f"Sets {name.replace('_', ' ')}."
+    return setter
+
+
+def _make_builder(fields: Tuple[str, ...]) -> Callable[["Element"], Dict]:
+    # A dict literal over the fields is faster than building the dict from pairs.
+    items = ", ".join(f"{name!r}: self.{name}" for name in fields)
+    namespace = {}
+    exec(f"def _plain_dict(self):\n    return {{{items}}}", namespace)
+    return namespace["_plain_dict"]
+
+
+class Element(Tracked):
+    """
+    A base class for the element schemas of the JSON2Video API.
+
+    Subclasses declare their fields in ``__slots__``, in serialization order.
+    The base class derives ``to_dict()``, from a dict literal generated for each
+    subclass, and a ``set_*`` method for every field that does not define its own,
+    so instances carry no per-object ``__dict__``.
+    """
+
+    __slots__ = ("_owners", "_cache")
+
+    # Fields that default to a fresh empty dict when passed as None.
+    _dict_fields = frozenset({"settings", "variables"})
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(cls.__dict__.get("__slots__", ()))
+        cls._plain_dict = _make_builder(cls._fields)
+        for name in cls._fields:
+            if not hasattr(cls, f"set_{name}"):
+                setattr(cls, f"set_{name}", _make_setter(name))
+
+    def _init_fields(self, values: Dict):
+        """Assigns every declared field from the constructor's arguments."""
+        self._init_tracking()
+        for name in self._fields:
+            value = values[name]
+            if value is None and name in self._dict_fields:
+                value = {}
+            object.__setattr__(self, name, value)
+
+    def to_dict(self, compact: bool = False) -> Dict:
+        """
+        Returns a dictionary representing the element.
+
+        Args:
+            compact (bool): Omit None values and values equal to the schema defaults. Defaults to False.
+        """
+        return dict(self._serialize(compact))
+
+    def _serialize(self, compact: bool) -> Dict:
+        """Returns the cached dictionary of the element, shared and read-only."""
+        data = self._cache.get(compact)
+        if data is None:
+            data = self._cache[compact] = self._build_dict(compact)
+        return data
+
+    def _build_dict(self, compact: bool) -> Dict:
+        data = self._plain_dict()
+        if compact:
+            return compact_dict(data, self.type)
+        return data
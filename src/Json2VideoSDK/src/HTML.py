@@ -1,11 +1,49 @@
 from typing import Dict
 
+from .Element import Element
 
-class HTML:
+
+class HTML(Element):
     """
     A class representing the HTML element schema for the JSON2Video API.
     """
 
+    __slots__ = (
+        "type",
+        "cache",
+        "chroma_key",
+        "comment",
+        "condition",
+        "correction",
+        "crop",
+        "duration",
+        "extra_time",
+        "fade_in",
+        "fade_out",
+        "flip_horizontal",
+        "flip_vertical",
+        "height",
+        "html",
+        "id",
+        "mask",
+        "pan",
+        "pan_crop",
+        "pan_distance",
+        "position",
+        "rotate",
+        "scale",
+        "src",
+        "start",
+        "tailwindcss",
+        "variables",
+        "wait",
+        "width",
+        "x",
+        "y",
+        "z_index",
+        "zoom",
+    )
+
     def __init__(
         self,
         type: str = "html",
@@ -80,143 +118,4 @@ class HTML:
             z_index (int): Element's z-index. Defaults to 0.
             zoom (int): Zooms the element with the specified level percentage. Defaults to 0.
         """
-        self.type = type
-        self.cache = cache
-        self.chroma_key = chroma_key
-        self.comment = comment
-        self.condition = condition
-        self.correction = correction
-        self.crop = crop
-        self.duration = duration
-        self.extra_time = extra_time
-        self.fade_in = fade_in
-        self.fade_out = fade_out
-        self.flip_horizontal = flip_horizontal
-        self.flip_vertical = flip_vertical
-        self.height = height
-        self.html = html
-        self.id = id
-        self.mask = mask
-        self.pan = pan
-        self.pan_crop = pan_crop
-        self.pan_distance = pan_distance
-        self.position = position
-        self.rotate = rotate
-        self.scale = scale
-        self.src = src
-        self.start = start
-        self.tailwindcss = tailwindcss
-        self.variables = variables if variables is not None else {}
-        self.wait = wait
-        self.width = width
-        self.x = x
-        self.y = y
-        self.z_index = z_index
-        self.zoom = zoom
-
-    # ... (setter methods for each attribute) ...
-    def set_id(self, id: str):
-        """Sets the ID of the HTML element."""
-        self.id = id
-
-    def set_mask(self, mask: str):
-        """Sets the mask."""
-        self.mask = mask
-
-    def set_pan(self, pan: str):
-        """Sets panning."""
-        self.pan = pan
-
-    def set_pan_crop(self, pan_crop: bool):
-        """Sets pan crop."""
-        self.pan_crop = pan_crop
-
-    def set_pan_distance(self, pan_distance: float):
-        """Sets pan distance."""
-        self.pan_distance = pan_distance
-
-    def set_position(self, position: str):
-        """Sets position."""
-        self.position = position
-
-    def set_rotate(self, rotate: Dict):
-        """Sets rotation."""
-        self.rotate = rotate
-
-    def set_scale(self, scale: Dict):
-        """Sets scale (deprecated)."""
-        self.scale = scale
-
-    def set_src(self, src: str):
-        """Sets the source URL."""
-        self.src = src
-
-    def set_start(self, start: float):
-        """Sets start time."""
-        self.start = start
-
-    def set_tailwindcss(self, tailwindcss: bool):
-        """Sets whether to use TailwindCSS."""
-        self.tailwindcss = tailwindcss
-
-    def set_variables(self, variables: Dict):
-        """Sets variables."""
-        self.variables = variables
-
-    def set_wait(self, wait: float):
-        """Sets wait time."""
-        self.wait = wait
-
-    def set_width(self, width: int):
-        """Sets width."""
-        self.width = width
-
-    def set_x(self, x: int):
-        """Sets x coordinate."""
-        self.x = x
-
-    def set_y(self, y: int):
-        """Sets y coordinate."""
-        self.y = y
-
-    def set_z_index(self, z_index: int):
-        """Sets z-index."""
-        self.z_index = z_index
-
-    def to_dict(self) -> Dict:
-        """Returns a dictionary representing the Html object."""
-        return {
-            "type": self.type,
-            "cache": self.cache,
-            "chroma_key": self.chroma_key,
-            "comment": self.comment,
-            "condition": self.condition,
-            "correction": self.correction,
-            "crop": self.crop,
-            "duration": self.duration,
-            "extra_time": self.extra_time,
-            "fade_in": self.fade_in,
-            "fade_out": self.fade_out,
-            "flip_horizontal": self.flip_horizontal,
-            "flip_vertical": self.flip_vertical,
-            "height": self.height,
-            "html": self.html,
-            "id": self.id,
-            "mask": self.mask,
-            "pan": self.pan,
-            "pan_crop": self.pan_crop,
-            "pan_distance": self.pan_distance,
-            "position": self.position,
-            "rotate": self.rotate,
-            "scale": self.scale,
-            "src": self.src,
-            "start": self.start,
-            "tailwindcss": self.tailwindcss,
-            "variables": self.variables,
-            "wait": self.wait,
-            "width": self.width,
-            "x": self.x,
-            "y": self.y,
-            "z_index": self.z_index,
-            "zoom": self.zoom,
-        }
+        self._init_fields(locals())
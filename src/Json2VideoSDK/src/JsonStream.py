@@ -0,0 +1,121 @@
+import json
+from typing import Callable, Dict, Iterable, Iterator
+
+from .Movie import Movie
+from .Scene import Scene
+
+# Same separators as json.dumps, so streamed and buffered payloads are identical.
+_encode = json.JSONEncoder().encode
+
+
+class _Streamed:
+    """Placeholder for a child array that is written lazily by the encoder."""
+
+    __slots__ = ("items", "iter_item")
+
+    def __init__(self, items: Iterable, iter_item: Callable[[object], Iterator[str]]):
+        self.items = items
+        self.iter_item = iter_item
+
+
+def _iter_array(streamed: _Streamed) -> Iterator[str]:
+    yield "["
+    for index, item in enumerate(streamed.items):
+        if index:
+            yield ", "
+        yield from streamed.iter_item(item)
+    yield "]"
+
+
+def _iter_object(data: Dict) -> Iterator[str]:
+    yield "{"
+    for index, (key, value) in enumerate(data.items()):
+        yield f"{', ' if index else ''}{_encode(key)}: "
+        if isinstance(value, _Streamed):
+            yield from _iter_array(value)
+        else:
+            yield _encode(value)
+    yield "}"
+
+
+def iter_movie_json(
+    movie: Movie, compact: bool = False, cache: bool = False
+) -> Iterator[str]:
+    """
+    Serializes a Movie to JSON piece by piece.
+
+    The movie is walked Movie -> Scene -> element and each element is encoded on its
+    own, so neither the full dictionary tree nor the full JSON string is ever built.
+    Dictionaries already cached by to_dict() are reused, and nothing new is kept
+    unless cache is set. Joining the pieces gives the same document as
+    json.dumps(movie.to_dict(compact)).
+
+    Args:
+        movie (Movie): The movie to serialize.
+        compact (bool): Omit None values and values equal to the schema defaults. Defaults to False.
+        cache (bool): Keep the encoded elements and scenes on the objects until they change,
+            so streaming the movie again only encodes the changed parts. Costs about
+            twice the payload size in memory. Defaults to False.
+
+    Returns:
+        Iterator[str]: JSON text fragments.
+    """
+    key = ("json", compact)
+
+    def encode_element(element) -> str:
+        data = element._cache.get(compact)
+        return _encode(data if data is not None else element._build_dict(compact))
+
+    def iter_element(element) -> Iterator[str]:
+        if cache:
+            yield element._cached(key, lambda: encode_element(element))
+        else:
+            yield encode_element(element)
+
+    def iter_scene(scene: Scene) -> Iterator[str]:
+        data = scene._cache.get(compact)
+        if data is not None:
+            yield _encode(data)
+            return
+        elements = _Streamed(scene.elements, iter_element)
+        if cache:
+            yield scene._cached(
+                key, lambda: "".join(_iter_object(scene._build_dict(elements, compact)))
+            )
+        else:
+            yield from _iter_object(scene._build_dict(elements, compact))
+
+    scenes = _Streamed(movie.scenes, iter_scene)
+    elements = _Streamed(movie.elements, iter_element)
+    yield from _iter_object(movie._build_dict(scenes, elements, compact))
+
+
+def iter_movie_chunks(
+    movie: Movie,
+    compact: bool = False,
+    chunk_size: int = 64 * 1024,
+    cache: bool = False,
+) -> Iterator[bytes]:
+    """
+    Groups the output of iter_movie_json into UTF-8 chunks for a chunked HTTP body.
+
+    Args:
+        movie (Movie): The movie to serialize.
+        compact (bool): Omit None values and values equal to the schema defaults. Defaults to False.
+        chunk_size (int): Approximate size of each chunk in bytes. Defaults to 64 KiB.
+        cache (bool): Keep the encoded fragments on the objects, see iter_movie_json. Defaults to False.
+
+    Returns:
+        Iterator[bytes]: Encoded chunks of the movie JSON.
+    """
+    buffer = []
+    size = 0
+    for piece in iter_movie_json(movie, compact, cache):
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
@@ -6,17 +6,22 @@ from .Component import Component
 from .HTML import HTML
 from .Image import Image
 from .Scene import Scene
+from .Schema import compact_dict
 from .Subtitles import Subtitles
+from .Template import Template
 from .Text import Text
+from .Tracked import Tracked
 from .Video import Video
 from .Voice import Voice
 
 
-class Movie:
+class Movie(Tracked):
     """
     A class representing the movie schema for the JSON2Video API.
     """
 
+    _child_fields = ("scenes", "elements")
+
     def __init__(
         self,
         scenes: List[Scene] = [],
@@ -32,6 +37,7 @@ class Movie:
             | Text
             | HTML
             | Component
+            | Template
             | Audio
             | Voice
             | Audiogram
@@ -59,6 +65,7 @@ class Movie:
             quality (str): Quality of the final rendered movie. Defaults to "high".
             variables (Dict): Variables of the template. Defaults to None.
         """
+        self._init_tracking()
         self.scenes = scenes
         self.resolution = resolution
         self.width = width
@@ -75,6 +82,7 @@ class Movie:
     def add_scene(self, scene: Scene):
         """Adds a scene to the list of scenes."""
         self.scenes.append(scene)
+        self._adopt(scene)
 
     def set_resolution(self, resolution: str):
         """Sets the resolution of the movie."""
@@ -108,6 +116,7 @@ class Movie:
             | Text
             | HTML
             | Component
+            | Template
             | Audio
             | Voice
             | Audiogram
@@ -116,10 +125,12 @@ class Movie:
     ):
         """Adds an element to the list of elements."""
         self.elements.append(element)
+        self._adopt(element)
 
     def add_export(self, export: Dict):
         """Adds an export to the list of exports."""
         self.exports.append(export)
+        self.mark_dirty()
 
     def set_id(self, id: str):
         """Sets the movie ID string."""
@@ -133,31 +144,60 @@ class Movie:
         """Sets the variables of the template."""
         self.variables = variables
 
-    def to_dict(self) -> Dict:
-        """Returns a dictionary representing the Movie object."""
-        return {
-            "scenes": self.scenesToDict(),
+    def to_dict(self, compact: bool = False) -> Dict:
+        """
+        Returns a dictionary representing the Movie object.
+
+        Args:
+            compact (bool): Omit None values and values equal to the schema defaults,
+                in the movie, its scenes and its elements. Defaults to False.
+        """
+        data = dict(self._serialize(compact))
+        if "scenes" in data:
+            data["scenes"] = [Scene._copy_dict(scene) for scene in data["scenes"]]
+        if "elements" in data:
+            data["elements"] = [dict(element) for element in data["elements"]]
+        return data
+
+    def _serialize(self, compact: bool) -> Dict:
+        """Returns the cached dictionary of the movie, shared and read-only."""
+        data = self._cache.get(compact)
+        if data is None:
+            data = self._cache[compact] = self._build_dict(
+                [scene._serialize(compact) for scene in self.scenes],
+                [element._serialize(compact) for element in self.elements],
+                compact,
+            )
+        return data
+
+    def _build_dict(self, scenes, elements, compact: bool) -> Dict:
+        """Builds the movie dictionary around already serialized scenes and elements."""
+        data = {
+            "scenes": scenes,
             "resolution": self.resolution,
             "width": self.width,
             "height": self.height,
             "cache": self.cache,
             "comment": self.comment,
             "draft": self.draft,
-            "elements": self.elementsToDict(),
+            "elements": elements,
             "exports": self.exports,
             "id": self.id,
             "quality": self.quality,
             "variables": self.variables,
         }
+        if compact:
+            return compact_dict(data, "movie")
+        return data
 
-    def scenesToDict(self):
+    def scenesToDict(self, compact: bool = False):
         scenesDict = []
         for scene in self.scenes:
-            scenesDict.append(scene.to_dict())
+            scenesDict.append(scene.to_dict(compact))
         return scenesDict
 
-    def elementsToDict(self):
+    def elementsToDict(self, compact: bool = False):
         elementsDict = []
         for element in self.elements:
-            elementsDict.append(element.to_dict())
+            elementsDict.append(element.to_dict(compact))
         return elementsDict
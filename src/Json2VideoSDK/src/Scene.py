@@ -4,17 +4,21 @@ from .Audiogram import Audiogram
 from .Component import Component
 from .HTML import HTML
 from .Image import Image
+from .Schema import compact_dict
 from .Subtitles import Subtitles
 from .Text import Text
+from .Tracked import Tracked
 from .Video import Video
 from .Voice import Voice
 
 
-class Scene:
+class Scene(Tracked):
     """
     A class representing the scene schema for the JSON2Video API.
     """
 
+    _child_fields = ("elements",)
+
     def __init__(
         self,
         duration: float = -1,
@@ -51,6 +55,7 @@ class Scene:
             transition (Dict): Transition effect for the scene. Defaults to None.
             variables (Dict): Local variables of the scene. Defaults to None.
         """
+        self._init_tracking()
         self.duration = duration
         self.background_color = background_color
         self.cache = cache
@@ -97,6 +102,7 @@ class Scene:
     ):
         """Adds an element to the list of elements."""
         self.elements.append(element)
+        self._adopt(element)
 
     def set_id(self, id: str):
         """Sets the ID of the scene."""
@@ -110,22 +116,50 @@ class Scene:
         """Sets the local variables of the scene."""
         self.variables = variables
 
-    def to_dict(self) -> Dict:
-        """Returns a dictionary representing the Scene object."""
-        return {
+    def to_dict(self, compact: bool = False) -> Dict:
+        """
+        Returns a dictionary representing the Scene object.
+
+        Args:
+            compact (bool): Omit None values and values equal to the schema defaults. Defaults to False.
+        """
+        return self._copy_dict(self._serialize(compact))
+
+    @staticmethod
+    def _copy_dict(data: Dict) -> Dict:
+        """Copies a serialized scene down to the dictionaries of its elements."""
+        data = dict(data)
+        if "elements" in data:
+            data["elements"] = [dict(element) for element in data["elements"]]
+        return data
+
+    def _serialize(self, compact: bool) -> Dict:
+        """Returns the cached dictionary of the scene, shared and read-only."""
+        data = self._cache.get(compact)
+        if data is None:
+            elements = [element._serialize(compact) for element in self.elements]
+            data = self._cache[compact] = self._build_dict(elements, compact)
+        return data
+
+    def _build_dict(self, elements, compact: bool) -> Dict:
+        """Builds the scene dictionary around already serialized elements."""
+        data = {
             "duration": self.duration,
             "background-color": self.background_color,
             "cache": self.cache,
             "comment": self.comment,
             "condition": self.condition,
-            "elements": self.elementsToDict(),
+            "elements": elements,
             "id": self.id,
             "transition": self.transition,
             "variables": self.variables,
         }
+        if compact:
+            return compact_dict(data, "scene")
+        return data
 
-    def elementsToDict(self):
+    def elementsToDict(self, compact: bool = False):
         elementsDict = []
         for element in self.elements:
-            elementsDict.append(element.to_dict())
+            elementsDict.append(element.to_dict(compact))
         return elementsDict
@@ -0,0 +1,171 @@
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+import yaml
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "schema.yaml")
+
+_MISSING = object()
+
+# Element types in the order of the movie and scene "elements" anyOf lists.
+ELEMENT_TYPES = (
+    "video",
+    "image",
+    "text",
+    "html",
+    "component",
+    "template",
+    "audio",
+    "voice",
+    "audiogram",
+    "subtitles",
+)
+
+# Documentation keys that a model does not need to produce a valid movie.
+STRIPPED_KEYS = frozenset({"description", "example", "examples"})
+
+
+@lru_cache(maxsize=None)
+def load_schema(path: str = SCHEMA_PATH) -> Dict:
+    """
+    Loads the JSON2Video schemas from schema.yaml.
+
+    Args:
+        path (str): Path to the schema file. Defaults to the bundled schema.yaml.
+
+    Returns:
+        Dict: The "schemas" mapping, keyed by schema name (movie, scene, video, ...).
+    """
+    with open(path, "r") as f:
+        return yaml.safe_load(f)["schemas"]
+
+
+@lru_cache(maxsize=None)
+def get_defaults(schema_name: str) -> Dict[str, Any]:
+    """
+    Returns the default values declared for a schema's properties.
+
+    The schema uses hyphenated property names ('z-index') while the SDK emits
+    underscored ones ('z_index'), so every default is stored under both spellings.
+
+    Args:
+        schema_name (str): Name of the schema, e.g. "movie", "scene" or an element type.
+
+    Returns:
+        Dict[str, Any]: Property name to default value. Empty for unknown schemas.
+    """
+    properties = load_schema().get(schema_name, {}).get("properties", {})
+    defaults = {}
+    for key, spec in properties.items():
+        if isinstance(spec, dict) and "default" in spec:
+            defaults[key] = spec["default"]
+            defaults[key.replace("-", "_")] = spec["default"]
+    return defaults
+
+
+def _is_default(value: Any, default: Any) -> bool:
+    # Keep True/False apart from 1/0, but let 0 match 0.0.
+    if default is _MISSING or isinstance(value, bool) != isinstance(default, bool):
+        return False
+    return value == default
+
+
+def compact_dict(data: Dict, schema_name: str) -> Dict:
+    """
+    Drops None values and values equal to the schema defaults.
+
+    Args:
+        data (Dict): A serialized movie, scene or element.
+        schema_name (str): Name of the schema providing the defaults.
+
+    Returns:
+        Dict: A new dictionary without the omitted keys.
+    """
+    defaults = get_defaults(schema_name)
+    return {
+        key: value
+        for key, value in data.items()
+        if value is not None and not _is_default(value, defaults.get(key, _MISSING))
+    }
+
+
+def compact_schema(element_types: Iterable[str], path: str = SCHEMA_PATH) -> Dict:
+    """
+    Returns the subset of the schema needed to build a movie from some element types.
+
+    Only the movie, scene and given element schemas are kept, references to other
+    element types are dropped from the "elements" lists, and descriptions and
+    examples are stripped.
+
+    Args:
+        element_types (Iterable[str]): Element types the movie uses, e.g. ["video", "text"].
+        path (str): Path to the schema file. Defaults to the bundled schema.yaml.
+
+    Returns:
+        Dict: A mapping shaped like schema.yaml, i.e. {"schemas": {...}}.
+    """
+    schemas = load_schema(path)
+    wanted = set(element_types)
+    keep = ["movie", "scene"] + [t for t in ELEMENT_TYPES if t in wanted]
+    return {
+        "schemas": {
+            name: _strip(schemas[name], keep) for name in keep if name in schemas
+        }
+    }
+
+
+def _strip(node: Any, keep: list) -> Any:
+    if isinstance(node, list):
+        return [_strip(item, keep) for item in node]
+    if not isinstance(node, dict):
+        return node
+    stripped = {}
+    for key, value in node.items():
+        if key in STRIPPED_KEYS:
+            continue
+        if key == "properties":
+            stripped[key] = {name: _strip(spec, keep) for name, spec in value.items()}
+        elif key == "anyOf":
+            stripped[key] = [
+                _strip(item, keep)
+                for item in value
+                if "$ref" not in item or item["$ref"].rsplit("/", 1)[-1] in keep
+            ]
+        else:
+            stripped[key] = _strip(value, keep)
+    return stripped
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimates the number of model tokens in a text (about 4 characters each)."""
+    return (len(text) + 3) // 4
+
+
+def schema_prompt(
+    element_types: Iterable[str],
+    count_tokens: Callable[[str], int] = estimate_tokens,
+    path: str = SCHEMA_PATH,
+) -> Tuple[str, Dict[str, int]]:
+    """
+    Serializes the compact schema for a prompt and measures the saving.
+
+    Args:
+        element_types (Iterable[str]): Element types the movie uses.
+        count_tokens (Callable[[str], int]): Token counter, e.g. backed by the model's
+            count_tokens. Defaults to estimate_tokens.
+        path (str): Path to the schema file. Defaults to the bundled schema.yaml.
+
+    Returns:
+        Tuple[str, Dict[str, int]]: The JSON text ({"schema": {...}}, like yaml_do_json
+        in app.py) and the token counts of the full and compact schema under
+        "before" and "after".
+    """
+    compact = json.dumps(
+        {"schema": compact_schema(element_types, path)},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    full = json.dumps({"schema": {"schemas": load_schema(path)}})
+    return compact, {"before": count_tokens(full), "after": count_tokens(compact)}
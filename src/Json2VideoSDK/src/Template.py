@@ -0,0 +1,117 @@
+from typing import Dict
+
+from .Element import Element
+
+
+class Template(Element):
+    """
+    A class representing the template element schema for the JSON2Video API.
+
+    Templates are only allowed in the movie's elements, not in scenes.
+    """
+
+    __slots__ = (
+        "src",
+        "type",
+        "cache",
+        "chroma_key",
+        "comment",
+        "condition",
+        "correction",
+        "crop",
+        "duration",
+        "extra_time",
+        "fade_in",
+        "fade_out",
+        "flip_horizontal",
+        "flip_vertical",
+        "height",
+        "id",
+        "mask",
+        "pan",
+        "pan_crop",
+        "pan_distance",
+        "position",
+        "rotate",
+        "scale",
+        "settings",
+        "start",
+        "variables",
+        "width",
+        "x",
+        "y",
+        "z_index",
+        "zoom",
+    )
+
+    def __init__(
+        self,
+        src: str,
+        type: str = "template",
+        cache: bool = True,
+        chroma_key: Dict = None,
+        comment: str = None,
+        condition: str = None,
+        correction: Dict = None,
+        crop: Dict = None,
+        duration: float = -2,
+        extra_time: float = 0,
+        fade_in: float = None,
+        fade_out: float = None,
+        flip_horizontal: bool = False,
+        flip_vertical: bool = False,
+        height: int = -1,
+        id: str = None,
+        mask: str = None,
+        pan: str = None,
+        pan_crop: bool = True,
+        pan_distance: float = 0.1,
+        position: str = "custom",
+        rotate: Dict = None,
+        scale: Dict = None,  # Deprecated, use width and height instead
+        settings: Dict = None,
+        start: float = 0,
+        variables: Dict = None,
+        width: int = -1,
+        x: int = 0,
+        y: int = 0,
+        z_index: int = 0,
+        zoom: int = 0,
+    ):
+        """
+        Initializes a Template object.
+
+        Args:
+            src (str): ID of the template.
+            type (str): Type of the element. Defaults to "template".
+            cache (bool): Use the cached version of the element if its available. Defaults to True.
+            chroma_key (Dict): Allows to define a color (or a range of colors) that will be converted to transparent. Defaults to None.
+            comment (str): Used for adding your comments. Defaults to None.
+            condition (str): Condition to be met for the element to be rendered. Defaults to None.
+            correction (Dict): Allows to adjust the contrast, brightness, saturation and gamma of the element. Defaults to None.
+            crop (Dict): Crops the element. Defaults to None.
+            duration (float): Element's duration in seconds. Defaults to -2.
+            extra_time (float): Element's time span added after the playback. Defaults to 0.
+            fade_in (float): Adds a fade in effect to the element. Value in seconds. Defaults to None.
+            fade_out (float): Adds a fade out effect to the element. Value in seconds. Defaults to None.
+            flip_horizontal (bool): Flips the element horizontally. Defaults to False.
+            flip_vertical (bool): Flips the element vertically. Defaults to False.
+            height (int): Sets the height of the element. Defaults to -1.
+            id (str): ID of the element. Defaults to None.
+            mask (str): URL to a PNG or video file defining a mask for the element. Defaults to None.
+            pan (str): Pans the element to the specified direction. Defaults to None.
+            pan_crop (bool): Enable or disable the crop effect when panning. Defaults to True.
+            pan_distance (float): Pans the element to the specified distance. Defaults to 0.1.
+            position (str): Sets the element position in the scene. Defaults to "custom".
+            rotate (Dict): Rotates the element. Defaults to None.
+            scale (Dict): This property is deprecated. Use 'width' and 'height' instead. Defaults to None.
+            settings (Dict): Settings to be passed to the template. Defaults to None.
+            start (float): Element's starting time in seconds relative to the container scene. Defaults to 0.
+            variables (Dict): Variables passed to the template. Defaults to None.
+            width (int): Sets the width of the element. Defaults to -1.
+            x (int): Sets the horizontal position of the element in the scene. Defaults to 0.
+            y (int): Sets the vertical position of the element in the scene. Defaults to 0.
+            z_index (int): Element's z-index. Defaults to 0.
+            zoom (int): Zooms the element with the specified level percentage. Defaults to 0.
+        """
+        self._init_fields(locals())
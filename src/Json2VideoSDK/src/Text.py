@@ -1,11 +1,48 @@
 from typing import Dict
 
+from .Element import Element
 
-class Text:
+
+class Text(Element):
     """
     A class representing the text element schema for the JSON2Video API.
     """
 
+    __slots__ = (
+        "text",
+        "type",
+        "cache",
+        "chroma_key",
+        "comment",
+        "condition",
+        "correction",
+        "crop",
+        "duration",
+        "extra_time",
+        "fade_in",
+        "fade_out",
+        "flip_horizontal",
+        "flip_vertical",
+        "height",
+        "id",
+        "mask",
+        "pan",
+        "pan_crop",
+        "pan_distance",
+        "position",
+        "rotate",
+        "scale",
+        "settings",
+        "start",
+        "style",
+        "variables",
+        "width",
+        "x",
+        "y",
+        "z_index",
+        "zoom",
+    )
+
     def __init__(
         self,
         text: str,
@@ -78,138 +115,4 @@ class Text:
             z_index (int): Element's z-index. Defaults to 0.
             zoom (int): Zooms the element with the specified level percentage. Defaults to 0.
         """
-        self.text = text
-        self.type = type
-        self.cache = cache
-        self.chroma_key = chroma_key
-        self.comment = comment
-        self.condition = condition
-        self.correction = correction
-        self.crop = crop
-        self.duration = duration
-        self.extra_time = extra_time
-        self.fade_in = fade_in
-        self.fade_out = fade_out
-        self.flip_horizontal = flip_horizontal
-        self.flip_vertical = flip_vertical
-        self.height = height
-        self.id = id
-        self.mask = mask
-        self.pan = pan
-        self.pan_crop = pan_crop
-        self.pan_distance = pan_distance
-        self.position = position
-        self.rotate = rotate
-        self.scale = scale
-        self.settings = settings if settings is not None else {}
-        self.start = start
-        self.style = style
-        self.variables = variables if variables is not None else {}
-        self.width = width
-        self.x = x
-        self.y = y
-        self.z_index = z_index
-
-        self.zoom = zoom
-
-    # ... (setter methods for each attribute) ...
-    def set_id(self, id: str):
-        """Sets the ID of the text."""
-        self.id = id
-
-    def set_mask(self, mask: str):
-        """Sets the mask."""
-        self.mask = mask
-
-    def set_pan(self, pan: str):
-        """Sets panning."""
-        self.pan = pan
-
-    def set_pan_crop(self, pan_crop: bool):
-        """Sets pan crop."""
-        self.pan_crop = pan_crop
-
-    def set_pan_distance(self, pan_distance: float):
-        """Sets pan distance."""
-        self.pan_distance = pan_distance
-
-    def set_position(self, position: str):
-        """Sets position."""
-        self.position = position
-
-    def set_rotate(self, rotate: Dict):
-        """Sets rotation."""
-        self.rotate = rotate
-
-    def set_scale(self, scale: Dict):
-        """Sets scale (deprecated)."""
-        self.scale = scale
-
-    def set_settings(self, settings: Dict):
-        """Sets text settings."""
-        self.settings = settings
-
-    def set_start(self, start: float):
-        """Sets start time."""
-        self.start = start
-
-    def set_style(self, style: str):
-        """Sets text style."""
-        self.style = style
-
-    def set_variables(self, variables: Dict):
-        """Sets variables."""
-        self.variables = variables
-
-    def set_width(self, width: int):
-        """Sets width."""
-        self.width = width
-
-    def set_x(self, x: int):
-        """Sets x coordinate."""
-        self.x = x
-
-    def set_y(self, y: int):
-        """Sets y coordinate."""
-        self.y = y
-
-    def set_z_index(self, z_index: int):
-        """Sets z-index."""
-        self.z_index = z_index
-
-    def to_dict(self) -> Dict:
-        """Returns a dictionary representing the Text object."""
-        return {
-            "text": self.text,
-            "type": self.type,
-            "cache": self.cache,
-            "chroma_key": self.chroma_key,
-            "comment": self.comment,
-            "condition": self.condition,
-            "correction": self.correction,
-            "crop": self.crop,
-            "duration": self.duration,
-            "extra_time": self.extra_time,
-            "fade_in": self.fade_in,
-            "fade_out": self.fade_out,
-            "flip_horizontal": self.flip_horizontal,
-            "flip_vertical": self.flip_vertical,
-            "height": self.height,
-            "id": self.id,
-            "mask": self.mask,
-            "pan": self.pan,
-            "pan_crop": self.pan_crop,
-            "pan_distance": self.pan_distance,
-            "position": self.position,
-            "rotate": self.rotate,
-            "scale": self.scale,
-            "settings": self.settings,
-            "start": self.start,
-            "style": self.style,
-            "variables": self.variables,
-            "width": self.width,
-            "x": self.x,
-            "y": self.y,
-            "z_index": self.z_index,
-            "zoom": self.zoom,
-        }
+        self._init_fields(locals())
@@ -0,0 +1,214 @@
+from typing import Any, Callable, Dict, List, Mapping
+
+# Sentinel durations of the JSON2Video schema.
+ASSET_LENGTH = -1
+FILL_CONTAINER = -2
+
+# Element types whose -1 duration is the length of their src asset.
+MEDIA_TYPES = frozenset({"video", "audio"})
+
+# Speaking rate used to estimate the length of voice elements.
+VOICE_WORDS_PER_SECOND = 2.5
+
+# Length assumed for a scene transition that does not set its duration.
+DEFAULT_TRANSITION_DURATION = 1.0
+
+
+class TimelineError(ValueError):
+    """Raised when a resolved timeline does not have the expected length."""
+
+
+class TimedElement:
+    """An element with its absolute start and end time in the movie, in seconds."""
+
+    __slots__ = ("element", "start", "end")
+
+    def __init__(self, element: Any, start: float, end: float):
+        self.element = element
+        self.start = start
+        self.end = end
+
+
+class TimedScene:
+    """A scene with its absolute start and end time and its resolved elements."""
+
+    __slots__ = ("scene", "start", "end", "elements")
+
+    def __init__(self, scene: Any, start: float, end: float, elements: List):
+        self.scene = scene
+        self.start = start
+        self.end = end
+        self.elements: List[TimedElement] = elements
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Timeline:
+    """The resolved timeline of a movie."""
+
+    __slots__ = ("duration", "scenes", "elements", "unresolved")
+
+    def __init__(self, duration: float, scenes: List, elements: List, unresolved):
+        self.duration = duration
+        self.scenes: List[TimedScene] = scenes
+        # Elements placed directly on the movie.
+        self.elements: List[TimedElement] = elements
+        # Sources whose length was unknown and counted as 0.
+        self.unresolved: List[str] = unresolved
+
+    def check_duration(self, target: float, tolerance: float = 1.0):
+        """
+        Checks that the movie lasts the target length.
+
+        Args:
+            target (float): Expected length in seconds, e.g. the scenario's film duration.
+            tolerance (float): Allowed difference in seconds. Defaults to 1.0.
+
+        Raises:
+            TimelineError: If the length differs by more than the tolerance, or if it
+                depends on assets of unknown length.
+        """
+        if self.unresolved:
+            raise TimelineError(
+                f"Unknown length of {len(self.unresolved)} asset(s): "
+                f"{', '.join(self.unresolved[:5])}"
+            )
+        if abs(self.duration - target) > tolerance:
+            raise TimelineError(
+                f"Movie lasts {self.duration:.2f}s instead of {target:.2f}s"
+            )
+
+
+def _get(obj: Any, name: str, default: Any = None) -> Any:
+    # Works on SDK objects (underscored attributes) and on serialized dictionaries
+    # (hyphenated keys as in the schema).
+    if isinstance(obj, dict):
+        value = obj.get(name.replace("_", "-"), obj.get(name))
+    else:
+        value = getattr(obj, name, None)
+    return default if value is None else value
+
+
+def _is_removed(obj: Any) -> bool:
+    condition = _get(obj, "condition")
+    return condition is not None and str(condition).strip().lower() in ("", "false")
+
+
+def resolve_timeline(
+    movie: Any, probe: Mapping[str, float] | Callable[[str], float] = None
+) -> Timeline:
+    """
+    Computes the absolute start and end of every scene and element of a movie.
+
+    Durations of -1 take the length of the asset (video and audio, from the probe,
+    after seek and loop; voice, estimated from the text) and -2 fill the container.
+    Scenes of -1 last until their last element ends. Elements run for their
+    duration plus extra_time and are cut at the end of their scene, or of the movie
+    for movie elements: the movie lasts as long as its scenes. A scene transition
+    overlaps the end of the previous scene. Runs in time linear in the
+    number of scenes and elements.
+
+    Args:
+        movie (Movie | Dict): The movie, as SDK objects or serialized.
+        probe (Mapping[str, float] | Callable[[str], float]): Length in seconds of the
+            asset at a src URL, None when unknown. Defaults to None (all unknown).
+
+    Returns:
+        Timeline: The resolved timeline.
+    """
+    if probe is None:
+        lookup = lambda src: None
+    elif isinstance(probe, Mapping):
+        lookup = probe.get
+    else:
+        lookup = probe
+    unresolved: List[str] = []
+    lengths: Dict[str, float] = {}
+
+    def asset_length(src: str) -> float:
+        if src not in lengths:
+            length = lookup(src) if src else None
+            if length is None:
+                unresolved.append(src or "<missing src>")
+            lengths[src] = length
+        return lengths[src]
+
+    def intrinsic(element: Any) -> float:
+        # Length of an element whose duration is -1, None when it fills its container.
+        kind = _get(element, "type")
+        if kind in MEDIA_TYPES:
+            loop = _get(element, "loop", 1)
+            if loop == -1:
+                return None
+            length = asset_length(_get(element, "src"))
+            if length is None:
+                return 0.0
+            seek = _get(element, "seek", 0)
+            if seek < 0:
+                seek += length
+            return max(length - max(seek, 0), 0) * max(loop, 1)
+        if kind == "voice":
+            return len(str(_get(element, "text", "")).split()) / VOICE_WORDS_PER_SECOND
+        return None
+
+    def place(elements: List) -> tuple:
+        # Returns the fixed elements and those that fill the container, with the end
+        # of the last fixed element relative to the container.
+        fixed, fill, last = [], [], 0.0
+        for element in elements:
+            if _is_removed(element):
+                continue
+            start = _get(element, "start", 0)
+            length = _get(element, "duration", ASSET_LENGTH)
+            if length == ASSET_LENGTH:
+                length = intrinsic(element)
+            elif length == FILL_CONTAINER or length < 0:
+                length = None
+            if length is None:
+                fill.append((element, start))
+                continue
+            end = start + length + _get(element, "extra_time", 0)
+            last = max(last, end)
+            fixed.append((element, start, end))
+        return fixed, fill, last
+
+    def finish(fixed, fill, offset, duration) -> List[TimedElement]:
+        timed = [
+            TimedElement(element, offset + start, offset + min(end, duration))
+            for element, start, end in fixed
+            if start < duration
+        ]
+        timed.extend(
+            TimedElement(element, offset + start, offset + duration)
+            for element, start in fill
+            if start < duration
+        )
+        return timed
+
+    scenes: List[TimedScene] = []
+    cursor = 0.0
+    for scene in _get(movie, "scenes", []):
+        if _is_removed(scene):
+            continue
+        transition = _get(scene, "transition")
+        overlap = 0.0
+        if transition and scenes:
+            overlap = _get(transition, "duration", DEFAULT_TRANSITION_DURATION)
+        start = max(cursor - overlap, 0.0)
+        fixed, fill, last = place(_get(scene, "elements", []))
+        duration = _get(scene, "duration", -1)
+        if duration < 0:
+            duration = last
+        scenes.append(
+            TimedScene(
+                scene, start, start + duration, finish(fixed, fill, start, duration)
+            )
+        )
+        cursor = start + duration
+
+    # The scenes set the length of the movie, and movie elements are cut to it.
+    fixed, fill, _ = place(_get(movie, "elements", []))
+    elements = finish(fixed, fill, 0.0, cursor)
+    return Timeline(cursor, scenes, elements, unresolved)
@@ -0,0 +1,91 @@
+import hashlib
+import json
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+# Keys that do not change what is rendered, left out of content hashes.
+UNHASHED_KEYS = frozenset({"id", "cache", "comment"})
+
+
+class Tracked:
+    """
+    A mixin for schema objects that cache their serialized form until they change.
+
+    Assigning any public attribute (directly or through a ``set_*`` method) drops the
+    cache of the object and of every container it was added to, so serializing a large
+    movie again only re-serializes the changed subtrees. In-place changes to nested
+    values, e.g. ``scene.variables["name"] = value`` or ``movie.scenes.append(scene)``,
+    are not seen; call ``mark_dirty()`` after them, or use the ``add_*`` methods.
+    ``to_dict()`` copies the dictionaries and lists built by the SDK, so callers never
+    modify the cached form; nested values such as ``settings`` are shared as they are.
+    """
+
+    __slots__ = ()
+
+    # Attributes holding lists of tracked children, adopted whenever they are assigned.
+    _child_fields: Tuple[str, ...] = ()
+
+    def _init_tracking(self):
+        object.__setattr__(self, "_owners", ())
+        object.__setattr__(self, "_cache", {})
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name[0] != "_":
+            if name in self._child_fields:
+                for child in value:
+                    self._adopt(child)
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        """Drops the cached serialized form of this object and of its containers."""
+        # An owner only caches its output after serializing (and caching) all of its
+        # children, so an empty cache here means the owners are already dirty.
+        if not self._cache:
+            return
+        self._cache.clear()
+        for owner in self._owners:
+            owner.mark_dirty()
+
+    def _adopt(self, child: "Tracked"):
+        """Registers this object as a container of child and marks itself dirty."""
+        if self not in child._owners:
+            object.__setattr__(child, "_owners", child._owners + (self,))
+        self.mark_dirty()
+
+    def _cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Returns the cached value for key, building and storing it on a miss."""
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = build()
+        return value
+
+    def content_hash(self) -> str:
+        """
+        Returns the SHA-256 of the object's canonical serialized form.
+
+        The hash only changes when the rendered content may change: ids, cache flags
+        and comments of the object and of its elements are ignored, as are values
+        equal to the schema defaults.
+        """
+        return self._cached(
+            "content_hash",
+            lambda: hashlib.sha256(
+                json.dumps(
+                    _canonical(self._serialize(True)),
+                    sort_keys=True,
+                    separators=(",", ":"),
+                    default=str,
+                ).encode()
+            ).hexdigest(),
+        )
+
+
+def _canonical(data: Dict) -> Dict:
+    canonical = {k: v for k, v in data.items() if k not in UNHASHED_KEYS}
+    for key in ("scenes", "elements"):
+        if isinstance(canonical.get(key), list):
+            canonical[key] = [
+                _canonical(item) if isinstance(item, dict) else item
+                for item in canonical[key]
+            ]
+    return canonical
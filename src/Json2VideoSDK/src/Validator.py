@@ -0,0 +1,334 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+from .Config import DEFAULT_CACHE_DIR
+from .Movie import Movie
+from .Schema import SCHEMA_PATH
+
+# Bump when the compiled format changes, so stale cache files are ignored.
+_COMPILED_VERSION = 1
+
+# isinstance() targets per schema type; bools are rejected separately for numbers.
+_TYPES = {
+    "string": "str",
+    "boolean": "bool",
+    "integer": "int",
+    "number": "(int, float)",
+    "object": "dict",
+    "array": "list",
+}
+
+Check = Callable[[Dict, str, List[str]], None]
+
+
+class ValidationError(ValueError):
+    """Raised when a movie does not match the JSON2Video schema."""
+
+    def __init__(self, errors: List[str]):
+        super().__init__(f"{len(errors)} schema error(s): " + "; ".join(errors[:10]))
+        self.errors = errors
+
+
+def _ref_name(ref: str) -> str:
+    return ref.rsplit("/", 1)[-1]
+
+
+def _compile_property(spec: Dict) -> Dict:
+    """Keeps only the parts of a schema property that the validator checks."""
+    compiled = {}
+    if spec.get("format") == "integer":
+        compiled["type"] = "integer"
+    elif spec.get("type") in _TYPES:
+        compiled["type"] = spec["type"]
+    for key in ("enum", "minimum", "maximum"):
+        if key in spec:
+            compiled[key] = spec[key]
+    if spec.get("required") is True:
+        compiled["required"] = True
+    if "properties" in spec:
+        compiled["properties"] = {
+            key: _compile_property(value) for key, value in spec["properties"].items()
+        }
+    items = spec.get("items", {})
+    if "$ref" in items:
+        compiled["items"] = [_ref_name(items["$ref"])]
+    elif "anyOf" in items:
+        compiled["items"] = [_ref_name(item["$ref"]) for item in items["anyOf"]]
+    return compiled
+
+
+def compile_schema(schema_path: str = SCHEMA_PATH) -> Dict:
+    """
+    Compiles schema.yaml into the compact form used by the Validator.
+
+    Args:
+        schema_path (str): Path to the schema file. Defaults to the bundled schema.yaml.
+
+    Returns:
+        Dict: Schema name to compiled property specs. JSON serializable.
+    """
+    with open(schema_path, "r") as f:
+        schemas = yaml.safe_load(f)["schemas"]
+    return {
+        name: _compile_property(spec)
+        for name, spec in schemas.items()
+        if "properties" in spec
+    }
+
+
+def load_compiled(
+    schema_path: str = SCHEMA_PATH, cache_dir: str = DEFAULT_CACHE_DIR
+) -> Dict:
+    """
+    Returns the compiled schema, reading it from the on-disk cache when possible.
+
+    The cache file is keyed by the SHA-256 of the schema file, so YAML is only parsed
+    again after schema.yaml changes. Cache write failures are ignored.
+
+    Args:
+        schema_path (str): Path to the schema file. Defaults to the bundled schema.yaml.
+        cache_dir (str): Directory of the compiled cache. Defaults to ~/.cache/json2video.
+
+    Returns:
+        Dict: The compiled schema.
+    """
+    with open(schema_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    cache_path = os.path.join(cache_dir, f"schema-v{_COMPILED_VERSION}-{digest}.json")
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    compiled = compile_schema(schema_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(compiled, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return compiled
+
+
+class _CodeWriter:
+    """Generates the Python source of the per-schema check functions."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self.count = 0
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def function(self, spec: Dict) -> str:
+        """Writes a check function for an object spec and returns its name."""
+        self.count += 1
+        name = f"_check_{self.count}"
+        body = []
+        for key, prop in spec.get("properties", {}).items():
+            body.extend(self.property(key, prop))
+        self.lines.append(f"def {name}(value, path, errors):")
+        self.lines.append("    get = value.get")
+        self.lines.extend("    " + line for line in body)
+        self.lines.append("")
+        return name
+
+    def property(self, key: str, prop: Dict) -> List[str]:
+        alias = key.replace("-", "_")
+        lines = [f"v = get({key!r})"]
+        if alias != key:
+            lines.append(f"if v is None: v = get({alias!r})")
+        if prop.get("required"):
+            lines.append(
+                f"if v is None: errors.append(path + {'.' + key + ': required property is missing'!r})"
+            )
+        checks = []
+        type_name = prop.get("type")
+        message = f".{key}: "
+        if type_name in _TYPES:
+            test = f"isinstance(v, {_TYPES[type_name]})"
+            if type_name in ("integer", "number"):
+                test += " and v.__class__ is not bool"
+            if type_name == "integer":
+                test = f"({test}) or (v.__class__ is float and v.is_integer())"
+            checks.append(f"if not ({test}):")
+            checks.append(
+                f"    errors.append(path + {message + 'expected ' + type_name + ', got '!r} + type(v).__name__)"
+            )
+            checks.append("else:")
+        else:
+            checks.append("if True:")
+        if "enum" in prop:
+            enum = self.constant(prop["enum"])
+            checks.append(f"    if v not in {enum}:")
+            checks.append(
+                f"        errors.append(path + {message!r} + repr(v) + ' is not one of ' + str({enum}))"
+            )
+        numeric = "isinstance(v, (int, float))"
+        if "minimum" in prop:
+            checks.append(f"    if {numeric} and v < {prop['minimum']!r}:")
+            checks.append(
+                f"        errors.append(path + {message!r} + str(v) + {' is less than minimum ' + str(prop['minimum'])!r})"
+            )
+        if "maximum" in prop:
+            checks.append(f"    if {numeric} and v > {prop['maximum']!r}:")
+            checks.append(
+                f"        errors.append(path + {message!r} + str(v) + {' is greater than maximum ' + str(prop['maximum'])!r})"
+            )
+        if prop.get("properties"):
+            nested = self.function(prop)
+            checks.append("    if isinstance(v, dict):")
+            checks.append(f"        {nested}(v, path + {'.' + key!r}, errors)")
+        if prop.get("items"):
+            refs = self.constant(prop["items"])
+            checks.append("    if isinstance(v, list):")
+            checks.append(
+                f"        _check_items(v, path + {'.' + key!r}, errors, {refs})"
+            )
+        checks.append("    pass")
+        lines.append("if v is not None and not (v.__class__ is str and '{{' in v):")
+        lines.extend("    " + line for line in checks)
+        return lines
+
+
+class Validator:
+    """
+    A local validator for movies, compiled once from the JSON2Video schema.
+
+    Each schema (movie, scene and every element type) is turned into a generated
+    Python function checking types, enums, minimum/maximum and required properties.
+    Element types without a schema (voice, audiogram, subtitles) are accepted as they
+    are. String values containing "{{" are treated as variables and are not checked.
+    """
+
+    def __init__(
+        self, schema_path: str = SCHEMA_PATH, cache_dir: str = DEFAULT_CACHE_DIR
+    ):
+        """
+        Initializes a Validator object.
+
+        Args:
+            schema_path (str): Path to the schema file. Defaults to the bundled schema.yaml.
+            cache_dir (str): Directory of the compiled cache. Defaults to ~/.cache/json2video.
+        """
+        compiled = load_compiled(schema_path, cache_dir)
+        writer = _CodeWriter()
+        names = {name: writer.function(spec) for name, spec in compiled.items()}
+        namespace = dict(writer.constants, _check_items=self._check_items)
+        exec(compile("\n".join(writer.lines), "<json2video-schema>", "exec"), namespace)
+        self.checks: Dict[str, Check] = {
+            schema: namespace[function] for schema, function in names.items()
+        }
+        # Element types allowed in the movie and scene "elements" arrays.
+        self.element_refs: Dict[str, List[str]] = {
+            name: compiled[name]["properties"]["elements"]["items"]
+            for name in ("movie", "scene")
+        }
+
+    def _check_items(self, items: List, path: str, errors: List[str], refs: List[str]):
+        """Checks the items of an array against the schema(s) it references."""
+        for index, item in enumerate(items):
+            self._check_item(item, f"{path}[{index}]", errors, refs)
+
+    def _check_item(self, item: Any, path: str, errors: List[str], refs: List[str]):
+        """Checks one array item against the schema(s) its array references."""
+        name = refs[0] if len(refs) == 1 else None
+        if name is None:
+            name = item.get("type") if isinstance(item, dict) else None
+            if name not in refs:
+                errors.append(f"{path}: unknown element type")
+                return
+        check = self.checks.get(name)
+        if check is None:
+            return
+        if not isinstance(item, dict):
+            errors.append(f"{path}: expected object, got {type(item).__name__}")
+            return
+        check(item, path, errors)
+
+    def validate(self, data: Dict, schema_name: str = "movie") -> List[str]:
+        """
+        Validates a serialized movie, scene or element.
+
+        Args:
+            data (Dict): The dictionary to validate.
+            schema_name (str): Name of the schema to validate against. Defaults to "movie".
+
+        Returns:
+            List[str]: Error messages with the path of each invalid value. Empty if valid.
+        """
+        errors = []
+        if not isinstance(data, dict):
+            return [f"{schema_name}: expected object, got {type(data).__name__}"]
+        self.checks[schema_name](data, schema_name, errors)
+        return errors
+
+
+@lru_cache(maxsize=None)
+def get_validator() -> Validator:
+    """Returns the shared Validator for the bundled schema."""
+    return Validator()
+
+
+def _fragment(obj: Any, compact: bool) -> Dict:
+    # The dictionary cached by a previous serialization, or a transient one.
+    data = obj._cache.get(compact)
+    return data if data is not None else obj._build_dict(compact)
+
+
+def validate_movie(movie: Movie | Dict, compact: bool = True) -> List[str]:
+    """
+    Validates a movie against the bundled schema.
+
+    A Movie object is checked scene by scene and element by element, reusing the
+    dictionaries already cached by its serialization, so validating before a streamed
+    submission never builds or keeps the full dictionary tree.
+
+    Args:
+        movie (Movie | Dict): A Movie object or an already serialized movie.
+        compact (bool): Check a Movie in the form it is submitted in, without None values
+            and schema defaults. Defaults to True.
+
+    Returns:
+        List[str]: Error messages with the path of each invalid value. Empty if valid.
+    """
+    validator = get_validator()
+    if not isinstance(movie, Movie):
+        return validator.validate(movie)
+    data = movie._cache.get(compact)
+    if data is not None:
+        return validator.validate(data)
+
+    errors = validator.validate(movie._build_dict([], [], compact))
+    for index, scene in enumerate(movie.scenes):
+        path = f"movie.scenes[{index}]"
+        data = scene._cache.get(compact)
+        if data is not None:
+            validator.checks["scene"](data, path, errors)
+            continue
+        validator.checks["scene"](scene._build_dict([], compact), path, errors)
+        refs = validator.element_refs["scene"]
+        for position, element in enumerate(scene.elements):
+            validator._check_item(
+                _fragment(element, compact),
+                f"{path}.elements[{position}]",
+                errors,
+                refs,
+            )
+    refs = validator.element_refs["movie"]
+    for index, element in enumerate(movie.elements):
+        validator._check_item(
+            _fragment(element, compact), f"movie.elements[{index}]", errors, refs
+        )
+    return errors
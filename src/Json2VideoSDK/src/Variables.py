@@ -0,0 +1,203 @@
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .Movie import Movie
+
+# A {{name}} placeholder. Variable names can only contain letters, numbers and underscores.
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class VariableError(ValueError):
+    """Raised when a row does not define every variable used by the movie."""
+
+    def __init__(self, message: str, missing: List[str] = None):
+        super().__init__(message)
+        self.missing = missing or []
+
+
+class _Text:
+    """A string with placeholders, split into literal text and variable names."""
+
+    __slots__ = ("parts", "whole")
+
+    def __init__(self, text: str):
+        self.parts: List[Tuple[str, str]] = []
+        position = 0
+        for match in PLACEHOLDER.finditer(text):
+            self.parts.append((text[position : match.start()], None))
+            self.parts.append((match.group(0), match.group(1)))
+            position = match.end()
+        self.parts.append((text[position:], None))
+        # A string that is a single placeholder takes the value as it is, so numbers
+        # and booleans keep their type.
+        self.whole = len(self.parts) == 3 and not self.parts[0][0] + self.parts[2][0]
+
+    def names(self) -> Iterator[str]:
+        return (name for _, name in self.parts if name is not None)
+
+    def expand(self, scope: Dict, missing: List[str]) -> Any:
+        if self.whole:
+            text, name = self.parts[1]
+            if name in scope:
+                return scope[name]
+            missing.append(name)
+            return text
+        pieces = []
+        for text, name in self.parts:
+            if name is None:
+                pieces.append(text)
+            elif name in scope:
+                pieces.append(str(scope[name]))
+            else:
+                missing.append(name)
+                pieces.append(text)
+        return "".join(pieces)
+
+
+class _Container:
+    """The children of a dict or list that contain placeholders."""
+
+    __slots__ = ("edits", "local", "local_edits")
+
+    def __init__(self, edits: List[Tuple[Any, Any]], local: Dict, local_edits: Any):
+        self.edits = edits
+        # Local variables of a scene or element, which take precedence over the
+        # variables of the enclosing scene and movie. Their own placeholders are
+        # expanded in the enclosing scope.
+        self.local = local
+        self.local_edits = local_edits
+
+    def names(self) -> Iterator[str]:
+        if self.local_edits:
+            yield from self.local_edits.names()
+        for _, node in self.edits:
+            yield from node.names()
+
+    def expand(self, value: Any, scope: Dict, missing: List[str]) -> Any:
+        # Only this container is copied, children without placeholders are shared.
+        copy = value.copy()
+        local = self.local
+        if self.local_edits:
+            local = copy["variables"] = self.local_edits.expand(local, scope, missing)
+        if local:
+            scope = {**scope, **local}
+        for key, node in self.edits:
+            if isinstance(node, _Text):
+                copy[key] = node.expand(scope, missing)
+            else:
+                copy[key] = node.expand(value[key], scope, missing)
+        return copy
+
+
+def _compile(value: Any) -> Any:
+    # Returns the expansion plan of a serialized value, None if it has no placeholders.
+    if isinstance(value, str):
+        return _Text(value) if PLACEHOLDER.search(value) else None
+    local = local_edits = None
+    if isinstance(value, dict):
+        items = ((k, v) for k, v in value.items() if k != "variables")
+        if isinstance(value.get("variables"), dict):
+            local = value["variables"]
+            local_edits = _compile(local)
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return None
+    edits = [(key, node) for key, node in ((k, _compile(v)) for k, v in items) if node]
+    if edits or local_edits:
+        return _Container(edits, local, local_edits)
+    return None
+
+
+class VariableExpander:
+    """
+    Expands the {{variables}} of one movie skeleton for many sets of values.
+
+    The skeleton is serialized and scanned once. Each expansion then copies only the
+    dictionaries and lists on the way to a placeholder, and every other part of the
+    payload (scenes, elements and values without variables) is shared with the
+    skeleton and the other variants instead of being copied. Payloads must therefore
+    be treated as read-only.
+    """
+
+    def __init__(self, movie: Movie | Dict, compact: bool = True):
+        """
+        Initializes a VariableExpander object.
+
+        Args:
+            movie (Movie | Dict): The movie skeleton, as a Movie or already serialized.
+            compact (bool): Serialize a Movie without None values and schema defaults. Defaults to True.
+        """
+        self.skeleton = (
+            movie.to_dict(compact=compact) if isinstance(movie, Movie) else movie
+        )
+        self.variables = self.skeleton.get("variables") or {}
+        root = _compile(self.skeleton)
+        self._edits = root.edits if root else []
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the variables used in the skeleton, in order of appearance."""
+        return list(
+            dict.fromkeys(name for _, node in self._edits for name in node.names())
+        )
+
+    def expand(self, row: Dict, strict: bool = False) -> Dict:
+        """
+        Returns the movie with the variables of a row substituted.
+
+        Values of the row override the movie's own variables, and the local variables
+        of scenes and elements override both. Unknown variables are left in place for
+        the API to resolve, unless strict is set.
+
+        Args:
+            row (Dict): Values of the variables, by name.
+            strict (bool): Raise an error when a variable is not defined. Defaults to False.
+
+        Returns:
+            Dict: The concrete movie payload, with "variables" set to the values used.
+
+        Raises:
+            VariableError: If strict is set and a variable is not defined.
+        """
+        scope = {**self.variables, **row}
+        missing: List[str] = []
+        payload = self.skeleton.copy()
+        for key, node in self._edits:
+            if isinstance(node, _Text):
+                payload[key] = node.expand(scope, missing)
+            else:
+                payload[key] = node.expand(self.skeleton[key], scope, missing)
+        if "variables" in payload or row:
+            payload["variables"] = scope
+        if strict and missing:
+            missing = list(dict.fromkeys(missing))
+            raise VariableError(f"Undefined variables: {', '.join(missing)}", missing)
+        return payload
+
+
+def expand_variables(
+    movie: Movie | Dict,
+    rows: Iterable[Dict],
+    compact: bool = True,
+    strict: bool = False,
+) -> Iterator[Dict]:
+    """
+    Expands one movie skeleton into a concrete movie for each row of variables.
+
+    Rows are consumed lazily and each payload is yielded as soon as it is built, so
+    any number of variants can be streamed to Client.create_movie without holding
+    them in memory. See VariableExpander for how structure is shared.
+
+    Args:
+        movie (Movie | Dict): The movie skeleton, with {{variable}} placeholders.
+        rows (Iterable[Dict]): Values of the variables for each variant.
+        compact (bool): Serialize a Movie without None values and schema defaults. Defaults to True.
+        strict (bool): Raise an error when a variable is not defined. Defaults to False.
+
+    Returns:
+        Iterator[Dict]: One movie payload per row.
+    """
+    expander = VariableExpander(movie, compact=compact)
+    for row in rows:
+        yield expander.expand(row, strict=strict)
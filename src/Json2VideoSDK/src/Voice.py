@@ -1,11 +1,34 @@
 from typing import Dict
 
+from .Element import Element
 
-class Voice:
+
+class Voice(Element):
     """
     A class representing the voice element schema for the JSON2Video API.
     """
 
+    __slots__ = (
+        "text",
+        "type",
+        "cache",
+        "comment",
+        "condition",
+        "connection",
+        "duration",
+        "extra_time",
+        "fade_in",
+        "fade_out",
+        "id",
+        "model",
+        "muted",
+        "start",
+        "variables",
+        "voice",
+        "volume",
+        "z_index",
+    )
+
     def __init__(
         self,
         text: str,
@@ -50,78 +73,4 @@ class Voice:
             volume (float): Volume gain of the audio. Defaults to 1.
             z_index (int): Element's z-index. Defaults to 0.
         """
-        self.text = text
-        self.type = type
-        self.cache = cache
-        self.comment = comment
-        self.condition = condition
-        self.connection = connection
-        self.duration = duration
-        self.extra_time = extra_time
-        self.fade_in = fade_in
-        self.fade_out = fade_out
-        self.id = id
-        self.model = model
-        self.muted = muted
-        self.start = start
-        self.variables = variables if variables is not None else {}
-        self.voice = voice
-        self.volume = volume
-
-        self.z_index = z_index
-
-    # ... (setter methods for each attribute) ...
-    def set_id(self, id: str):
-        """Sets the ID of the voice."""
-        self.id = id
-
-    def set_model(self, model: str):
-        """Sets the model."""
-        self.model = model
-
-    def set_muted(self, muted: bool):
-        """Sets mute status."""
-        self.muted = muted
-
-    def set_start(self, start: float):
-        """Sets start time."""
-        self.start = start
-
-    def set_variables(self, variables: Dict):
-        """Sets variables."""
-        self.variables = variables
-
-    def set_voice(self, voice: str):
-        """Sets voice."""
-        self.voice = voice
-
-    def set_volume(self, volume: float):
-        """Sets volume."""
-        self.volume = volume
-
-    def set_z_index(self, z_index: int):
-        """Sets z-index."""
-        self.z_index = z_index
-
-    def to_dict(self) -> Dict:
-        """Returns a dictionary representing the Voice object."""
-        return {
-            "text": self.text,
-            "type": self.type,
-            "cache": self.cache,
-            "comment": self.comment,
-            "condition": self.condition,
-            "connection": self.connection,
-            "duration": self.duration,
-            "extra_time": self.extra_time,
-            "fade_in": self.fade_in,
-            "fade_out": self.fade_out,
-            "id": self.id,
-            "model": self.model,
-            "muted": self.muted,
-            "start": self.start,
-            "variables": self.variables,
-            "voice": self.voice,
-            "volume": self.volume,
-            "z_index": self.z_index,
-        }
+        self._init_fields(locals())
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .DiskCache import DEFAULT_CACHE_DIR, DiskCache
+
+
+class MediaDownloader:
+    """
+    Downloads stock media into a local content-addressed store.
+
+    Files are streamed to disk in chunks by a bounded pool of workers. A transfer
+    is written to a temporary file that is resumed with an HTTP Range request after
+    an interruption, and moved into place under the SHA-256 of its content only
+    once it is complete. URLs already downloaded, and identical content reached
+    through different URLs, are stored once.
+    """
+
+    def __init__(
+        self,
+        store_dir: str = os.path.join(DEFAULT_CACHE_DIR, "media"),
+        max_workers: int = 4,
+        chunk_size: int = 1024 * 1024,
+        max_retries: int = 3,
+        timeout: float = 60,
+    ):
+        """
+        Initializes a MediaDownloader object.
+
+        Args:
+            store_dir (str): Directory of the store. Defaults to "~/.cache/video-app/media".
+            max_workers (int): Maximum number of parallel downloads. Defaults to 4.
+            chunk_size (int): Size of the chunks written to disk, in bytes. Defaults to 1 MiB.
+            max_retries (int): Number of times an interrupted transfer is resumed. Defaults to 3.
+            timeout (float): Connect and read timeout in seconds. Defaults to 60.
+        """
+        self.store_dir = store_dir
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._tmp_dir = os.path.join(store_dir, "tmp")
+        os.makedirs(self._tmp_dir, exist_ok=True)
+        # Maps each URL to the path of its content in the store.
+        self.index = DiskCache(os.path.join(store_dir, "index.sqlite3"))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="media-download"
+        )
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def submit(self, url: str) -> Future:
+        """
+        Schedules a download.
+
+        Args:
+            url (str): URL of the file.
+
+        Returns:
+            Future: Resolves to the local path of the file.
+        """
+        with self._lock:
+            future = self._in_flight.get(url)
+            if future is None:
+                future = self._executor.submit(self._fetch, url)
+                self._in_flight[url] = future
+                future.add_done_callback(lambda _: self._forget(url))
+            return future
+
+    def download(self, url: str) -> str:
+        """Downloads a file, or finds it in the store, and returns its local path."""
+        return self.submit(url).result()
+
+    def download_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """
+        Downloads several files in parallel.
+
+        Args:
+            urls (Iterable[str]): URLs of the files.
+
+        Returns:
+            Dict[str, str]: The local path of every URL. Failed downloads are printed and map to None.
+        """
+        futures = {url: self.submit(url) for url in urls}
+        paths = {}
+        for url, future in futures.items():
+            try:
+                paths[url] = future.result()
+            except (requests.exceptions.RequestException, OSError) as e:
+                print(f"Error downloading {url}: {e}")
+                paths[url] = None
+        return paths
+
+    def _forget(self, url: str):
+        with self._lock:
+            self._in_flight.pop(url, None)
+
+    def _fetch(self, url: str) -> str:
+        path = self.index.get(url)
+        if path is not None and os.path.exists(path):
+            return path
+
+        name = hashlib.sha256(url.encode()).hexdigest()
+        part = os.path.join(self._tmp_dir, name + ".part")
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._transfer(url, part)
+                break
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.Timeout,
+            ):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(2**attempt)
+
+        digest = hashlib.sha256()
+        with open(part, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                digest.update(chunk)
+        content = digest.hexdigest()
+        extension = os.path.splitext(urlparse(url).path)[1]
+        path = os.path.join(self.store_dir, content[:2], content + extension)
+        if os.path.exists(path):
+            os.remove(part)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(part, path)
+        self.index.set(url, path)
+        return path
+
+    def _transfer(self, url: str, part: str):
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with self.session.get(
+            url, headers=headers, stream=True, timeout=self.timeout
+        ) as response:
+            if response.status_code == 416:
+                # The partial file already holds the whole content.
+                return
+            response.raise_for_status()
+            # A server that ignores the range sends the whole file again.
+            mode = "ab" if response.status_code == 206 else "wb"
+            with open(part, mode) as f:
+                for chunk in response.iter_content(self.chunk_size):
+                    f.write(chunk)
+
+    def close(self):
+        """Waits for the running downloads and closes the connections."""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,45 +1,219 @@
 from Pexels import Client as PexelsApi
+from Pexels.errors import PexelsError
+import os
 import requests
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from .DiskCache import DEFAULT_CACHE_DIR, DiskCache
+from .Json2VideoSDK.RateLimiter import get_limiter
+
+# Default Pexels API limit: 200 requests per hour.
+PEXELS_RATE = 200 / 3600
+PEXELS_BURST = 200
 
 
 class PexelsStockMedia:
-    def __init__(self, apiKey: str):
+    def __init__(
+        self,
+        apiKey: str,
+        cache: bool = True,
+        cache_path: str = os.path.join(DEFAULT_CACHE_DIR, "pexels.sqlite3"),
+        cache_ttl: float = 24 * 60 * 60,
+        cache_max_entries: int = 5000,
+        max_workers: int = 8,
+    ):
         self.apiKey = apiKey
         self.pexels = PexelsApi(token=apiKey)
+        self.max_workers = max_workers
+        # Shared by every instance using the key, so concurrent searches stay
+        # within the hourly request budget.
+        self.limiter = get_limiter(f"pexels:{apiKey}", PEXELS_RATE, PEXELS_BURST)
+        # Pexels' rate-limit headers report the monthly quota: they are recorded and only
+        # block requests once it is used up, the hourly bucket keeps its own rate.
+        self.pexels.session.hooks["response"].append(self._record_quota)
+        # Search and lookup results, keyed by query, page and per_page.
+        # Hit/miss counters are available through self.cache.stats.
+        self.cache = (
+            DiskCache(cache_path, ttl=cache_ttl, max_entries=cache_max_entries)
+            if cache
+            else None
+        )
+
+    def _cached(self, key: str, fetch):
+        def request():
+            # Cache hits do not spend the request budget.
+            self.limiter.acquire()
+            return fetch()
+
+        if self.cache is None:
+            return request()
+        return self.cache.get_or_set(key, request)
+
+    def _record_quota(self, response: requests.Response, *args, **kwargs):
+        self.limiter.update_from_headers(response.headers, adapt=False)
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        return " ".join(query.lower().split())
 
     def search_photos(self, query: str, page: int = 1, per_page: int = 15):
-        photos = self.pexels.search_photos(query, page=page, results_per_page=per_page)
+        photos = self._cached(
+            f"photos:{self._normalize(query)}:{page}:{per_page}",
+            lambda: self.pexels.search_photos(query, page=page, per_page=per_page),
+        )
         return photos
 
     def get_photo(self, photo_id: int):
-        photo = self.pexels.get_photo(photo_id)
+        photo = self._cached(
+            f"photo:{photo_id}", lambda: self.pexels.get_photo(photo_id)
+        )
         return photo
 
     def search_videos(self, query: str, page: int = 1, per_page: int = 15):
-        videos = self.pexels.search_videos(query, page=page, per_page=per_page)
+        videos = self._cached(
+            f"videos:{self._normalize(query)}:{page}:{per_page}",
+            lambda: self.pexels.search_videos(query, page=page, per_page=per_page),
+        )
         return videos
 
     def get_video(self, video_id: int):
-        video = self.pexels.get_video(video_id)
+        video = self._cached(
+            f"video:{video_id}", lambda: self.pexels.get_video(video_id)
+        )
         return video
 
-    def get_remaining_requests(self):
+    @staticmethod
+    def select_video_file(
+        video,
+        width: int = 640,
+        height: int = 360,
+        quality: str = None,
+        file_type: str = "video/mp4",
+    ):
+        """
+        Picks the smallest rendition of a Pexels video that covers the target frame.
 
-        try:
-            response = requests.get(
-                "https://api.pexels.com/v1/",
-                headers={"Authorization": self.apiKey},
-            )
-            response.raise_for_status()
+        Args:
+            video (Video): A video returned by search_videos or get_video.
+            width (int): Target width in pixels, e.g. Movie.width. Defaults to 640.
+            height (int): Target height in pixels, e.g. Movie.height. Defaults to 360.
+            quality (str): Preferred Pexels quality ("sd", "hd" or "uhd"). Ignored when no
+                rendition has it. Defaults to None.
+            file_type (str): Required MIME type. None accepts any type. Defaults to "video/mp4".
+
+        Returns:
+            VideoFiles: The selected rendition, the largest one when none covers the frame,
+            or None when the video has no rendition of the file type.
+        """
+        files = [
+            f
+            for f in video.video_files
+            if f.width and f.height and (file_type is None or f.file_type == file_type)
+        ]
+        if quality is not None and any(f.quality == quality for f in files):
+            files = [f for f in files if f.quality == quality]
+        if not files:
+            return None
+        covering = [f for f in files if f.width >= width and f.height >= height]
+        if covering:
+            return min(covering, key=lambda f: f.width * f.height)
+        return max(files, key=lambda f: f.width * f.height)
+
+    def search_photos_batch(
+        self, keywords: List[str] | str, pages: int = 1, per_page: int = 15
+    ) -> List:
+        """
+        Searches photos for several keywords at once and merges the results.
+
+        Args:
+            keywords (List[str] | str): The keywords, or a string of space- or comma-separated keywords.
+            pages (int): Number of result pages fetched per keyword. Defaults to 1.
+            per_page (int): Number of results per page. Defaults to 15.
 
-            limit = int(response.headers["X-Ratelimit-Limit"])
-            remaining = int(response.headers["X-Ratelimit-Remaining"])
-            limit_reset = datetime.datetime.fromtimestamp(
-                int(response.headers["X-Ratelimit-Reset"])
-            ).strftime("%Y-%m-%d %H:%M:%S")
+        Returns:
+            List: Photos without duplicates, the ones matching the most keywords first.
+        """
+        return self._search_batch(
+            self.search_photos, "photos", keywords, pages, per_page
+        )
 
-            return limit, remaining, limit_reset
+    def search_videos_batch(
+        self, keywords: List[str] | str, pages: int = 1, per_page: int = 15
+    ) -> List:
+        """
+        Searches videos for several keywords at once and merges the results.
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error checking request limits: {e}")
+        Args:
+            keywords (List[str] | str): The keywords, or a string of space- or comma-separated keywords.
+            pages (int): Number of result pages fetched per keyword. Defaults to 1.
+            per_page (int): Number of results per page. Defaults to 15.
+
+        Returns:
+            List: Videos without duplicates, the ones matching the most keywords first.
+        """
+        return self._search_batch(
+            self.search_videos, "videos", keywords, pages, per_page
+        )
+
+    def _search_batch(self, search, field, keywords, pages, per_page) -> List:
+        if isinstance(keywords, str):
+            separator = "," if "," in keywords else None
+            keywords = keywords.split(separator)
+        keywords = list(dict.fromkeys(k.strip() for k in keywords if k.strip()))
+        queries = [(k, page) for k in keywords for page in range(1, pages + 1)]
+        if not queries:
+            return []
+
+        def run(query):
+            keyword, page = query
+            try:
+                return search(keyword, page=page, per_page=per_page)
+            except (PexelsError, requests.exceptions.RequestException) as e:
+                print(f"Error searching {field} for '{keyword}': {e}")
+                return None
+
+        workers = min(self.max_workers, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(executor.map(run, queries))
+
+        # Rank by the number of keywords an item was found for, then by its best
+        # position in any result list.
+        found: Dict[int, list] = {}
+        for (keyword, page), response in zip(queries, responses):
+            if response is None:
+                continue
+            for index, item in enumerate(getattr(response, field)):
+                position = (page - 1) * per_page + index
+                entry = found.get(item.id)
+                if entry is None:
+                    found[item.id] = [item, {keyword}, position]
+                else:
+                    entry[1].add(keyword)
+                    entry[2] = min(entry[2], position)
+        ranked = sorted(found.values(), key=lambda e: (-len(e[1]), e[2]))
+        return [item for item, _, _ in ranked]
+
+    def get_remaining_requests(self):
+        """
+        Returns the request quota reported by the last Pexels response.
+
+        No request is made: the values come from the rate-limit headers recorded
+        on every search and lookup.
+
+        Returns:
+            tuple: (limit, remaining, reset time as "%Y-%m-%d %H:%M:%S"), or None if no
+            response has reported the quota yet.
+        """
+        limiter = self.limiter
+        if limiter.remaining is None:
+            return None
+        limit_reset = (
+            datetime.datetime.fromtimestamp(limiter.reset_at).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            if limiter.reset_at is not None
+            else None
+        )
+        return int(limiter.limit or 0), int(limiter.remaining), limit_reset
@@ -0,0 +1,172 @@
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+# A fenced code block, optionally tagged with its language.
+_FENCE = re.compile(r"```[ \t]*(?:json|JSON)?[ \t]*\n?(.*?)```", re.DOTALL)
+# Where an embedded JSON object or array may start.
+_JSON_START = re.compile(r"[{\[]")
+
+_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a model response is not valid JSON or does not match its schema."""
+
+    def __init__(self, message: str, text: str = None, errors: List = None):
+        super().__init__(message)
+        self.text = text
+        self.errors = errors or []
+
+
+def schema_from_example(example: Any) -> Dict:
+    """
+    Derives a response schema from an example of the expected JSON.
+
+    Every key of an example object is required, and arrays take the schema of
+    their first item.
+
+    Args:
+        example (Any): An example value, e.g. {"description": "...", "tags": ["..."]}.
+
+    Returns:
+        Dict: A schema in the OpenAPI subset accepted as a Gemini response_schema.
+    """
+    if isinstance(example, dict):
+        return {
+            "type": "object",
+            "properties": {k: schema_from_example(v) for k, v in example.items()},
+            "required": list(example),
+        }
+    if isinstance(example, list):
+        return {
+            "type": "array",
+            "items": schema_from_example(example[0] if example else ""),
+        }
+    if isinstance(example, bool):
+        return {"type": "boolean"}
+    if isinstance(example, int):
+        return {"type": "integer"}
+    if isinstance(example, float):
+        return {"type": "number"}
+    if example is None:
+        return {"type": "string", "nullable": True}
+    return {"type": "string"}
+
+
+def extract_json(text: str) -> Any:
+    """
+    Parses the JSON in a model response.
+
+    The whole response is tried first, then each fenced code block, then the
+    first valid JSON object or array embedded in the text.
+
+    Args:
+        text (str): The response text.
+
+    Returns:
+        Any: The parsed JSON value.
+
+    Raises:
+        StructuredOutputError: If the response contains no valid JSON.
+    """
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    for match in _FENCE.finditer(text):
+        try:
+            return json.loads(match.group(1))
+        except ValueError:
+            continue
+    decoder = json.JSONDecoder()
+    error = None
+    # Braces in the prose, e.g. "{placeholders}", are skipped.
+    for match in _JSON_START.finditer(text):
+        try:
+            return decoder.raw_decode(text, match.start())[0]
+        except ValueError as e:
+            error = error or e
+    message = "No valid JSON in the response"
+    raise StructuredOutputError(f"{message}: {error}" if error else message, text)
+
+
+def check_schema(value: Any, schema: Dict, path: Tuple = ()) -> List[Tuple[Tuple, str]]:
+    """
+    Checks a value against a response schema.
+
+    Args:
+        value (Any): The parsed JSON value.
+        schema (Dict): The schema, as produced by schema_from_example.
+        path (Tuple): Path of the value in the document. Defaults to ().
+
+    Returns:
+        List[Tuple[Tuple, str]]: (path, message) for every mismatch. Empty if the value matches.
+    """
+    if value is None:
+        return [] if schema.get("nullable") else [(path, "must not be null")]
+    kind = schema.get("type", "").lower()
+    types = _TYPES.get(kind)
+    if types is not None and (
+        not isinstance(value, types) or (kind != "boolean" and isinstance(value, bool))
+    ):
+        return [(path, f"must be of type {kind}")]
+    if "enum" in schema and value not in schema["enum"]:
+        return [(path, f"must be one of {schema['enum']}")]
+
+    errors = []
+    if kind == "object":
+        for key in schema.get("required", ()):
+            if key not in value:
+                errors.append((path, f"is missing the key '{key}'"))
+        for key, subschema in schema.get("properties", {}).items():
+            if key in value:
+                errors.extend(check_schema(value[key], subschema, path + (key,)))
+    elif kind == "array" and "items" in schema:
+        for index, item in enumerate(value):
+            errors.extend(check_schema(item, schema["items"], path + (index,)))
+    return errors
+
+
+def subschema(schema: Dict, path: Tuple) -> Dict:
+    """Returns the part of a schema that describes the value at path."""
+    for step in path:
+        if isinstance(step, int):
+            schema = schema.get("items", {})
+        else:
+            schema = schema.get("properties", {}).get(step, {})
+    return schema
+
+
+def common_path(paths: List[Tuple]) -> Tuple:
+    """Returns the longest path that all paths start with."""
+    prefix = paths[0] if paths else ()
+    for path in paths[1:]:
+        length = 0
+        while length < min(len(prefix), len(path)) and prefix[length] == path[length]:
+            length += 1
+        prefix = prefix[:length]
+    return prefix
+
+
+def get_path(value: Any, path: Tuple) -> Any:
+    """Returns the value at path."""
+    for step in path:
+        value = value[step]
+    return value
+
+
+def set_path(value: Any, path: Tuple, new: Any) -> Any:
+    """Replaces the value at path and returns the (possibly new) root."""
+    if not path:
+        return new
+    get_path(value, path[:-1])[path[-1]] = new
+    return value
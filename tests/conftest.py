@@ -0,0 +1,94 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+
+class FakeJson2Video:
+    """
+    A local stand-in for the JSON2Video API.
+
+    POST /movies creates a movie in a new project and, when the movie has a webhook
+    export, posts the completion callback to it. GET /movies answers with the status
+    of a project, "running" for the first polls and "done" afterwards.
+    """
+
+    def __init__(self, polls_before_done: int = 1):
+        self.polls_before_done = polls_before_done
+        self.created: List[Dict] = []
+        self.polls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def _make_handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                movie = json.loads(self.rfile.read(length))
+                with api._lock:
+                    api.created.append(movie)
+                    project = f"project-{len(api.created)}"
+                self._reply({"success": True, "project": project, "timestamp": ""})
+                for export in movie.get("exports", []):
+                    for destination in export.get("destinations", []):
+                        if destination.get("type") == "webhook":
+                            threading.Thread(
+                                target=api._callback,
+                                args=(destination["endpoint"], project),
+                            ).start()
+
+            def do_GET(self):
+                project = parse_qs(urlparse(self.path).query)["project"][0]
+                with api._lock:
+                    polls = api.polls[project] = api.polls.get(project, 0) + 1
+                status = "done" if polls > api.polls_before_done else "running"
+                movie = {"success": True, "project": project, "status": status}
+                if status == "done":
+                    movie["url"] = f"https://cdn.example.com/{project}.mp4"
+                self._reply({"success": True, "movie": movie})
+
+            def _reply(self, body: Dict):
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _callback(self, endpoint: str, project: str):
+        requests.post(
+            endpoint,
+            json={
+                "success": True,
+                "project": project,
+                "url": f"https://cdn.example.com/{project}.mp4",
+            },
+            timeout=5,
+        )
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+@pytest.fixture
+def fake_api():
+    api = FakeJson2Video()
+    yield api
+    api.close()
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.Json2VideoSDK.AsyncClient import AsyncClient
+from src.Json2VideoSDK.Client import Client
+
+
+def test_client_survives_successive_event_loops():
+    created = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            created.append(f"project-{len(created) + 1}")
+            body = json.dumps({"success": True, "project": created[-1]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        client = AsyncClient("async-loops-key", base_url=base_url)
+
+        async def create():
+            return await client.create_movie({"scenes": []}, validate=False)
+
+        async def create_and_close():
+            async with client:
+                return await client.create_movie({"scenes": []}, validate=False)
+
+        # The first two runs leave their session open when the loop closes.
+        assert asyncio.run(create())["project"] == "project-1"
+        assert asyncio.run(create())["project"] == "project-2"
+        assert asyncio.run(create_and_close())["project"] == "project-3"
+        assert len(created) == 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_429_is_queued_on_the_shared_limiter():
+    responses = [429, 429, 200]
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = responses[len(seen)]
+            seen.append(status)
+            body = json.dumps({"success": status == 200, "movies": []}).encode()
+            self.send_response(status)
+            self.send_header("X-RateLimit-Limit", "10")
+            self.send_header("X-RateLimit-Remaining", "0" if status == 429 else "9")
+            self.send_header("X-RateLimit-Reset", "0.05")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        client = AsyncClient(
+            "async-429-key", base_url=base_url, backoff_factor=0.01, rate=50
+        )
+        # Both clients of a key spend the same budget.
+        with Client("async-429-key", base_url=base_url) as sync_client:
+            assert client.limiter is sync_client.limiter
+        acquired = []
+        acquire = client.limiter.acquire
+        client.limiter.acquire = lambda: acquired.append(acquire())
+
+        async def get_movies():
+            async with client:
+                return await client.get_movies("project")
+
+        assert asyncio.run(get_movies()) == {"success": True, "movies": []}
+        assert seen == [429, 429, 200]
+        assert len(acquired) == 3
+        assert (client.limiter.limit, client.limiter.remaining) == (10, 9)
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,47 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.Json2VideoSDK.Client import Client
+
+
+def test_429_is_queued_on_the_limiter():
+    responses = [429, 429, 200]
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = responses[len(seen)]
+            seen.append(status)
+            body = json.dumps({"success": status == 200, "movies": []}).encode()
+            self.send_response(status)
+            self.send_header("X-RateLimit-Limit", "10")
+            self.send_header("X-RateLimit-Remaining", "0" if status == 429 else "9")
+            self.send_header("X-RateLimit-Reset", "0.05")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with Client(
+            "client-429-key",
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            backoff_factor=0.01,
+            rate=50,
+        ) as client:
+            acquired = []
+            acquire = client.limiter.acquire
+            client.limiter.acquire = lambda: acquired.append(acquire())
+            assert client.get_movies("project") == {"success": True, "movies": []}
+            # Every 429 reached _send, which queued the retry on the limiter.
+            assert seen == [429, 429, 200]
+            assert len(acquired) == 3
+            assert (client.limiter.limit, client.limiter.remaining) == (10, 9)
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+from src import DiskCache as disk_cache
+from src.DiskCache import DiskCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(disk_cache.time, "time", clock)
+    return clock
+
+
+def test_get_set_and_stats(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"))
+    assert cache.get("a") is None
+    cache.set("a", {"photos": [1, 2]})
+    assert cache.get("a") == {"photos": [1, 2]}
+    assert cache.get("b", "default") == "default"
+    assert cache.stats == {"hits": 1, "misses": 2}
+    cache.delete("a")
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_values_persist_across_instances(tmp_path):
+    path = str(tmp_path / "nested" / "cache.sqlite3")
+    cache = DiskCache(path)
+    cache.set("a", [1, 2, 3])
+    cache.close()
+    assert os.path.exists(path)
+    cache = DiskCache(path)
+    assert cache.get("a") == [1, 2, 3]
+    cache.close()
+
+
+def test_ttl(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl=10)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1)
+    cache.set("forever", 3, ttl=None)
+    clock.advance(5)
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+    clock.advance(10)
+    assert cache.get("default") is None
+    assert cache.get("forever") == 3
+    cache.close()
+
+
+def test_lru_eviction_by_entries(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.set("a", 1)
+    clock.advance(1)
+    cache.set("b", 2)
+    clock.advance(1)
+    # Reading "a" makes "b" the least recently used entry.
+    assert cache.get("a") == 1
+    clock.advance(1)
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    cache.close()
+
+
+def test_lru_eviction_by_bytes(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=2500)
+    for key in "abc":
+        cache.set(key, b"x" * 1000)
+        clock.advance(1)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_get_or_set_calls_factory_once(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"))
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set("key", factory) == "value"
+    assert cache.get_or_set("key", factory) == "value"
+    assert len(calls) == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.stats == {"hits": 0, "misses": 0}
+    cache.close()
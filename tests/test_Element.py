@@ -0,0 +1,94 @@
+import inspect
+
+import pytest
+
+from src.Json2VideoSDK.src.Audio import Audio
+from src.Json2VideoSDK.src.Audiogram import Audiogram
+from src.Json2VideoSDK.src.Component import Component
+from src.Json2VideoSDK.src.HTML import HTML
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.Subtitles import Subtitles
+from src.Json2VideoSDK.src.Text import Text
+from src.Json2VideoSDK.src.Video import Video
+from src.Json2VideoSDK.src.Voice import Voice
+
+# Constructor parameters of the hand-written element classes the base class replaced,
+# which were also the keys of their to_dict(), in order.
+FIELDS = {
+    Audio: "src type cache comment condition duration extra_time fade_in fade_out id "
+    "loop muted seek start variables volume z_index",
+    Audiogram: "type amplitude cache chroma_key color comment condition correction "
+    "crop duration extra_time fade_in fade_out flip_horizontal flip_vertical height "
+    "id mask opacity pan pan_crop pan_distance position rotate scale start variables "
+    "width x y z_index zoom",
+    Component: "component type cache chroma_key comment condition correction crop "
+    "duration extra_time fade_in fade_out flip_horizontal flip_vertical height id "
+    "mask pan pan_crop pan_distance position rotate scale settings start variables "
+    "width x y z_index zoom",
+    HTML: "type cache chroma_key comment condition correction crop duration "
+    "extra_time fade_in fade_out flip_horizontal flip_vertical height html id mask "
+    "pan pan_crop pan_distance position rotate scale src start tailwindcss variables "
+    "wait width x y z_index zoom",
+    Image: "src type cache chroma_key comment condition correction crop duration "
+    "extra_time fade_in fade_out flip_horizontal flip_vertical height id mask pan "
+    "pan_crop pan_distance position rotate scale start variables width x y z_index zoom",
+    Subtitles: "type captions comment language model settings",
+    Text: "text type cache chroma_key comment condition correction crop duration "
+    "extra_time fade_in fade_out flip_horizontal flip_vertical height id mask pan "
+    "pan_crop pan_distance position rotate scale settings start style variables "
+    "width x y z_index zoom",
+    Video: "src type cache chroma_key comment condition correction crop duration "
+    "extra_time fade_in fade_out flip_horizontal flip_vertical height id loop mask "
+    "muted pan pan_crop pan_distance position rotate scale seek start variables "
+    "volume width x y z_index zoom",
+    Voice: "text type cache comment condition connection duration extra_time fade_in "
+    "fade_out id model muted start variables voice volume z_index",
+}
+
+
+def make(cls):
+    parameters = inspect.signature(cls.__init__).parameters.values()
+    required = [p for p in parameters if p.default is inspect.Parameter.empty][1:]
+    return cls(*[f"{p.name}-value" for p in required])
+
+
+@pytest.mark.parametrize("cls", FIELDS, ids=lambda cls: cls.__name__)
+def test_signature_and_to_dict_keys(cls):
+    fields = FIELDS[cls].split()
+    assert list(inspect.signature(cls.__init__).parameters)[1:] == fields
+    assert list(make(cls).to_dict()) == fields
+
+
+@pytest.mark.parametrize("cls", FIELDS, ids=lambda cls: cls.__name__)
+def test_defaults(cls):
+    parameters = inspect.signature(cls.__init__).parameters
+    data = make(cls).to_dict()
+    for name, parameter in list(parameters.items())[1:]:
+        if parameter.default is inspect.Parameter.empty:
+            assert data[name] == f"{name}-value"
+        elif parameter.default is None and name in ("settings", "variables"):
+            # Dictionary fields default to a fresh empty dict.
+            assert data[name] == {}
+        else:
+            assert data[name] == parameter.default, name
+    assert data["type"] == cls.__name__.lower()
+
+
+@pytest.mark.parametrize("cls", FIELDS, ids=lambda cls: cls.__name__)
+def test_setters(cls):
+    element = make(cls)
+    element.to_dict()
+    for name in FIELDS[cls].split():
+        getattr(element, f"set_{name}")(f"new-{name}")
+        assert element.to_dict()[name] == f"new-{name}"
+
+
+def test_dict_fields_are_not_shared():
+    first, second = Text(text="a"), Text(text="b")
+    first.settings["color"] = "red"
+    assert second.settings == {}
+
+
+def test_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Image(src="a").unknown = 1
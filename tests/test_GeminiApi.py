@@ -0,0 +1,96 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from src.GeminiApi import GeminiApi
+from src.StructuredOutput import StructuredOutputError, schema_from_example
+
+SCHEMA = schema_from_example({"title": "t", "scenes": [{"text": "x", "duration": 1}]})
+
+
+class FakeModel:
+    """Answers generate_content with canned responses and records the prompts."""
+
+    def __init__(self, *responses: str):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.prompts.append((prompt, generation_config))
+        return SimpleNamespace(text=self.responses.pop(0))
+
+
+def make_api(tmp_path, *responses: str) -> GeminiApi:
+    api = GeminiApi(
+        "test-key", upload_cache=False, cache_dir=str(tmp_path), prompt_cache=True
+    )
+    api.model = FakeModel(*responses)
+    return api
+
+
+def test_only_the_failing_fragment_is_repaired(tmp_path):
+    response = {
+        "title": "Movie",
+        "scenes": [{"text": "a", "duration": 1}, {"text": 2, "duration": "long"}],
+    }
+    api = make_api(
+        tmp_path,
+        f"```json\n{json.dumps(response)}\n```",
+        '{"text": "b", "duration": 3}',
+    )
+    data = api.send_prompt("prompt", response_schema=SCHEMA)
+
+    assert data["scenes"][1] == {"text": "b", "duration": 3}
+    assert data["scenes"][0] == {"text": "a", "duration": 1}
+    repair, config = api.model.prompts[1]
+    request = json.loads(repair)
+    # The original prompt is not resent, only scene 1 and its part of the schema.
+    assert "prompt" not in repair
+    assert json.loads(request["fragment"]) == {"text": 2, "duration": "long"}
+    assert request["schema"] == SCHEMA["properties"]["scenes"]["items"]
+    assert config["response_schema"] == request["schema"]
+    assert request["errors"] == [
+        "scenes/1/text: must be of type string",
+        "scenes/1/duration: must be of type integer",
+    ]
+
+
+def test_unparsable_response_is_repaired_whole(tmp_path):
+    api = make_api(tmp_path, "Sorry, {not json", '{"title": "a", "scenes": []}')
+    assert api.send_prompt("prompt", response_schema=SCHEMA) == {
+        "title": "a",
+        "scenes": [],
+    }
+    assert json.loads(api.model.prompts[1][0])["fragment"] == "Sorry, {not json"
+
+
+def test_failed_repair_raises(tmp_path):
+    api = make_api(tmp_path, '{"title": 1, "scenes": []}', "2")
+    with pytest.raises(StructuredOutputError) as error:
+        api.send_prompt("prompt", response_schema=SCHEMA)
+    # Only the title was sent back, so the repaired value is checked against its type.
+    assert error.value.errors == [((), "must be of type string")]
+    assert len(api.prompts) == 0
+
+
+def test_only_valid_responses_are_cached(tmp_path):
+    api = make_api(
+        tmp_path,
+        "not json",
+        '{"title": 1}',
+        'Here: {"title": "a", "scenes": []}',
+    )
+    with pytest.raises(StructuredOutputError):
+        api.send_prompt("prompt", response_schema=SCHEMA, repair=False)
+    with pytest.raises(StructuredOutputError):
+        api.send_prompt("prompt", response_schema=SCHEMA, repair=False)
+    assert len(api.prompts) == 0
+
+    expected = {"title": "a", "scenes": []}
+    assert api.send_prompt("prompt", response_schema=SCHEMA) == expected
+    assert api.send_prompt("prompt", response_schema=SCHEMA) == expected
+    assert len(api.model.prompts) == 3
+    assert api.prompts.stats["hits"] == 1
@@ -0,0 +1,39 @@
+from concurrent.futures import wait
+
+from src.Json2VideoSDK.Client import Client
+from src.Json2VideoSDK.JobTracker import JobTracker, movie_records
+
+
+def test_polling_resolves_jobs(fake_api):
+    client = Client("tracker-key", base_url=fake_api.base_url)
+    done = []
+    with JobTracker(client, min_interval=0.05, max_interval=0.2) as tracker:
+        futures = [
+            tracker.track(f"project-{n}", callback=done.append) for n in range(3)
+        ]
+        finished, pending = wait(futures, timeout=5)
+
+    assert not pending
+    assert [f.result()["status"] for f in futures] == ["done"] * 3
+    assert set(done) == set(futures)
+    # One "running" poll and one "done" poll per project.
+    assert fake_api.polls == {f"project-{n}": 2 for n in range(3)}
+
+
+def test_close_cancels_pending_jobs(fake_api):
+    client = Client("tracker-close-key", base_url=fake_api.base_url)
+    tracker = JobTracker(client, min_interval=60)
+    future = tracker.track("project-1")
+    assert tracker.pending() == 1
+    tracker.close()
+    assert future.cancelled()
+
+
+def test_movie_records():
+    assert movie_records({"movie": {"id": "a"}}) == [{"id": "a"}]
+    assert movie_records({"movies": [{"id": "a"}, {"id": "b"}]}) == [
+        {"id": "a"},
+        {"id": "b"},
+    ]
+    assert movie_records([{"id": "a"}, "x"]) == [{"id": "a"}]
+    assert movie_records(None) == []
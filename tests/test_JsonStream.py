@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from src.Json2VideoSDK.src.Audio import Audio
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.JsonStream import iter_movie_chunks, iter_movie_json
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Text import Text
+
+
+def make_movie() -> Movie:
+    scenes = [
+        Scene(
+            duration=3,
+            elements=[
+                Image(src=f"https://example.com/{n}.png"),
+                Text(text=f'Caption "{n}" – ünïcode', settings={"color": "#fff"}),
+            ],
+            transition={"style": "fade"} if n else None,
+        )
+        for n in range(20)
+    ]
+    return Movie(
+        scenes=scenes,
+        elements=[Audio(src="https://example.com/music.mp3")],
+        variables={"name": "value"},
+    )
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("cache", [False, True])
+def test_stream_matches_json_dumps(compact, cache):
+    movie = make_movie()
+    expected = json.dumps(movie.to_dict(compact))
+    assert "".join(iter_movie_json(movie, compact, cache)) == expected
+    # A second pass, served from whatever the first one cached, is identical.
+    assert "".join(iter_movie_json(movie, compact, cache)) == expected
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_stream_follows_edits(cache):
+    movie = make_movie()
+    "".join(iter_movie_json(movie, True, cache))
+    movie.scenes[3].elements[1].set_text("Changed")
+    movie.scenes[5].set_duration(7)
+    movie.add_scene(Scene(elements=[Text(text="New")]))
+    streamed = "".join(iter_movie_json(movie, True, cache))
+    assert streamed == json.dumps(movie.to_dict(True))
+    assert '"Changed"' in streamed
+
+
+def test_chunks_are_utf8_of_the_document():
+    movie = make_movie()
+    chunks = list(iter_movie_chunks(movie, compact=True, chunk_size=256))
+    assert len(chunks) > 1
+    assert b"".join(chunks).decode("utf-8") == json.dumps(movie.to_dict(True))
@@ -0,0 +1,271 @@
+import struct
+import wave
+import zlib
+
+import pytest
+
+from src.Json2VideoSDK import MediaProber as media_prober
+from src.Json2VideoSDK.MediaProber import MediaProber, movie_sources
+from src.Json2VideoSDK.src.Audio import Audio
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Text import Text
+
+# MPEG-1 layer III, 128 kbit/s, 44.1 kHz, stereo: 417 bytes per frame.
+MP3_STEREO = b"\xff\xfb\x90\x00"
+# The same, mono.
+MP3_MONO = b"\xff\xfb\x90\xc0"
+# MPEG-2 layer III, 64 kbit/s, 22.05 kHz, mono.
+MP3_MPEG2_MONO = b"\xff\xf3\x80\xc0"
+
+
+def probe(path) -> dict:
+    return media_prober._probe_headers(str(path), 5)
+
+
+def write(tmp_path, name: str, data: bytes):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+def chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack("<4sI", kind, len(data)) + data + b"\0" * (len(data) & 1)
+
+
+def id3(size: int) -> bytes:
+    # ID3v2.4 header; the size is a syncsafe integer, 7 bits per byte.
+    syncsafe = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + syncsafe + b"\0" * size
+
+
+def mp3_frame(header: bytes, size: int = 417, at: int = 0, payload: bytes = b""):
+    frame = bytearray(header + b"\0" * (size - 4))
+    frame[at : at + len(payload)] = payload
+    return bytes(frame)
+
+
+def box(kind: bytes, *children: bytes) -> bytes:
+    payload = b"".join(children)
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def large_box(kind: bytes, payload: bytes) -> bytes:
+    # A box with a 64-bit size.
+    return struct.pack(">I4sQ", 1, kind, 16 + len(payload)) + payload
+
+
+def mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1:
+        times = struct.pack(">QQIQ", 0, 0, timescale, duration)
+    else:
+        times = struct.pack(">IIII", 0, 0, timescale, duration)
+    return box(b"mvhd", bytes([version, 0, 0, 0]) + times + b"\0" * 80)
+
+
+def trak(handler: bytes, codec: bytes, width: int = 0, height: int = 0) -> bytes:
+    tkhd = box(b"tkhd", b"\0" * 76 + struct.pack(">II", width << 16, height << 16))
+    hdlr = box(b"hdlr", b"\0" * 8 + handler + b"\0" * 13)
+    stsd = box(
+        b"stsd", b"\0\0\0\0\0\0\0\1" + struct.pack(">I4s", 16, codec) + b"\0" * 8
+    )
+    return box(b"trak", tkhd, box(b"mdia", hdlr, box(b"minf", box(b"stbl", stsd))))
+
+
+def mp4(moov_first: bool, mdat_size: int = 100, version: int = 0) -> bytes:
+    ftyp = box(b"ftyp", b"isom\0\0\2\0isomiso2avc1mp41")
+    moov = box(
+        b"moov",
+        mvhd(1000, 12500, version),
+        trak(b"soun", b"mp4a"),
+        trak(b"vide", b"avc1", 1920, 1080),
+    )
+    mdat = large_box(b"mdat", b"\0" * mdat_size)
+    return ftyp + (moov + mdat if moov_first else mdat + moov)
+
+
+def test_wav(tmp_path):
+    path = tmp_path / "a.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(b"\0" * 4 * 12000)
+    assert probe(path) == {
+        "duration": 1.5,
+        "width": None,
+        "height": None,
+        "codec": "pcm",
+        "format": "wav",
+    }
+
+
+def test_wav_with_odd_sized_chunk(tmp_path):
+    # A 3-byte LIST chunk, padded to 4, before 0.25 s of 8 kHz mono 8-bit audio.
+    fmt = struct.pack("<HHIIHH", 1, 1, 8000, 8000, 1, 8)
+    body = b"WAVE" + chunk(b"fmt ", fmt) + chunk(b"LIST", b"abc")
+    body += chunk(b"data", b"\x80" * 2000)
+    path = write(tmp_path, "b.wav", b"RIFF" + struct.pack("<I", len(body)) + body)
+    assert probe(path)["duration"] == 0.25
+
+
+def test_png(tmp_path):
+    ihdr = struct.pack(">IIBBBBB", 640, 360, 8, 6, 0, 0, 0)
+    data = b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + ihdr
+    data += struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+    result = probe(write(tmp_path, "a.png", data))
+    assert (result["format"], result["width"], result["height"]) == ("png", 640, 360)
+    assert result["duration"] is None
+
+
+def test_gif(tmp_path):
+    data = b"GIF89a" + struct.pack("<HHBBB", 320, 240, 0, 0, 0) + b";"
+    result = probe(write(tmp_path, "a.gif", data))
+    assert (result["format"], result["width"], result["height"]) == ("gif", 320, 240)
+
+
+def test_jpeg(tmp_path):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\0\1\1\0\0\1\0\1\0\0"
+    # A DHT segment (C4) before the frame header must not be read as one.
+    dht = b"\xff\xc4" + struct.pack(">H", 5) + b"\0\0\0"
+    sof = b"\xff\xc2" + struct.pack(">HBHHB", 11, 8, 480, 854, 1) + b"\1\x11\0"
+    data = b"\xff\xd8" + app0 + dht + sof + b"\xff\xd9"
+    result = probe(write(tmp_path, "a.jpg", data))
+    assert (result["format"], result["width"], result["height"]) == ("jpeg", 854, 480)
+
+
+@pytest.mark.parametrize("tag", [0, 200], ids=["plain", "id3"])
+def test_mp3_cbr(tmp_path, tag):
+    # 200 is 0x00 0x00 0x01 0x48 as a syncsafe integer, 328 if read as a plain one.
+    data = (id3(tag) if tag else b"") + mp3_frame(MP3_STEREO) * 100
+    result = probe(write(tmp_path, "a.mp3", data))
+    assert (result["format"], result["codec"]) == ("mp3", "mp3")
+    assert result["duration"] == pytest.approx(100 * 417 * 8 / 128000)
+
+
+@pytest.mark.parametrize(
+    "header, offset, samples, rate",
+    [
+        (MP3_STEREO, 36, 1152, 44100),
+        (MP3_MONO, 21, 1152, 44100),
+        (MP3_MPEG2_MONO, 13, 576, 22050),
+    ],
+    ids=["stereo", "mono", "mpeg2-mono"],
+)
+@pytest.mark.parametrize("tag", [b"Xing", b"Info"])
+def test_mp3_xing(tmp_path, header, offset, samples, rate, tag):
+    # The Xing header follows the side information, whose size depends on the
+    # MPEG version and channel mode. Flag 1: the frame count is present.
+    xing = tag + struct.pack(">II", 1, 5000)
+    data = id3(300) + mp3_frame(header, 417, offset, xing) + mp3_frame(header) * 10
+    result = probe(write(tmp_path, "a.mp3", data))
+    assert result["duration"] == pytest.approx(5000 * samples / rate)
+
+
+def test_mp3_vbri(tmp_path):
+    vbri = b"VBRI" + struct.pack(">HHHII", 1, 0, 75, 10**6, 2000)
+    data = mp3_frame(MP3_STEREO, 417, 36, vbri) + mp3_frame(MP3_STEREO) * 10
+    result = probe(write(tmp_path, "a.mp3", data))
+    assert result["duration"] == pytest.approx(2000 * 1152 / 44100)
+
+
+def test_mp3_after_padding(tmp_path):
+    data = id3(20) + b"\0" * 7 + mp3_frame(MP3_STEREO) * 10
+    result = probe(write(tmp_path, "a.mp3", data))
+    assert result["duration"] == pytest.approx(10 * 417 * 8 / 128000)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        mp4(True),
+        mp4(False),
+        # moov past the first bytes read, behind a large 64-bit mdat.
+        mp4(False, mdat_size=200_000),
+        mp4(False, version=1),
+    ],
+    ids=["moov-first", "moov-last", "moov-after-large-mdat", "mvhd-v1"],
+)
+def test_mp4(tmp_path, data):
+    assert probe(write(tmp_path, "a.mp4", data)) == {
+        "duration": 12.5,
+        "width": 1920,
+        "height": 1080,
+        "codec": "avc1",
+        "format": "mp4",
+    }
+
+
+def test_unknown_format(tmp_path):
+    assert probe(write(tmp_path, "a.bin", b"\0" * 64))["format"] is None
+
+
+class RecordingExecutor:
+    """Runs map() in the test process and records what was mapped."""
+
+    def __init__(self):
+        self.calls = []
+
+    def map(self, function, srcs, *iterables):
+        self.calls.append((function.__name__, list(srcs)))
+        return list(map(function, srcs, *iterables))
+
+    def shutdown(self):
+        pass
+
+
+def make_prober(tmp_path) -> MediaProber:
+    prober = MediaProber(str(tmp_path / "probe.sqlite3"))
+    prober.ffprobe = None
+    prober._pool = RecordingExecutor()
+    return prober
+
+
+def test_probe_many_reuses_the_cache(tmp_path):
+    gif = write(tmp_path, "a.gif", b"GIF89a" + struct.pack("<HH", 2, 3))
+    unknown = write(tmp_path, "a.bin", b"\0" * 64)
+    both = [str(gif), str(unknown)]
+
+    with make_prober(tmp_path) as prober:
+        first = prober.probe_many(both + [str(gif)])
+        assert list(first) == both
+        assert prober._pool.calls == [("_fingerprint", both), ("_probe", both)]
+        # The second call is answered from memory.
+        assert prober.probe_many(both) == first
+        assert len(prober._pool.calls) == 2
+
+    with make_prober(tmp_path) as prober:
+        assert prober.probe_many(both) == first
+        # Only the failed probe is done again; the GIF comes from the SQLite cache.
+        assert prober._pool.calls == [
+            ("_fingerprint", both),
+            ("_probe", [str(unknown)]),
+        ]
+        assert prober.probe(str(gif))["width"] == 2
+
+    # Another version of the file has another fingerprint.
+    gif.write_bytes(b"GIF89a" + struct.pack("<HH", 4, 5))
+    with make_prober(tmp_path) as prober:
+        assert prober.probe(str(gif))["width"] == 4
+
+
+def test_probe_many_on_a_process_pool(tmp_path):
+    wav = tmp_path / "a.wav"
+    with wave.open(str(wav), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(1)
+        f.setframerate(8000)
+        f.writeframes(b"\x80" * 4000)
+    with MediaProber(str(tmp_path / "probe.sqlite3"), max_workers=2) as prober:
+        prober.ffprobe = None
+        assert prober.duration(str(wav)) == 0.5
+
+
+def test_movie_sources():
+    movie = Movie(
+        scenes=[Scene(elements=[Image(src="a.png"), Text(text="x")])],
+        elements=[Audio(src="b.mp3")],
+    )
+    assert movie_sources(movie) == ["b.mp3", "a.png"]
+    assert movie_sources(movie.to_dict()) == ["b.mp3", "a.png"]
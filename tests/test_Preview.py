@@ -0,0 +1,74 @@
+import pytest
+
+from src.Json2VideoSDK.Preview import PreviewRenderer
+from src.Json2VideoSDK.src.Audio import Audio
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Text import Text
+from src.Json2VideoSDK.src.Timeline import TimelineError
+from src.Json2VideoSDK.src.Video import Video
+
+
+def make_movie() -> Movie:
+    return Movie(
+        width=1280,
+        height=720,
+        scenes=[
+            Scene(duration=5, elements=[Video(src="a.mp4"), Text(text="Hello")]),
+            Scene(
+                duration=4,
+                transition={"style": "wipeleft", "duration": 1},
+                elements=[Image(src="b.png", x=100, y=50, width=640, height=360)],
+            ),
+        ],
+        elements=[Audio(src="music.mp3", duration=-2), Audio(src="sfx.mp3", start=2)],
+    )
+
+
+def build(movie, tmp_path):
+    renderer = PreviewRenderer(ffmpeg="ffmpeg", probe={"a.mp4": 10, "sfx.mp3": 1.5})
+    return renderer.build_command(movie, "out.mp4", str(tmp_path))
+
+
+def filters(command):
+    return command[command.index("-filter_complex") + 1].split(";")
+
+
+def test_overlay_xfade_and_amix(tmp_path):
+    command = build(make_movie(), tmp_path)
+    graph = filters(command)
+
+    assert command[0] == "ffmpeg" and command[-1] == "out.mp4"
+    sources = [command[i + 1] for i, arg in enumerate(command) if arg == "-i"]
+    assert sources == ["a.mp4", "b.png", "sfx.mp3", "music.mp3"]
+    # The preview is 320 pixels wide: a quarter of the movie.
+    assert graph[0] == "color=c=0x000000:s=320x180:r=10:d=5.000[l1]"
+    assert "[1:v]fps=10,scale=160:90," in graph[6]
+    assert graph[7] == (
+        "[l6][l7]overlay=x=25.0:y=12.5:eof_action=pass:"
+        "enable='between(t,0.000,4.000)'[l8]"
+    )
+    # The second scene starts one second before the first one ends.
+    assert (
+        graph[9] == "[l5][l9]xfade=transition=wipeleft:duration=1.000:offset=4.000[l10]"
+    )
+    assert graph[-1] == "[l11][l12]amix=inputs=2:normalize=0[l13]"
+    assert "adelay=2000:all=1" in graph[-3]
+    assert command[command.index("-map") + 1] == "[l10]"
+    # The movie lasts as long as its scenes, with no trailing filler canvas.
+    assert command[command.index("-r") - 1] == "8.000"
+    assert sum(chain.startswith("color=") for chain in graph) == 2
+    assert (tmp_path / "text3.txt").read_text(encoding="utf-8") == "Hello"
+
+
+def test_serialized_movie_builds_the_same_command(tmp_path):
+    movie = make_movie()
+    assert build(movie.to_dict(), tmp_path) == build(movie, tmp_path)
+
+
+def test_empty_timeline_is_an_error(tmp_path):
+    with pytest.raises(TimelineError):
+        build(Movie(scenes=[Scene(duration=0)]), tmp_path)
+    with pytest.raises(TimelineError):
+        build(Movie(elements=[Audio(src="music.mp3")]), tmp_path)
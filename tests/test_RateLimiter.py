@@ -0,0 +1,89 @@
+import threading
+import time
+
+from src.Json2VideoSDK.RateLimiter import RateLimiter, get_limiter
+
+
+def test_burst_then_rate():
+    limiter = RateLimiter(rate=20, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05
+    limiter.acquire()
+    # The fourth token is refilled at 20 per second.
+    assert time.monotonic() - start >= 0.04
+
+
+def test_callers_queue_in_order():
+    limiter = RateLimiter(rate=50, capacity=1)
+    order = []
+
+    def worker(n):
+        limiter.acquire()
+        order.append(n)
+
+    limiter.acquire()
+    threads = []
+    for n in range(5):
+        thread = threading.Thread(target=worker, args=(n,))
+        thread.start()
+        threads.append(thread)
+        # Wait until the worker is queued, so arrival order is deterministic.
+        while limiter.queue_depth < n + 1:
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2, 3, 4]
+    assert limiter.queue_depth == 0
+
+
+def test_headers_adapt_the_bucket():
+    limiter = RateLimiter(rate=1, capacity=5)
+    limiter.update_from_headers(
+        {
+            "X-RateLimit-Limit": "10",
+            "X-RateLimit-Remaining": "4",
+            "X-RateLimit-Reset": "2",
+        }
+    )
+    assert limiter.capacity == 10
+    assert limiter.rate == 2
+    assert limiter.budget <= 4.1
+    assert (limiter.limit, limiter.remaining) == (10, 4)
+
+
+def test_headers_without_adapting_only_block_when_exhausted():
+    limiter = RateLimiter(rate=200 / 3600, capacity=200)
+    reset = time.time() + 20 * 86400
+    limiter.update_from_headers(
+        {
+            "X-RateLimit-Limit": "20000",
+            "X-RateLimit-Remaining": "19990",
+            "X-RateLimit-Reset": str(int(reset)),
+        },
+        adapt=False,
+    )
+    assert (limiter.rate, limiter.capacity) == (200 / 3600, 200)
+    assert limiter.budget > 199
+    assert abs(limiter.reset_at - reset) < 2
+
+    limiter.update_from_headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.2"}, adapt=False
+    )
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_retry_after_pauses():
+    limiter = RateLimiter(rate=100, capacity=5)
+    limiter.update_from_headers({"Retry-After": "0.2"})
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_limiter_is_shared_per_key():
+    assert get_limiter("shared-key") is get_limiter("shared-key", rate=5)
+    assert get_limiter("shared-key") is not get_limiter("other-key")
@@ -0,0 +1,101 @@
+import pytest
+
+from src.Json2VideoSDK.RenderIndex import RenderIndex
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Text import Text
+
+
+@pytest.fixture
+def index(tmp_path):
+    with RenderIndex(str(tmp_path / "renders.sqlite3")) as index:
+        yield index
+
+
+def make_movie(width: int = 640, height: int = 360, last: str = "End") -> Movie:
+    return Movie(
+        resolution="custom",
+        width=width,
+        height=height,
+        scenes=[
+            Scene(elements=[Image(src="a.png"), Text(text="Title")]),
+            # The same scene twice.
+            Scene(elements=[Text(text="Same")]),
+            Scene(elements=[Text(text="Same")]),
+            Scene(elements=[Image(src="a.png"), Text(text=last)]),
+        ],
+    )
+
+
+def scene_ids(movie: Movie):
+    return [scene.id for scene in movie.scenes]
+
+
+def element_ids(movie: Movie):
+    return [[element.id for element in scene.elements] for scene in movie.scenes]
+
+
+def test_ids_are_stable_and_unique(index):
+    first, second = make_movie(), make_movie()
+    assert index.prepare(first) == []
+    assert index.prepare(second) == []
+    assert scene_ids(first) == scene_ids(second)
+    assert element_ids(first) == element_ids(second)
+
+    ids = scene_ids(first)
+    assert ids[0].startswith("scene-") and len(set(ids)) == 4
+    assert ids[2] == f"{ids[1]}-2"
+    # Identical elements in different scenes are told apart the same way.
+    assert element_ids(first)[3][0] == f"{element_ids(first)[0][0]}-2"
+    assert element_ids(first)[2][0] == f"{element_ids(first)[1][0]}-2"
+
+    # Preparing again keeps the ids, which now count as explicit.
+    index.prepare(first)
+    assert scene_ids(first) == scene_ids(second)
+
+
+def test_recorded_scenes_are_reused_with_their_ids(index):
+    first = make_movie()
+    index.prepare(first)
+    index.record(first, project_id="project-1", url="https://cdn/1.mp4")
+
+    second = make_movie(last="Changed")
+    assert index.prepare(second) == [0, 1, 2]
+    assert scene_ids(second)[:3] == scene_ids(first)[:3]
+    assert scene_ids(second)[3] != scene_ids(first)[3]
+    known = index.lookup(RenderIndex.key(second, second.scenes[0]))
+    assert known["id"] == scene_ids(first)[0]
+    assert (known["project"], known["url"]) == ("project-1", "https://cdn/1.mp4")
+
+
+def test_explicit_ids_are_never_reused(index):
+    first = make_movie()
+    index.prepare(first)
+    index.record(first)
+
+    second = make_movie()
+    # Another scene and element explicitly take the ids the first ones had.
+    second.scenes[3].set_id(scene_ids(first)[0])
+    second.scenes[3].elements[1].set_id(element_ids(first)[0][1])
+    index.prepare(second)
+    ids = scene_ids(second)
+    assert ids[3] == scene_ids(first)[0]
+    assert ids[0] == f"{scene_ids(first)[0]}-2"
+    assert len(set(ids)) == 4
+    assert second.scenes[0].elements[1].id == f"{element_ids(first)[0][1]}-2"
+
+
+def test_renders_are_keyed_by_movie_settings(index):
+    small = make_movie(640, 360)
+    index.prepare(small)
+    index.record(small)
+    assert index.prepare(make_movie(1920, 1080)) == []
+
+    movie = make_movie(640, 360)
+    movie.set_variables({"name": "value"})
+    assert index.prepare(movie) == []
+    assert index.prepare(make_movie(640, 360)) == [0, 1, 2, 3]
+    assert RenderIndex.key(small, small.scenes[1]) == RenderIndex.key(
+        small, small.scenes[2]
+    )
@@ -0,0 +1,110 @@
+import pytest
+
+from src.StructuredOutput import (
+    StructuredOutputError,
+    check_schema,
+    common_path,
+    extract_json,
+    get_path,
+    schema_from_example,
+    set_path,
+    subschema,
+)
+
+SCHEMA = schema_from_example(
+    {"title": "t", "scenes": [{"text": "x", "duration": 1, "tags": ["a"]}]}
+)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"format": "json", "items": [1, 2]}',
+        'Here is the json you asked for:\n```json\n{"format": "json", "items": [1, 2]}\n```',
+        'Sure!\n```JSON\n{"format": "json", "items": [1, 2]}\n```\nAnything else?',
+        '```\n{"format": "json", "items": [1, 2]}\n```',
+        # The first block is not JSON, the second one is.
+        'Run:\n```python\nprint("json")\n```\nResult:\n```json\n'
+        '{"format": "json", "items": [1, 2]}\n```',
+        'The answer is {"format": "json", "items": [1, 2]} as requested.',
+        # Braces in the prose before the JSON.
+        'Fill the {placeholders} of this json: {"format": "json", "items": [1, 2]}',
+        'Unclosed [list, then {"format": "json", "items": [1, 2]} trailing } text',
+    ],
+)
+def test_extract_json(text):
+    assert extract_json(text) == {"format": "json", "items": [1, 2]}
+
+
+def test_extract_json_array_before_object():
+    assert extract_json('Two items: [{"a": 1}, {"a": 2}] and {"b": 3}') == [
+        {"a": 1},
+        {"a": 2},
+    ]
+
+
+@pytest.mark.parametrize("text", ["", "no json here", "```json\n{broken\n```"])
+def test_extract_json_without_json(text):
+    with pytest.raises(StructuredOutputError) as error:
+        extract_json(text)
+    assert error.value.text == text.strip()
+
+
+def test_schema_from_example():
+    assert SCHEMA["required"] == ["title", "scenes"]
+    item = SCHEMA["properties"]["scenes"]["items"]
+    assert item["properties"]["duration"] == {"type": "integer"}
+    assert item["properties"]["tags"] == {"type": "array", "items": {"type": "string"}}
+    assert schema_from_example({"ok": True, "x": 0.5, "n": None})["properties"] == {
+        "ok": {"type": "boolean"},
+        "x": {"type": "number"},
+        "n": {"type": "string", "nullable": True},
+    }
+
+
+def test_check_schema():
+    valid = {"title": "a", "scenes": [{"text": "b", "duration": 2, "tags": []}]}
+    assert check_schema(valid, SCHEMA) == []
+    invalid = {
+        "scenes": [
+            {"text": "b", "duration": 2, "tags": []},
+            {"text": 1, "duration": True, "tags": ["c", None]},
+        ]
+    }
+    assert check_schema(invalid, SCHEMA) == [
+        ((), "is missing the key 'title'"),
+        (("scenes", 1, "text"), "must be of type string"),
+        (("scenes", 1, "duration"), "must be of type integer"),
+        (("scenes", 1, "tags", 1), "must not be null"),
+    ]
+
+
+def test_check_schema_numbers_enum_and_nullable():
+    assert check_schema(1, {"type": "number"}) == []
+    assert check_schema(1.5, {"type": "integer"}) == [((), "must be of type integer")]
+    assert check_schema("c", {"type": "string", "enum": ["a", "b"]}) == [
+        ((), "must be one of ['a', 'b']")
+    ]
+    assert check_schema(None, {"type": "string", "nullable": True}) == []
+    # Schemas written for Gemini may use upper-case type names.
+    assert check_schema("a", {"type": "STRING"}) == []
+
+
+def test_common_path_and_subschema():
+    assert common_path([]) == ()
+    assert common_path([("scenes", 1, "text"), ("scenes", 1, "tags", 0)]) == (
+        "scenes",
+        1,
+    )
+    assert common_path([("scenes", 1), ("title",)]) == ()
+    assert subschema(SCHEMA, ("scenes", 1)) is SCHEMA["properties"]["scenes"]["items"]
+    assert subschema(SCHEMA, ("scenes", 0, "tags", 3)) == {"type": "string"}
+    assert subschema(SCHEMA, ("unknown",)) == {}
+
+
+def test_get_and_set_path():
+    data = {"scenes": [{"text": "a"}, {"text": "b"}]}
+    assert get_path(data, ("scenes", 1, "text")) == "b"
+    assert set_path(data, ("scenes", 1), {"text": "c"}) is data
+    assert data == {"scenes": [{"text": "a"}, {"text": "c"}]}
+    assert set_path(data, (), [1]) == [1]
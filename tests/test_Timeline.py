@@ -0,0 +1,123 @@
+import pytest
+
+from src.Json2VideoSDK.src.Audio import Audio
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Text import Text
+from src.Json2VideoSDK.src.Timeline import TimelineError, resolve_timeline
+from src.Json2VideoSDK.src.Video import Video
+from src.Json2VideoSDK.src.Voice import Voice
+
+LENGTHS = {
+    "a.mp4": 10,
+    "b.mp3": 3,
+    "c.mp4": 20,
+    "music.mp3": 60,
+    "long.mp3": 30,
+}
+
+
+def make_movie() -> Movie:
+    return Movie(
+        scenes=[
+            # Lasts until its last element ends.
+            Scene(
+                duration=-1,
+                elements=[
+                    Video(src="a.mp4", seek=2),
+                    Text(text="Fills", start=1, duration=-2),
+                    Audio(src="b.mp3", loop=2),
+                    Voice(text="one two three four five", start=0.5, extra_time=0.5),
+                ],
+            ),
+            Scene(
+                duration=4,
+                transition={"style": "fade", "duration": 1},
+                elements=[
+                    # Seeks to 3 seconds before the end.
+                    Video(src="c.mp4", seek=-3),
+                    Image(src="d.png", duration=10),
+                    Image(src="e.png", start=5, duration=1),
+                    Video(src="a.mp4", loop=-1),
+                ],
+            ),
+            Scene(duration=5, condition="false"),
+        ],
+        elements=[
+            Audio(src="music.mp3", duration=-2),
+            Audio(src="long.mp3"),
+            Text(text="Too late", start=12, duration=1),
+        ],
+    )
+
+
+def spans(timed):
+    return [(round(t.start, 3), round(t.end, 3)) for t in timed]
+
+
+@pytest.mark.parametrize("serialized", [False, True], ids=["objects", "dicts"])
+def test_resolve_timeline(serialized):
+    movie = make_movie()
+    timeline = resolve_timeline(movie.to_dict() if serialized else movie, LENGTHS)
+
+    assert timeline.unresolved == []
+    assert timeline.duration == 11
+    first, second = timeline.scenes
+    # a.mp4 after a 2 second seek, b.mp3 played twice, the voice with its extra time,
+    # then the elements filling the scene.
+    assert (first.start, first.end) == (0, 8)
+    assert spans(first.elements) == [(0, 8), (0, 6), (0.5, 3), (1, 8)]
+    # The transition overlaps the last second of the previous scene.
+    assert (second.start, second.end, second.duration) == (7, 11, 4)
+    # e.png starts after the end of the scene; the looping video fills it.
+    assert spans(second.elements) == [(7, 10), (7, 11), (7, 11)]
+    # Movie elements are cut to the scenes and dropped when they start after them.
+    assert spans(timeline.elements) == [(0, 11), (0, 11)]
+
+
+def test_probe_may_be_a_callable():
+    calls = []
+
+    def probe(src):
+        calls.append(src)
+        return LENGTHS.get(src)
+
+    assert resolve_timeline(make_movie(), probe).duration == 11
+    # Every asset is probed once, even when used twice, and only when its length
+    # is needed.
+    assert sorted(calls) == ["a.mp4", "b.mp3", "c.mp4", "long.mp3"]
+
+
+def test_unknown_lengths_count_as_zero():
+    movie = Movie(
+        scenes=[Scene(elements=[Video(src="unknown.mp4"), Image(src="a.png")])]
+    )
+    timeline = resolve_timeline(movie)
+    assert timeline.unresolved == ["unknown.mp4"]
+    assert timeline.duration == 0
+    with pytest.raises(TimelineError, match="unknown.mp4"):
+        timeline.check_duration(0)
+
+
+def test_default_transition_duration():
+    movie = Movie(
+        scenes=[
+            Scene(duration=3),
+            Scene(duration=3, transition={"style": "fade"}),
+            Scene(duration=3),
+        ]
+    )
+    timeline = resolve_timeline(movie)
+    assert [(s.start, s.end) for s in timeline.scenes] == [(0, 3), (2, 5), (5, 8)]
+    assert timeline.duration == 8
+
+
+def test_check_duration():
+    timeline = resolve_timeline(make_movie(), LENGTHS)
+    timeline.check_duration(11)
+    timeline.check_duration(11.5, tolerance=1)
+    with pytest.raises(TimelineError, match="11.00s instead of 13.00s"):
+        timeline.check_duration(13)
+    with pytest.raises(TimelineError):
+        timeline.check_duration(11.5, tolerance=0.1)
@@ -0,0 +1,82 @@
+import time
+
+from src.Json2VideoSDK.src.JsonStream import iter_movie_json
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Text import Text
+
+
+def make_movie() -> Movie:
+    return Movie(scenes=[Scene(elements=[Text(text=f"{n}")]) for n in range(3)])
+
+
+def test_to_dict_reuses_unchanged_subtrees():
+    movie = make_movie()
+    movie.to_dict(True)
+    cached = [scene._cache[True] for scene in movie.scenes]
+    movie.scenes[1].elements[0].set_text("changed")
+    data = movie.to_dict(True)
+    assert data["scenes"][1]["elements"][0]["text"] == "changed"
+    assert movie.scenes[0]._cache[True] is cached[0]
+    assert movie.scenes[1]._cache[True] is not cached[1]
+
+
+def test_to_dict_returns_a_copy():
+    movie = make_movie()
+    data = movie.to_dict()
+    data["scenes"][0]["elements"][0]["text"] = "X"
+    data["scenes"].clear()
+    assert movie.to_dict()["scenes"][0]["elements"][0]["text"] == "0"
+
+
+def test_cached_to_dict_is_not_slower_than_a_fresh_build():
+    def timed(movie: Movie) -> float:
+        start = time.perf_counter()
+        movie.to_dict()
+        return time.perf_counter() - start
+
+    def big_movie() -> Movie:
+        return Movie(
+            scenes=[
+                Scene(elements=[Text(text=f"{n}"), Text(text="b")]) for n in range(2000)
+            ]
+        )
+
+    fresh, cached = [], []
+    for _ in range(5):
+        movie = big_movie()
+        fresh.append(timed(movie))
+        cached.append(timed(movie))
+    assert min(cached) <= min(fresh)
+
+
+def test_assigned_children_are_tracked():
+    movie = make_movie()
+    scene = Scene()
+    movie.scenes = [scene]
+    movie.to_dict(True)
+    scene.set_duration(5)
+    assert movie.to_dict(True)["scenes"][0]["duration"] == 5
+
+    text = Text(text="a")
+    scene.elements = [text]
+    movie.to_dict(True)
+    text.set_text("b")
+    assert movie.to_dict(True)["scenes"][0]["elements"][0]["text"] == "b"
+
+
+def test_streaming_keeps_nothing_by_default():
+    movie = make_movie()
+    "".join(iter_movie_json(movie, compact=True))
+    assert not movie._cache
+    assert all(not scene._cache for scene in movie.scenes)
+    assert all(not e._cache for scene in movie.scenes for e in scene.elements)
+
+
+def test_content_hash_ignores_ids():
+    first, second = make_movie().scenes[0], make_movie().scenes[0]
+    second.set_id("scene-1")
+    second.elements[0].set_comment("note")
+    assert first.content_hash() == second.content_hash()
+    second.elements[0].set_text("other")
+    assert first.content_hash() != second.content_hash()
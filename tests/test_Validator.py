@@ -0,0 +1,163 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from src.Json2VideoSDK.src import Validator as validator_module
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Schema import SCHEMA_PATH
+from src.Json2VideoSDK.src.Text import Text
+from src.Json2VideoSDK.src.Validator import (
+    Validator,
+    get_validator,
+    load_compiled,
+    validate_movie,
+)
+
+
+def scene_of(element: dict) -> dict:
+    return {"scenes": [{"elements": [element]}]}
+
+
+@pytest.mark.parametrize(
+    "data, errors",
+    [
+        ({"scenes": []}, []),
+        ({}, ["movie.scenes: required property is missing"]),
+        ({"scenes": {}}, ["movie.scenes: expected array, got dict"]),
+        ({"scenes": [], "width": "wide"}, ["movie.width: expected integer, got str"]),
+        ({"scenes": [], "draft": 1}, ["movie.draft: expected boolean, got int"]),
+        # Booleans are not numbers, but integral floats are integers.
+        ({"scenes": [], "width": True}, ["movie.width: expected integer, got bool"]),
+        ({"scenes": [], "width": 640.0}, []),
+        ({"scenes": [], "width": 640.5}, ["movie.width: expected integer, got float"]),
+        (
+            {"scenes": [], "quality": "best"},
+            ["movie.quality: 'best' is not one of ['low', 'medium', 'high']"],
+        ),
+        ({"scenes": [], "width": 40}, ["movie.width: 40 is less than minimum 50"]),
+        (
+            {"scenes": [], "height": 4000},
+            ["movie.height: 4000 is greater than maximum 3840"],
+        ),
+        (
+            {"scenes": [{"transition": {"style": "spin", "duration": "1s"}}]},
+            [
+                "movie.scenes[0].transition.duration: expected number, got str",
+                "movie.scenes[0].transition.style: 'spin' is not one of "
+                "['fade', 'wipeleft', 'wiperight', 'wipeup', 'wipedown', 'slideleft', "
+                "'slideright', 'slideup', 'slidedown', 'circlecrop', 'rectcrop', "
+                "'distance', 'fadeblack', 'fadewhite', 'radial', 'smoothleft', "
+                "'smoothright', 'smoothup', 'smoothdown', 'circleopen', 'circleclose', "
+                "'vertopen', 'vertclose', 'horzopen', 'horzclose', 'dissolve', "
+                "'pixelize', 'diagtl', 'diagtr', 'diagbl', 'diagbr', 'hlslice', "
+                "'hrslice', 'vuslice', 'vdslice', 'hblur', 'fadegrays', 'wipetl', "
+                "'wipetr', 'wipebl', 'wipebr', 'squeezeh', 'squeezev']",
+            ],
+        ),
+        (
+            scene_of({"type": "video", "src": "a.mp4", "crop": {"width": 10}}),
+            ["movie.scenes[0].elements[0].crop.height: required property is missing"],
+        ),
+        (
+            scene_of({"type": "text"}),
+            ["movie.scenes[0].elements[0].text: required property is missing"],
+        ),
+        (
+            scene_of({"type": "text", "text": "a", "z-index": 100}),
+            ["movie.scenes[0].elements[0].z-index: 100 is greater than maximum 99"],
+        ),
+        (
+            scene_of({"type": "sticker"}),
+            ["movie.scenes[0].elements[0]: unknown element type"],
+        ),
+        (scene_of("text"), ["movie.scenes[0].elements[0]: unknown element type"]),
+        # Templates are only allowed as movie elements.
+        (
+            scene_of({"type": "template", "src": "id"}),
+            ["movie.scenes[0].elements[0]: unknown element type"],
+        ),
+        ({"scenes": [], "elements": [{"type": "template", "src": "id"}]}, []),
+        # Types without a schema are accepted as they are.
+        (scene_of({"type": "voice", "text": 5}), []),
+        # Variables are only known at render time.
+        ({"scenes": [], "width": "{{width}}", "quality": "{{ quality }}"}, []),
+        (scene_of({"type": "text", "text": "a", "z-index": "{{z}}"}), []),
+    ],
+)
+def test_checks(data, errors):
+    assert get_validator().validate(data) == errors
+
+
+def test_validate_other_schemas():
+    validator = get_validator()
+    assert validator.validate({"elements": []}, "scene") == []
+    assert validator.validate({"type": "image", "zoom": -101}, "image") == [
+        "image.zoom: -101 is less than minimum -100"
+    ]
+    assert validator.validate([], "scene") == ["scene: expected object, got list"]
+
+
+def test_validate_movie_objects():
+    movie = Movie(
+        scenes=[Scene(elements=[Text(text="a"), Image(src="b.png", zoom=200)])],
+        elements=[Image(src="c.png", width=1.5)],
+        quality="best",
+    )
+    errors = [
+        "movie.quality: 'best' is not one of ['low', 'medium', 'high']",
+        "movie.scenes[0].elements[1].zoom: 200 is greater than maximum 100",
+        "movie.elements[0].width: expected integer, got float",
+    ]
+    assert validate_movie(movie) == errors
+    # The same errors, whether the fragments come from the cache or not.
+    movie.to_dict(True)
+    assert sorted(validate_movie(movie)) == sorted(errors)
+    assert sorted(validate_movie(movie.to_dict())) == sorted(errors)
+    movie.scenes[0].elements[1].set_zoom(10)
+    assert len(validate_movie(movie)) == 2
+
+
+def test_compiled_schema_is_cached_by_hash(tmp_path, monkeypatch):
+    schema_path = str(tmp_path / "schema.yaml")
+    shutil.copy(SCHEMA_PATH, schema_path)
+    cache_dir = str(tmp_path / "cache")
+    Validator(schema_path, cache_dir)
+    (cached,) = os.listdir(cache_dir)
+
+    # A second Validator reads the cache instead of parsing the YAML.
+    def fail(path):
+        raise AssertionError("schema compiled again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(validator_module, "compile_schema", fail)
+        Validator(schema_path, cache_dir)
+
+    # The cache file is the one of this schema's content.
+    with open(os.path.join(cache_dir, cached)) as f:
+        compiled = json.load(f)
+    compiled["movie"]["properties"]["width"]["maximum"] = 100
+    with open(os.path.join(cache_dir, cached), "w") as f:
+        json.dump(compiled, f)
+    assert Validator(schema_path, cache_dir).validate({"scenes": [], "width": 200}) == [
+        "movie.width: 200 is greater than maximum 100"
+    ]
+
+    # Changing the schema changes the key, so the stale file is not used.
+    with open(schema_path, "a") as f:
+        f.write("\n# changed\n")
+    assert (
+        load_compiled(schema_path, cache_dir)["movie"]["properties"]["width"]["maximum"]
+        == 3840
+    )
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_unwritable_cache_is_ignored(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    validator = Validator(SCHEMA_PATH, str(blocker / "cache"))
+    assert validator.validate({"scenes": []}) == []
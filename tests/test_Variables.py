@@ -0,0 +1,83 @@
+import copy
+
+import pytest
+
+from src.Json2VideoSDK.src.Image import Image
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Template import Template
+from src.Json2VideoSDK.src.Text import Text
+from src.Json2VideoSDK.src.Validator import validate_movie
+from src.Json2VideoSDK.src.Variables import (
+    VariableError,
+    VariableExpander,
+    expand_variables,
+)
+
+
+def make_movie() -> Movie:
+    return Movie(
+        scenes=[
+            Scene(elements=[Text(text="Hello {{name}}!")]),
+            Scene(
+                elements=[Text(text="{{greeting}}, {{ name }}")],
+                variables={"greeting": "Welcome {{name}}"},
+            ),
+            Scene(elements=[Image(src="https://example.com/static.png")]),
+        ],
+        elements=[Template("template-id", variables={"who": "{{name}}", "n": 1})],
+        variables={"greeting": "Hi"},
+    )
+
+
+def test_expands_each_row():
+    payloads = list(expand_variables(make_movie(), [{"name": "Ann"}, {"name": "Bob"}]))
+    assert [p["scenes"][0]["elements"][0]["text"] for p in payloads] == [
+        "Hello Ann!",
+        "Hello Bob!",
+    ]
+    # Scene variables override the movie's and are expanded in the movie's scope.
+    assert payloads[0]["scenes"][1]["elements"][0]["text"] == "Welcome Ann, Ann"
+    assert payloads[1]["elements"][0]["variables"] == {"who": "Bob", "n": 1}
+    assert payloads[0]["variables"] == {"greeting": "Hi", "name": "Ann"}
+
+
+def test_unchanged_structure_is_shared():
+    expander = VariableExpander(make_movie())
+    skeleton = copy.deepcopy(expander.skeleton)
+    first, second = expander.expand({"name": "Ann"}), expander.expand({"name": "Bob"})
+    assert first["scenes"][2] is second["scenes"][2] is expander.skeleton["scenes"][2]
+    assert first["scenes"][0] is not second["scenes"][0]
+    # Expanding never modifies the skeleton.
+    assert expander.skeleton == skeleton
+
+
+def test_single_placeholder_keeps_the_type():
+    movie = Movie(
+        scenes=[Scene(elements=[Text(text="{{n}}", settings={"a": "{{n}}"})])]
+    )
+    payload = VariableExpander(movie).expand({"n": 5})
+    assert payload["scenes"][0]["elements"][0]["text"] == 5
+    assert payload["scenes"][0]["elements"][0]["settings"] == {"a": 5}
+
+
+def test_names_and_missing_variables():
+    expander = VariableExpander(make_movie())
+    assert expander.names == ["name", "greeting"]
+    lenient = expander.expand({})
+    assert lenient["scenes"][0]["elements"][0]["text"] == "Hello {{name}}!"
+    with pytest.raises(VariableError) as error:
+        expander.expand({}, strict=True)
+    assert error.value.missing == ["name"]
+
+
+def test_rows_are_consumed_lazily():
+    def rows():
+        yield {"name": "Ann"}
+        raise AssertionError("read too far")
+
+    assert next(expand_variables(make_movie(), rows()))["variables"]["name"] == "Ann"
+
+
+def test_template_movie_is_valid():
+    assert validate_movie(make_movie()) == []
@@ -0,0 +1,51 @@
+from src.Json2VideoSDK.Client import Client
+from src.Json2VideoSDK.JobTracker import JobTracker
+from src.Json2VideoSDK.WebhookReceiver import WebhookReceiver
+from src.Json2VideoSDK.src.Movie import Movie
+from src.Json2VideoSDK.src.Scene import Scene
+from src.Json2VideoSDK.src.Text import Text
+
+
+def make_movie() -> Movie:
+    return Movie(scenes=[Scene(elements=[Text(text="Hello")])])
+
+
+def test_webhook_resolves_tracked_job(fake_api):
+    client = Client("webhook-key", base_url=fake_api.base_url)
+    with JobTracker(client, min_interval=60) as tracker:
+        with WebhookReceiver(tracker) as receiver:
+            future = receiver.submit(make_movie())
+            record = future.result(timeout=5)
+
+    assert record["status"] == "done"
+    assert record["project"] == "project-1"
+    assert record["url"] == "https://cdn.example.com/project-1.mp4"
+    # The job was resolved by the callback, without polling the API.
+    assert fake_api.polls == {}
+    destinations = fake_api.created[0]["exports"][0]["destinations"]
+    assert destinations == [{"type": "webhook", "endpoint": receiver.url}]
+
+
+def test_resubmitted_movie_keeps_one_webhook(fake_api):
+    client = Client("webhook-resubmit-key", base_url=fake_api.base_url)
+    movie = make_movie()
+    with JobTracker(client, min_interval=60) as tracker:
+        with WebhookReceiver(tracker) as receiver:
+            first = receiver.submit(movie)
+            second = receiver.submit(movie)
+            assert first.result(timeout=5)["project"] == "project-1"
+            assert second.result(timeout=5)["project"] == "project-2"
+
+    assert movie.exports == [
+        {"destinations": [{"type": "webhook", "endpoint": receiver.url}]}
+    ]
+    assert fake_api.created[0]["exports"] == fake_api.created[1]["exports"]
+
+
+def test_webhook_before_track_is_kept(fake_api):
+    client = Client("webhook-early-key", base_url=fake_api.base_url)
+    with JobTracker(client) as tracker:
+        with WebhookReceiver(tracker) as receiver:
+            receiver.handle({"project": "early", "success": False, "message": "x"})
+            future = tracker.track("early", poll=False)
+            assert future.exception(timeout=5).movie["status"] == "error"